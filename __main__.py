@@ -2,6 +2,11 @@
 
 
 if __name__ == '__main__':
+    from multiprocessing import freeze_support
+
+    # the worker processes of the frozen executable must run the task instead of the command
+    freeze_support()
+
     from sys import hexversion
 
     if hexversion < 0x30900f0:
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+from utilities.scripts.check_russian import find_russian
+
+TEXT: str = (
+    "= Title\n"
+    "Text with слово and ещё одно.\n"
+    "// комментарий\n"
+    "[source,bash]\n"
+    "----\n"
+    "echo \"код\"\n"
+    "----\n"
+    "<!-- примечание -->\n"
+    "Конец\n")
+
+
+def test_find_russian_all_occurrences() -> None:
+    assert [*find_russian(TEXT)] == [
+        (2, 11, "слово"), (2, 21, "ещё"), (2, 25, "одно"),
+        (3, 4, "комментарий"), (6, 7, "код"), (8, 6, "примечание"), (9, 1, "Конец")]
+
+
+def test_find_russian_skip_code() -> None:
+    assert [*find_russian(TEXT, skip_code=True, suffix=".adoc")] == [
+        (2, 11, "слово"), (2, 21, "ещё"), (2, 25, "одно"), (8, 6, "примечание"), (9, 1, "Конец")]
+
+
+def test_find_russian_skip_code_md() -> None:
+    text: str = (
+        "Заголовок\n"
+        "---------\n"
+        "Текст\n"
+        "\n"
+        "----\n"
+        "```bash\n"
+        "echo \"код\"\n"
+        "```\n"
+        "<!-- примечание -->\n"
+        "// не комментарий\n")
+
+    assert [*find_russian(text, skip_code=True, suffix=".md")] == [
+        (1, 1, "Заголовок"), (3, 1, "Текст"), (10, 4, "не"), (10, 7, "комментарий")]
+
+
+def test_find_russian_not_found() -> None:
+    assert [*find_russian("English only\n")] == []
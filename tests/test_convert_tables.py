@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+from pathlib import Path
+from zipfile import ZipFile
+
+from pytest import fixture, mark
+
+from utilities.convert_tables.batch import convert_documents, list_documents, output_dirs
+from utilities.convert_tables.line_formatter import LineFormatter
+from utilities.convert_tables.xml_file import CoreDocument, XmlDocument
+
+W: str = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+A: str = "http://schemas.openxmlformats.org/drawingml/2006/main"
+R: str = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+
+def cell(text: str, inner: str = "") -> str:
+    return f"<w:tc><w:p><w:r><w:t>{text}</w:t></w:r></w:p>{inner}</w:tc>"
+
+
+def row(*cells: str) -> str:
+    return f"<w:tr>{''.join(cells)}</w:tr>"
+
+
+def table(*rows: str) -> str:
+    return f"<w:tbl>{''.join(rows)}</w:tbl>"
+
+
+DOCUMENT: str = (
+    f'<?xml version="1.0" encoding="UTF-8"?>'
+    f'<w:document xmlns:w="{W}" xmlns:a="{A}" xmlns:r="{R}"><w:body>'
+    f'<w:p><w:r><w:t>Text</w:t></w:r><w:r><w:drawing><a:blip r:embed="rId5"/></w:drawing></w:r></w:p>'
+    f"{table(row(cell('Name'), cell('Value')), row(cell('a'), cell('1', table(row(cell('x'))))))}"
+    f"<w:p><w:r><w:t>Between</w:t></w:r></w:p>"
+    f"{table(row(cell('One'), cell('Two'), cell('Three')), row(cell('1'), cell('2'), cell('3')))}"
+    f"</w:body></w:document>")
+
+RELATIONSHIPS: str = (
+    f'<?xml version="1.0" encoding="UTF-8"?>'
+    f'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Id="rId5" Type="{R}/image" Target="media/image1.png"/>'
+    f'<Relationship Id="rId6" Type="{R}/image" Target="media/image2.png"/>'
+    f'<Relationship Id="rId7" Type="{R}/hyperlink" Target="https://example.com" TargetMode="External"/>'
+    f"</Relationships>")
+
+
+@fixture
+def docx(tmp_path: Path) -> Path:
+    path: Path = tmp_path.joinpath("document.docx")
+
+    with ZipFile(path, "w") as zip_file:
+        zip_file.writestr("word/document.xml", DOCUMENT)
+        zip_file.writestr("word/_rels/document.xml.rels", RELATIONSHIPS)
+        zip_file.writestr("word/media/image1.png", b"\x89PNG")
+        zip_file.writestr("word/media/image2.png", b"\x89PNG unused")
+
+    return path
+
+
+def test_convert_tables_without_extraction(docx: Path, tmp_path: Path) -> None:
+    tables_dir: Path = tmp_path.joinpath("tables")
+
+    with CoreDocument(docx) as core_document:
+        xml_document: XmlDocument = XmlDocument(core_document, tables_dir)
+        xml_document.read()
+        xml_document.parse_document(LineFormatter(False, False))
+
+    assert sorted(path.name for path in tables_dir.iterdir()) == ["table_1.md", "table_2.md", "table_3.md"]
+    assert tables_dir.joinpath("table_3.md").read_text(encoding="utf-8") == (
+        "| One | Two | Three |\n|-----|-----|-----|\n| 1 | 2 | 3 |")
+    assert not tmp_path.joinpath("word").exists()
+
+
+def test_convert_tables_nested_rows_are_not_mixed(docx: Path, tmp_path: Path) -> None:
+    tables_dir: Path = tmp_path.joinpath("tables")
+
+    with CoreDocument(docx) as core_document:
+        xml_document: XmlDocument = XmlDocument(core_document, tables_dir)
+        xml_document.read()
+
+        assert xml_document.parse_document(LineFormatter(False, False)) == 3
+
+    assert tables_dir.joinpath("table_1.md").read_text(encoding="utf-8") == (
+        "| Name | Value |\n|-----|-----|\n| a | 1 |")
+    assert tables_dir.joinpath("table_2.md").read_text(encoding="utf-8") == "| x |\n|-----|"
+
+
+def test_convert_tables_stream_matches_full(docx: Path, tmp_path: Path) -> None:
+    full_dir: Path = tmp_path.joinpath("full")
+    stream_dir: Path = tmp_path.joinpath("stream")
+
+    with CoreDocument(docx) as core_document:
+        xml_document: XmlDocument = XmlDocument(core_document, full_dir)
+        xml_document.read()
+        xml_document.parse_document(LineFormatter(True, True))
+
+        assert XmlDocument(core_document, stream_dir).parse_document(LineFormatter(True, True), stream=True) == 3
+
+    for path in full_dir.iterdir():
+        assert stream_dir.joinpath(path.name).read_text(encoding="utf-8") == path.read_text(encoding="utf-8")
+
+
+def test_convert_tables_batch(docx: Path, tmp_path: Path) -> None:
+    docx.with_name("copy.docm").write_bytes(docx.read_bytes())
+    docx.with_name("broken.docx").write_bytes(b"not a zip")
+    docx.with_name("~$document.docx").write_bytes(b"lock")
+    tables_dir: Path = tmp_path.joinpath("tables")
+
+    documents: list[Path] = list_documents(tmp_path)
+    assert [document.name for document in documents] == ["broken.docx", "copy.docm", "document.docx"]
+
+    counts: dict[Path, int | None] = convert_documents(documents, tables_dir, LineFormatter(False, False), jobs=2)
+
+    assert {document.name: count for document, count in counts.items()} == {
+        "broken.docx": None, "copy.docm": 3, "document.docx": 3}
+    assert len([*tables_dir.joinpath("copy").iterdir()]) == 3
+    assert len([*tables_dir.joinpath("document").iterdir()]) == 3
+
+
+def test_convert_tables_batch_same_names(docx: Path, tmp_path: Path) -> None:
+    documents: list[Path] = []
+
+    for directory in ("a", "b"):
+        document: Path = tmp_path.joinpath(directory, "spec.docx")
+        document.parent.mkdir()
+        document.write_bytes(docx.read_bytes())
+        documents.append(document)
+
+    tables_dir: Path = tmp_path.joinpath("tables")
+
+    assert [*output_dirs(documents, tables_dir).values()] == [
+        tables_dir.joinpath("spec.docx"), tables_dir.joinpath("spec.docx_2")]
+
+    counts: dict[Path, int | None] = convert_documents(documents, tables_dir, LineFormatter(False, False), jobs=2)
+
+    assert [*counts.values()] == [3, 3]
+    assert len([*tables_dir.joinpath("spec.docx").iterdir()]) == 3
+    assert len([*tables_dir.joinpath("spec.docx_2").iterdir()]) == 3
+
+
+def test_line_formatter_fused_pass() -> None:
+    lines: list[str] = ["| a  *b*  . | x_1 |", "| <a  - b> | <br>, <sup>2</sup> |", "| A-Z 09 |"]
+
+    assert LineFormatter(True, True).format_lines(lines) == [
+        "| a \\*b\\*. | x\\_1 |", "| \\<a \\- b\\> | <br>, <sup>2</sup> |", "| A\\-Z 09 |"]
+    assert LineFormatter(True, False).format_lines(lines) == [
+        "| a *b*. | x_1 |", "| <a - b> | <br>, <sup>2</sup> |", "| A-Z 09 |"]
+    assert LineFormatter(False, False).format_lines(lines) == lines
+
+
+@mark.parametrize("stream", [False, True])
+def test_convert_tables_referenced_images(docx: Path, tmp_path: Path, stream: bool) -> None:
+    images_dir: Path = tmp_path.joinpath("images")
+
+    with CoreDocument(docx) as core_document:
+        xml_document: XmlDocument = XmlDocument(core_document, tmp_path.joinpath("tables"), images_dir)
+
+        if not stream:
+            xml_document.read()
+
+        xml_document.parse_document(LineFormatter(False, False), stream=stream)
+
+    assert [path.name for path in images_dir.iterdir()] == ["image1.png"]
+    assert images_dir.joinpath("image1.png").read_bytes() == b"\x89PNG"
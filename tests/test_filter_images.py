@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from pathlib import Path
+
+from utilities.filter_images.duplicates import find_duplicates, find_references, rewrite_duplicates
+from utilities.filter_images.file import AsciiDocFile, File, MdFile
+
+
+def test_duplicate_images(tmp_path: Path) -> None:
+    contents: dict[str, bytes] = {
+        "a/images/one.png": b"same",
+        "b/images/copy.png": b"same",
+        "b/images/other.png": b"diff",
+        "c/big.png": b"larger content"}
+
+    for name, content in contents.items():
+        tmp_path.joinpath(name).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath(name).write_bytes(content)
+
+    tmp_path.joinpath("a/index.adoc").write_text(
+        "ifndef::imagesdir[:imagesdir: images]\nimage::one.png[]\n", encoding="utf-8")
+    tmp_path.joinpath("b/page.md").write_text("![copy](../images/copy.png)\n", encoding="utf-8")
+
+    images: list[Path] = [tmp_path.joinpath(name).resolve() for name in contents]
+    files: list[File] = [AsciiDocFile(tmp_path.joinpath("a/index.adoc")), MdFile(tmp_path.joinpath("b/page.md"))]
+    groups: list[list[Path]] = find_duplicates(images, jobs=2)
+
+    assert groups == [[images[0], images[1]]]
+
+    references: dict[Path, list[Path]] = find_references(files)
+    assert references[groups[0][1]] == [files[1].path]
+
+    assert rewrite_duplicates(files, groups) == 1
+    assert tmp_path.joinpath("b/page.md").read_text(encoding="utf-8") == "![copy](../../a/images/one.png)\n"
+    assert find_references(files)[groups[0][0]] == [files[0].path, files[1].path]
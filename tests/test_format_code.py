@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+from utilities.common.shared import ADOC_EXTENSION, MD_EXTENSION
+from utilities.scripts.format_code import format_content, split
+
+LONG: str = "first_call(argument); second_call(argument); third_call(argument)"
+
+
+def test_split() -> None:
+    assert split(LONG, 30) == ["first_call(argument);", " second_call(argument);", " third_call(argument)"]
+    assert split("    values = [one, two, three, four]", 24) == ["    values = [one, two,", " three, four]"]
+    assert split("    call(first)(second_argument)", 20) == ["    call(first)", "(second_argument)"]
+    assert split("x" * 25, 10) == ["x" * 10, "x" * 10, "x" * 5]
+
+
+def test_format_content_adoc() -> None:
+    content: str = f"= Title\n\n{LONG}\n\n[source,c]\n----\n{LONG}\nshort();\n----\n\nText after\n"
+    result: str = format_content(content, ADOC_EXTENSION, 30)
+
+    assert result == (
+        f"= Title\n\n{LONG}\n\n[source,c]\n----\n"
+        f"first_call(argument);\n second_call(argument);\n third_call(argument)\nshort();\n----\n\nText after\n")
+    assert format_content(result, ADOC_EXTENSION, 30) == result
+
+
+def test_format_content_md() -> None:
+    content: str = f"Text\n\n```c\n{LONG}\n```\n\n{LONG}\n"
+
+    assert format_content(content, MD_EXTENSION, 30) == (
+        f"Text\n\n```c\nfirst_call(argument);\n second_call(argument);\n third_call(argument)\n```\n\n{LONG}\n")
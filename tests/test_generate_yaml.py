@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+from pathlib import Path
+
+from utilities.scripts.generate_yaml import read_front_matter, walk_tree
+
+
+def test_read_front_matter(tmp_path: Path) -> None:
+    path: Path = tmp_path.joinpath("_index.md")
+
+    path.write_text("---\ntitle: Title\nweight: 2\n---\n\nText\n", encoding="utf-8")
+    assert read_front_matter(path) == ({"title": "Title", "weight": 2}, True)
+
+    path.write_text("\n---\ntitle: Title\nweight: 2\n---\n \n\n", encoding="utf-8")
+    assert read_front_matter(path) == ({"title": "Title", "weight": 2}, False)
+
+    path.write_text("---\ntitle: Title\n", encoding="utf-8")
+    assert read_front_matter(path) == ({}, True)
+
+
+def test_walk_tree(tmp_path: Path) -> None:
+    tmp_path.joinpath("section", "nested").mkdir(parents=True)
+    tmp_path.joinpath("section", "_index.md").write_text("---\ntitle: Section\nweight: 1\n---\n", encoding="utf-8")
+    tmp_path.joinpath("section", "image.png").write_bytes(b"")
+
+    tree = walk_tree(tmp_path)
+
+    assert tree[tmp_path.resolve()] == ([], ["section"])
+    assert tree[tmp_path.joinpath("section").resolve()] == (["_index.md"], ["nested"])
+    assert tree[tmp_path.joinpath("section", "nested").resolve()] == ([], [])
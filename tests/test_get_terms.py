@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from re import compile, Pattern
+from threading import Thread
+from typing import Any
+
+from pytest import fixture, MonkeyPatch
+
+from utilities.get_terms.ascii_doc_table_terms import AsciiDocTableTerms
+from utilities.get_terms.git_manager import GitManager
+from utilities.get_terms.prefix_trie import PrefixTrie
+from utilities.get_terms.table import Term
+from utilities.get_terms.terms_scanner import TermsScanner
+
+CONTENT: str = """\
+|Сокращение |Расшифровка |Перевод |Комментарий
+
+|short |full |rus |commentary
+
+|SMF
+|Session Management Function
+|функция управления сессиями
+|
+
+|AMF
+|Access and Mobility Management Function
+|функция управления доступом
+|
+
+|SMS
+|Short Message Service
+|служба коротких сообщений
+|
+
+|AM
+|Acknowledged Mode
+|режим с подтверждением
+|
+
+|UE
+|User Equipment
+|пользовательское устройство
+|
+
+
+"""
+# the lines before the table in the terms file
+HEADER: str = "\n" * 6
+
+
+@fixture(scope="module")
+def ascii_doc_table() -> AsciiDocTableTerms:
+    _: AsciiDocTableTerms = AsciiDocTableTerms(CONTENT.splitlines(keepends=True))
+    _.complete()
+    _.set_terms()
+    return _
+
+
+def test_exact_lookup(ascii_doc_table: AsciiDocTableTerms) -> None:
+    terms: tuple[Term, ...] = ascii_doc_table.get("smf")
+
+    assert "smf" in ascii_doc_table
+    assert "UPF" not in ascii_doc_table
+    assert terms[0].full == "Session Management Function"
+    assert ascii_doc_table.get("UPF") == (Term(),)
+
+
+def test_sorted_and_range_lookup(ascii_doc_table: AsciiDocTableTerms) -> None:
+    assert ascii_doc_table.terms_short()[:4] == ("AM", "AMF", "SMF", "SMS")
+    assert ascii_doc_table.terms_range("AMF", "SMF") == ["AMF", "SMF"]
+    assert ascii_doc_table[0][0].short == "AM"
+
+
+def test_prefix_lookup(ascii_doc_table: AsciiDocTableTerms) -> None:
+    assert ascii_doc_table.terms_prefix("am") == ["AM", "AMF"]
+    assert ascii_doc_table.terms_prefix("SM") == ["SMF", "SMS"]
+    assert ascii_doc_table.terms_prefix("X") == []
+
+
+def test_prefix_trie() -> None:
+    prefix_trie: PrefixTrie = PrefixTrie(["B", "AB", "A", "AB"])
+
+    assert len(prefix_trie) == 3
+    assert "AB" in prefix_trie
+    assert "ABC" not in prefix_trie
+    assert list(prefix_trie.starts_with("")) == ["A", "AB", "B"]
+
+
+def test_complete_keeps_every_row(ascii_doc_table: AsciiDocTableTerms) -> None:
+    assert len(ascii_doc_table) == 5
+    assert ascii_doc_table.get("UE")[0].rus == "пользовательское устройство"
+
+
+class GlossaryHandler(BaseHTTPRequestHandler):
+    version: str = "1.0.0"
+    requests: list[str] = []
+
+    def do_GET(self):
+        self.requests.append(self.path)
+        etag: str = f'"{self.version}"'
+
+        if "version" in self.path:
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+
+            body: bytes = self.version.encode()
+
+        else:
+            body: bytes = f"{HEADER}{CONTENT}|===\n".encode()
+
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        return
+
+
+@fixture
+def server():
+    http_server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), GlossaryHandler)
+    thread: Thread = Thread(target=http_server.serve_forever, daemon=True)
+    thread.start()
+    GlossaryHandler.requests.clear()
+
+    yield http_server
+
+    http_server.shutdown()
+    http_server.server_close()
+
+
+def test_git_manager_uses_cache(server: ThreadingHTTPServer, tmp_path: Path) -> None:
+    cache_path: Path = tmp_path.joinpath("terms.cache")
+    kwargs: dict[str, Any] = {
+        "scheme": "http",
+        "host": "127.0.0.1",
+        "port": server.server_address[1],
+        "project_id": 1,
+        "cache_path": cache_path}
+
+    git_manager: GitManager = GitManager(**kwargs)
+
+    assert git_manager.get_table().get("SMF")[0].full == "Session Management Function"
+    assert len(GlossaryHandler.requests) == 2
+    assert cache_path.exists()
+
+    # the warm cache does not require the network access
+    server.shutdown()
+    assert GitManager(**kwargs).get_table().get("AMF")[0].short == "AMF"
+
+
+def test_git_manager_conditional_version_check(server: ThreadingHTTPServer, tmp_path: Path) -> None:
+    kwargs: dict[str, Any] = {
+        "scheme": "http",
+        "host": "127.0.0.1",
+        "port": server.server_address[1],
+        "project_id": 1,
+        "cache_path": tmp_path.joinpath("terms.cache")}
+
+    GitManager(**kwargs).get_table()
+    GlossaryHandler.requests.clear()
+
+    git_manager: GitManager = GitManager(**kwargs)
+    git_manager._cache_ttl = 0
+    ascii_doc_table: AsciiDocTableTerms = git_manager.get_table()
+
+    assert len(ascii_doc_table) == 5
+    assert len(GlossaryHandler.requests) == 1
+    assert "version" in GlossaryHandler.requests[0]
+
+
+def test_git_manager_new_version(server: ThreadingHTTPServer, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    kwargs: dict[str, Any] = {
+        "scheme": "http",
+        "host": "127.0.0.1",
+        "port": server.server_address[1],
+        "project_id": 1,
+        "cache_path": tmp_path.joinpath("terms.cache")}
+
+    GitManager(**kwargs).get_table()
+    GlossaryHandler.requests.clear()
+    monkeypatch.setattr(GlossaryHandler, "version", "1.0.1")
+
+    git_manager: GitManager = GitManager(**kwargs)
+    git_manager._cache_ttl = 0
+    git_manager.get_table()
+
+    # the version file is requested only once
+    assert len(GlossaryHandler.requests) == 2
+    assert "version" in GlossaryHandler.requests[0]
+    assert "version" not in GlossaryHandler.requests[1]
+
+
+def test_prefix_trie_pattern() -> None:
+    pattern: Pattern = compile(rf"(?<!\w){PrefixTrie(['AM', 'AMF', 'A.B']).pattern()}(?!\w)")
+
+    assert pattern.findall("AMF, AM and A.B but not AMFX or AMX or ACB") == ["AMF", "AM", "A.B"]
+
+
+def test_terms_scanner(ascii_doc_table: AsciiDocTableTerms, tmp_path: Path) -> None:
+    file_path: Path = tmp_path.joinpath("file.adoc")
+    file_path.write_text("The SMF and AMF interact with UE.\nSMS is not SMSC, AM is not am.\n", encoding="utf-8")
+    terms_scanner: TermsScanner = TermsScanner(ascii_doc_table)
+
+    assert terms_scanner.scan(file_path.read_text(encoding="utf-8")) == ["AM", "AMF", "SMF", "SMS", "UE"]
+    assert [term.short for term in terms_scanner.scan_file(file_path)] == ["AM", "AMF", "SMF", "SMS", "UE"]
+
+
+def test_terms_scanner_stripped_keys(tmp_path: Path) -> None:
+    ascii_doc_table: AsciiDocTableTerms = AsciiDocTableTerms.from_terms([Term(" NF ", "Network Function")])
+    ascii_doc_table.set_terms()
+    file_path: Path = tmp_path.joinpath("file.adoc")
+    file_path.write_text("The NF is here.\n", encoding="utf-8")
+
+    assert [term.full for term in TermsScanner(ascii_doc_table).scan_file(file_path)] == ["Network Function"]
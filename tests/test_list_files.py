@@ -1,9 +1,15 @@
 # -*- coding: utf-8 -*-
+from pathlib import Path
+from subprocess import run
+
+from click.core import Context
 from click.termui import echo
 from click.testing import CliRunner, Result
 
 from conftest import folder, folder_result
 from utilities.scripts.cli import cli
+from utilities.common.shared import StrPath
+from utilities.scripts.list_files import get_files, list_changed_files
 
 
 def test_list_files(folder, folder_result):
@@ -18,3 +24,61 @@ def test_list_files(folder, folder_result):
     echo(f"{result.stderr=}")
     echo(f"{cli_runner}")
     assert result.output == "\n"
+
+
+def test_list_changed_files(tmp_path: Path) -> None:
+    def git(*args: str) -> None:
+        run(["git", "-C", str(tmp_path), *args], check=True, capture_output=True)
+
+    git("init", "-q", "-b", "main")
+    git("config", "user.email", "user@example.com")
+    git("config", "user.name", "user")
+
+    for name in ("a.en.adoc", "b.en.adoc", "c.adoc", "README.adoc", "sub/d.en.md"):
+        tmp_path.joinpath(name).parent.mkdir(exist_ok=True)
+        tmp_path.joinpath(name).write_text("text\n", encoding="utf-8")
+
+    git("add", ".")
+    git("commit", "-q", "-m", "initial")
+    git("switch", "-q", "-c", "feature")
+
+    for name in ("a.en.adoc", "c.adoc", "README.adoc", "sub/d.en.md"):
+        tmp_path.joinpath(name).write_text("changed\n", encoding="utf-8")
+
+    git("add", "a.en.adoc")
+    # the untracked file is changed as well, but not staged
+    tmp_path.joinpath("sub/e.en.adoc").write_text("new\n", encoding="utf-8")
+
+    assert list_changed_files(tmp_path, changed_since="main", language="en") == [
+        Path("a.en.adoc"), Path("sub/d.en.md"), Path("sub/e.en.adoc")]
+    assert list_changed_files(tmp_path, staged=True, language="") == [Path("a.en.adoc")]
+    assert list_changed_files(tmp_path, changed_since="main", recursive=False, extensions="adoc") == [
+        Path("c.adoc")]
+
+
+def test_get_files_recursive_matches_git_mode(tmp_path: Path) -> None:
+    def git(*args: str) -> None:
+        run(["git", "-C", str(tmp_path), *args], check=True, capture_output=True)
+
+    git("init", "-q", "-b", "main")
+    git("config", "user.email", "user@example.com")
+    git("config", "user.name", "user")
+
+    for name in ("a.en.adoc", "sub/b.en.adoc", "sub/nested/c.en.md"):
+        tmp_path.joinpath(name).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.joinpath(name).write_text("text\n", encoding="utf-8")
+
+    git("add", ".")
+    git("commit", "-q", "-m", "initial")
+
+    for name in ("a.en.adoc", "sub/b.en.adoc", "sub/nested/c.en.md"):
+        tmp_path.joinpath(name).write_text("changed\n", encoding="utf-8")
+
+    with Context(cli, obj={}) as ctx:
+        for recursive in (True, False):
+            walked: list[StrPath] = get_files(ctx, directory=tmp_path, recursive=recursive, language="en")
+            changed: list[StrPath] = get_files(
+                ctx, directory=tmp_path, recursive=recursive, language="en", changed_since="HEAD")
+
+            assert sorted(walked) == sorted(changed)
+            assert len(walked) == (3 if recursive else 1)
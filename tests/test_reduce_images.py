@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+from json import loads
+from os import urandom
+from pathlib import Path
+
+from PIL import Image
+from pytest import fixture, MonkeyPatch
+
+from utilities.reduce_images.inventory import inventory, write_report
+from utilities.reduce_images.manifest import Manifest
+from utilities.reduce_images.reducer import EncodeOptions, reduce_image, reduce_images, target_size
+
+
+@fixture
+def png(tmp_path: Path) -> Path:
+    path: Path = tmp_path.joinpath("image.png")
+    Image.new("RGB", (64, 64), (255, 255, 255)).save(path, compress_level=0)
+    return path
+
+
+def test_reduce_image_dry_run(png: Path) -> None:
+    content: bytes = png.read_bytes()
+    result = reduce_image(png, dry_run=True)
+
+    assert result.replaced and result.encoded < result.before
+    assert png.read_bytes() == content
+    assert [path.name for path in png.parent.iterdir()] == ["image.png"]
+
+
+def test_reduce_image_threshold(png: Path) -> None:
+    size: int = png.stat().st_size
+
+    assert not reduce_image(png, threshold=0.9999).replaced
+    assert png.stat().st_size == size
+
+    [result] = reduce_images([png], 0.05, jobs=1)
+
+    assert result.replaced and result.after == png.stat().st_size < size
+
+
+def test_target_size() -> None:
+    assert target_size((3840, 2160), 800) == (800, 450)
+    assert target_size((3840, 2160), 800, 300) == (533, 300)
+    assert target_size((640, 480), 800, 600) == (640, 480)
+
+
+def test_reduce_image_downscale(tmp_path: Path) -> None:
+    path: Path = tmp_path.joinpath("image.jpg")
+    Image.new("RGB", (400, 300), (0, 128, 255)).save(path, quality=95)
+
+    result = reduce_image(path, options=EncodeOptions(max_width=100, quality=80, progressive=True))
+
+    assert result.replaced
+
+    with Image.open(path) as image:
+        assert image.size == (100, 75)
+        assert image.info.get("progressive")
+
+
+def test_reduce_image_quantize(tmp_path: Path) -> None:
+    path: Path = tmp_path.joinpath("screenshot.png")
+    image: Image.Image = Image.new("RGB", (64, 64), (255, 255, 255))
+    image.paste((0, 0, 255), (8, 8, 56, 24))
+    image.save(path)
+
+    result = reduce_image(path, options=EncodeOptions(colors=16))
+
+    assert result.quantized and result.replaced and result.saving > 0
+
+    with Image.open(path) as reduced:
+        assert reduced.mode == "P"
+
+    noise: Path = tmp_path.joinpath("noise.png")
+    Image.frombytes("RGB", (64, 64), urandom(64 * 64 * 3)).save(noise)
+
+    assert not reduce_image(noise, dry_run=True, options=EncodeOptions(colors=16, max_colors=256)).quantized
+
+
+def test_manifest(png: Path, tmp_path: Path) -> None:
+    path: Path = tmp_path.joinpath("manifest.json")
+    manifest: Manifest = Manifest("threshold=0.05", path)
+    # the empty manifest does not hash the images
+    assert not manifest.is_optimized(png)
+    assert not manifest._stats
+
+    [result] = reduce_images([png], 0.05, jobs=1)
+    manifest.add(result.path, result.digest)
+    manifest.save()
+
+    loaded: Manifest = Manifest("threshold=0.05", path)
+    loaded.load()
+    assert loaded.is_optimized(png)
+
+    copy: Path = tmp_path.joinpath("copy.png")
+    copy.write_bytes(png.read_bytes())
+    assert loaded.is_optimized(copy)
+
+    other: Manifest = Manifest("threshold=0.5", path)
+    other.load()
+    assert not other.is_optimized(png)
+
+
+def test_inventory(png: Path, tmp_path: Path) -> None:
+    small: Path = tmp_path.joinpath("small.jpg")
+    Image.new("RGB", (8, 8)).save(small, dpi=(96, 96))
+
+    infos = inventory([small, png], max_width=32, jobs=2)
+
+    assert [info.path for info in infos] == [png, small]
+    assert (infos[0].format, infos[0].width, infos[0].height, infos[0].size) == ("PNG", 64, 64, png.stat().st_size)
+    assert infos[0].wasted == png.stat().st_size - 32 * 32 * 4 // 8
+    assert infos[1].dpi == "96x96"
+
+    report: Path = tmp_path.joinpath("report.json")
+    write_report(infos, report)
+
+    assert [row["path"] for row in loads(report.read_text(encoding="utf-8"))] == [str(png), str(small)]
+
+
+def test_inventory_skips_decompression_bomb(png: Path, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    small: Path = tmp_path.joinpath("small.png")
+    Image.new("RGB", (8, 8)).save(small)
+    # the images over twice the limit are rejected by Image.open
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 16 * 16)
+
+    assert [info.path for info in inventory([small, png], jobs=2)] == [small]
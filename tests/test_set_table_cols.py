@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+from pathlib import Path
+
+from pytest import mark, raises
+
+from utilities.common.errors import TableColsTableBorderNotClosedError
+from utilities.common.functions import file_reader
+from utilities.set_table_cols.analyser import TableAnalyser
+from utilities.set_table_cols.file import AsciiDocFile
+from utilities.set_table_cols.width import CharWidths, text_width, UNITS
+
+CONTENT: str = """\
+= Title
+
+.Table name
+[options="header"]
+|===
+| Name | Description
+
+| param_one | Some long description of the parameter
+| p2 | Short
+|===
+
+Text between the tables
+
+|===
+| A | B | C
+| 1 | 2 | 3
+|===
+[cols="1,2"]
+|===
+| x | y
+|===
+"""
+# the tables without the lines between them
+ADJACENT_CONTENT: str = ".Name\n[%header]\n|===\n| a | b\n|===\n|===\n| c | d\n|===\n"
+
+
+@mark.parametrize("content", [CONTENT, ADJACENT_CONTENT])
+def test_stream_tables_matches_full_processing(tmp_path: Path, content: str) -> None:
+    options: dict[str, str] = {"width": "100%", "options": "header"}
+    full_path: Path = tmp_path.joinpath("full.adoc")
+    stream_path: Path = tmp_path.joinpath("stream.adoc")
+    full_path.write_text(content, encoding="utf-8")
+    stream_path.write_text(content, encoding="utf-8")
+
+    full_file: AsciiDocFile = AsciiDocFile(full_path, content=file_reader(full_path, "lines"))
+    full_file.set_tables()
+    full_file.fix_tables(TableAnalyser(), options)
+    full_file.replace_tables()
+    full_file.save()
+
+    AsciiDocFile(stream_path).stream_tables(TableAnalyser(), options)
+
+    assert stream_path.read_text(encoding="utf-8") == full_path.read_text(encoding="utf-8")
+    assert not stream_path.with_name("stream.adoc.tmp").exists()
+
+
+def test_stream_tables_border_not_closed(tmp_path: Path) -> None:
+    file_path: Path = tmp_path.joinpath("broken.adoc")
+    file_path.write_text("|===\n| A | B\n", encoding="utf-8")
+
+    with raises(TableColsTableBorderNotClosedError):
+        AsciiDocFile(file_path).stream_tables(TableAnalyser())
+
+    assert file_path.read_text(encoding="utf-8") == "|===\n| A | B\n"
+
+
+def test_text_width_narrow_and_wide_characters() -> None:
+    narrow: int = text_width("iiiiiiii")
+    regular: int = text_width("aaaaaaaa")
+    wide: int = text_width("WWWWWWWW")
+
+    assert narrow < regular < wide
+    assert text_width("") == 0
+
+
+def test_char_widths_default_for_unknown_characters() -> None:
+    char_widths: CharWidths = CharWidths({"a": 2}, default=UNITS)
+
+    assert "a一".translate(char_widths) == "." * (2 + UNITS)
+    assert ord("一") in char_widths
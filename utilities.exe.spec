@@ -9,7 +9,7 @@ a = Analysis(
     ['__main__.py'],
     pathex=['./utilities'],
     binaries=binaries,
-    datas=[('LICENSE', '.'), ('MANIFEST.in', '.'), ('pyproject.toml', '.'), ('sources/', './sources/'), ('utilities/', './utilities/')],
+    datas=[('LICENSE', '.'), ('MANIFEST.in', '.'), ('pyproject.toml', '.'), ('sources/', './sources/'), ('utilities/', './utilities/'), ('fonts/pt-sans-web-updated-normal.ttf', './fonts/')],
     hiddenimports=['certifi', 'click', 'httpx', 'loguru', 'more_itertools', 'PIL', 'pip_system_certs', 'frontmatter', 'slugify', 'ruamel.yaml'],
     hookspath=[],
     hooksconfig={},
@@ -240,13 +240,15 @@ def result_file_handler(sink: str = None):
     return set_handler("result_file", **kwargs)
 
 
-def custom_logging(*, is_debug: bool = False, result_file: bool = False):
+def custom_logging(*, is_debug: bool = False, result_file: bool = False, is_worker: bool = False):
     """Specifies the loguru Logger.
 
     :param is_debug: The flag to use the debug mode.
     :type is_debug: bool, default=False
     :param result_file: Flag to use results.txt file.
     :type result_file: bool, default=False
+    :param is_worker: The flag to append to the log file of the main process without the rotation.
+    :type is_worker: bool, default=False
     """
     logger.remove()
 
@@ -257,7 +259,12 @@ def custom_logging(*, is_debug: bool = False, result_file: bool = False):
     else:
         stream_level: LoggingLevel = "DEBUG"
 
-    handlers: list[dict[str, Any]] = [stream_handler(stream_level), stderr_handler(), rotating_file_handler()]
+    file_handler: dict[str, Any] = rotating_file_handler()
+
+    if is_worker:
+        file_handler.update(mode="a", rotation=None)
+
+    handlers: list[dict[str, Any]] = [stream_handler(stream_level), stderr_handler(), file_handler]
 
     if result_file:
         handlers.append(result_file_handler())
@@ -277,6 +284,18 @@ def custom_logging(*, is_debug: bool = False, result_file: bool = False):
     logger.catch(level="DEBUG", exclude=BaseError, reraise=False)
 
 
+def worker_logging(is_debug: bool = False):
+    """Specifies the loguru Logger in the worker process.
+
+    The worker processes are spawned without running the command, so the logger is not configured otherwise.
+    Used as the initializer of the process pools.
+
+    :param is_debug: The flag to use the debug mode.
+    :type is_debug: bool, default=False
+    """
+    custom_logging(is_debug=is_debug, is_worker=True)
+
+
 def add_handler(handler_type: HandlerType, **kwargs):
     handler: dict[str, Any] = set_handler(handler_type, **kwargs)
     logger.add(**handler)
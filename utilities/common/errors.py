@@ -27,10 +27,6 @@ class GetTermsError(BaseError):
     """Base class for errors associated with the get-terms."""
 
 
-class GetTermsAsciiDocFileTableRowIndexError(GetTermsError):
-    """Invalid AsciiDocTable row index."""
-
-
 class GetTermsInvalidTermIndexError(GetTermsError):
     """Specified index is not found in the dictionary."""
 
@@ -39,6 +35,10 @@ class GetTermsEmptyFileError(GetTermsError):
     """Read file is empty."""
 
 
+class GetTermsDownloadError(GetTermsError):
+    """Failed to download the terms file, and no cached glossary is found."""
+
+
 class MutuallyExclusiveOptionError(BaseError):
     """Command contains mutually exclusive options."""
 
@@ -171,6 +171,14 @@ class ConfigFileUpdateKeyError(ConfigFileError):
     """Specified key has not been found in the section 'update'."""
 
 
+class ListFilesError(BaseError):
+    """Base class for errors associated with the list-files."""
+
+
+class ListFilesGitError(ListFilesError):
+    """Failed to get the changed files from git."""
+
+
 class GenerateYamlError(BaseError):
     """Base class for errors associated with the generate-yaml."""
 
@@ -1,18 +1,20 @@
 # -*- coding: utf-8 -*-
 from base64 import b64decode
 from functools import cache
+from hashlib import blake2b
 from io import UnsupportedOperation
 from json import JSONDecodeError
 from os import scandir
 from pathlib import Path
+from subprocess import CalledProcessError, CompletedProcess, run
 from sys import platform
 from typing import Any, Callable, Iterable
 
-from httpx import HTTPStatusError, InvalidURL, request, RequestError, Response, StreamError, URL
+from httpx import Client, HTTPStatusError, InvalidURL, request, RequestError, Response, StreamError, URL
 from loguru import logger
 from ruamel.yaml.scanner import ScannerError
 
-from utilities.common.errors import FileReaderError, FileReaderTypeError, UpdateProjectIdError
+from utilities.common.errors import FileReaderError, FileReaderTypeError, ListFilesGitError, UpdateProjectIdError
 from utilities.common.shared import BASE_PATH, FileType, ReaderMode, StrPath
 
 
@@ -217,6 +219,7 @@ def walk_full(
         language: str | None = None,
         root: Path = None,
         hidden: bool = False,
+        recursive: bool = True,
         results: list[Path] = None):
     path: Path = Path(path).expanduser()
 
@@ -248,7 +251,7 @@ def walk_full(
         item: Path = Path(element.path)
 
         if element.is_dir():
-            if item.name not in ignored_dirs:
+            if recursive and item.name not in ignored_dirs:
                 values = walk_full(
                     item,
                     ignored_dirs=ignored_dirs,
@@ -257,6 +260,7 @@ def walk_full(
                     language=language,
                     root=root,
                     hidden=hidden,
+                    recursive=recursive,
                     results=None)
                 results.extend(values)
 
@@ -266,6 +270,64 @@ def walk_full(
     return results
 
 
+def _git_names(path: StrPath, args: Iterable[str]) -> list[str]:
+    """Runs the git command in the directory and gets the NUL-separated file names from the output."""
+    try:
+        result: CompletedProcess = run(
+            ["git", "-C", str(path), *args], capture_output=True, check=True, text=True, encoding="utf-8")
+
+    except FileNotFoundError:
+        logger.error("Не найден исполняемый файл git")
+        raise ListFilesGitError
+
+    except CalledProcessError as e:
+        logger.error(f"Не удалось получить измененные файлы в директории {path}:\n{e.stderr.strip()}")
+        raise ListFilesGitError
+
+    return [name for name in result.stdout.split("\0") if name]
+
+
+def git_changed_files(path: StrPath, *, changed_since: str = None, staged: bool = False) -> list[Path]:
+    """Gets the files changed in the git repository without walking the directory.
+
+    The untracked files not ignored by git are considered changed unless only the staged changes are requested.
+
+    :param path: The directory to get the changes in.
+    :type path: str or Path
+    :param changed_since: The git reference to compare the working tree with the merge base of.
+    :type changed_since: str or None
+    :param staged: The flag to get only the changes added to the index.
+    :type staged: bool
+    :return: The paths relative to the directory, the deleted files are excluded.
+    :rtype: list[Path]
+    """
+    args: list[str] = ["diff", "--name-only", "--relative", "--diff-filter=d", "-z"]
+
+    if staged:
+        args.append("--cached")
+
+    if changed_since is not None:
+        args.extend(("--merge-base", changed_since))
+
+    names: list[str] = _git_names(path, args)
+
+    if not staged:
+        names.extend(_git_names(path, ("ls-files", "--others", "--exclude-standard", "-z")))
+
+    return [Path(name) for name in sorted(set(names))]
+
+
+def file_hash(path: StrPath, buffer_size: int = 1 << 20) -> str:
+    """Gets the hash of the file content reading the file in chunks."""
+    digest = blake2b()
+
+    with open(path, "rb") as f:
+        while chunk := f.read(buffer_size):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
 def pretty_print(values: Iterable[StrPath] = None):
     if values is None or not values:
         return ""
@@ -331,6 +393,15 @@ class GitFile:
     def get_response(self) -> Response:
         return request(method=self._method, url=self.url, timeout=120.0)
 
+    def fetch(self, client: Client, *, timeout: float = None, headers: dict[str, str] = None) -> Response:
+        """Sends the request with the shared client to reuse its connection pool."""
+        kwargs: dict[str, Any] = {"headers": headers}
+
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        return client.request(method=self._method, url=self.url, **kwargs)
+
     @property
     def json(self) -> dict[str, Any]:
         return self.get_response().json()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import as_completed, Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable
+
+from loguru import logger
+
+from utilities.common.custom_logger import worker_logging
+from utilities.common.errors import ConvertTablesError
+from utilities.common.shared import StrPath
+from utilities.convert_tables.line_formatter import LineFormatter
+from utilities.convert_tables.xml_file import CoreDocument, XmlDocument
+
+DOCX_EXTENSIONS: tuple[str, ...] = (".docx", ".docm")
+
+
+def list_documents(directory: StrPath) -> list[Path]:
+    """Gets the Word files in the directory skipping the temporary lock files."""
+    return sorted(
+        path for path in Path(directory).iterdir()
+        if path.is_file() and path.suffix.lower() in DOCX_EXTENSIONS and not path.name.startswith("~$"))
+
+
+def output_dirs(documents: Iterable[Path], tables_dir: Path) -> dict[Path, Path]:
+    """Gets the unique subdirectories for the documents.
+
+    The subdirectory is named after the document stem, or after the full name if the stems coincide.
+    If the names coincide as well, e.g. the documents are in the different directories,
+    the number is appended to the name.
+    """
+    documents: list[Path] = [*documents]
+    stems: list[str] = [document.stem for document in documents]
+    # the names are compared case-insensitively since the file systems may be case-insensitive
+    used: set[str] = set()
+    dirs: dict[Path, Path] = {}
+
+    for document in documents:
+        name: str = document.stem if stems.count(document.stem) == 1 else document.name
+        dir_name: str = name
+        counter: int = 1
+
+        while dir_name.casefold() in used:
+            counter += 1
+            dir_name: str = f"{name}_{counter}"
+
+        used.add(dir_name.casefold())
+        dirs[document] = tables_dir.joinpath(dir_name)
+
+    return dirs
+
+
+def convert_document(
+        docx: StrPath,
+        tables_dir: StrPath,
+        line_formatter: LineFormatter,
+        stream: bool = False,
+        images_dir: StrPath = None) -> int:
+    """Converts all tables of the document.
+
+    :param docx: The path to the Word file.
+    :type docx: str or Path
+    :param tables_dir: The directory to write the tables to.
+    :type tables_dir: str or Path
+    :param line_formatter: The formatter of the table lines.
+    :type line_formatter: LineFormatter
+    :param stream: The flag to read the document with iterparse.
+    :type stream: bool
+    :param images_dir: The directory to copy the referenced images to. By default, the images are not copied.
+    :type images_dir: str or Path or None
+    :return: The number of the converted tables.
+    :rtype: int
+    """
+    with CoreDocument(docx) as core_document:
+        logger.info(f"Файл {core_document.file.name} открыт")
+
+        xml_document: XmlDocument = XmlDocument(core_document, tables_dir, images_dir)
+
+        if not stream:
+            xml_document.read()
+
+        return xml_document.parse_document(line_formatter, stream=stream)
+
+
+def convert_documents(
+        documents: Iterable[StrPath],
+        tables_dir: StrPath,
+        line_formatter: LineFormatter, *,
+        stream: bool = False,
+        images_dir: StrPath = None,
+        jobs: int = None,
+        is_debug: bool = False) -> dict[Path, int | None]:
+    """Converts the documents in the worker processes.
+
+    The tables and the images of each document are written to the subdirectories named after the document.
+
+    :param documents: The paths to the Word files.
+    :type documents: Iterable[str or Path]
+    :param tables_dir: The directory to create the subdirectories in.
+    :type tables_dir: str or Path
+    :param line_formatter: The formatter of the table lines.
+    :type line_formatter: LineFormatter
+    :param stream: The flag to read the documents with iterparse.
+    :type stream: bool
+    :param images_dir: The directory to create the subdirectories for the images in.
+    :type images_dir: str or Path or None
+    :param jobs: The number of the worker processes. By default, the number of the processors.
+    :type jobs: int
+    :param is_debug: The flag to log the debug messages of the worker processes to the console.
+    :type is_debug: bool
+    :return: The number of the converted tables for each document, None if the document is failed.
+    :rtype: dict[Path, int or None]
+    """
+    documents: list[Path] = [Path(document).resolve() for document in documents]
+    tables_dir: Path = Path(tables_dir).resolve()
+    images_dir: Path | None = Path(images_dir).resolve() if images_dir is not None else None
+    counts: dict[Path, int | None] = dict.fromkeys(documents)
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=worker_logging, initargs=(is_debug,)) as executor:
+        futures: dict[Future, Path] = {
+            executor.submit(
+                convert_document,
+                document,
+                output_dir,
+                line_formatter,
+                stream,
+                images_dir.joinpath(output_dir.name) if images_dir is not None else None): document
+            for document, output_dir in output_dirs(documents, tables_dir).items()}
+
+        for future in as_completed(futures):
+            document: Path = futures[future]
+
+            try:
+                counts[document] = future.result()
+
+            except (ConvertTablesError, OSError) as e:
+                logger.error(f"Не удалось обработать файл {document.name}, {e.__class__.__name__}: {e}")
+
+    return counts
+
+
+def summary(counts: dict[Path, int | None]) -> str:
+    """Gets the number of the converted tables per document."""
+    lines: list[str] = [
+        f"{document.name}: {'ошибка' if count is None else count}"
+        for document, count in counts.items()]
+    total: int = sum(count for count in counts.values() if count is not None)
+    lines.append(f"Всего таблиц: {total}")
+    return "\n".join(lines)
@@ -1,27 +1,42 @@
 # -*- coding: utf-8 -*-
-from re import sub
+from re import compile, Match, Pattern
 from typing import Mapping, MutableSequence
 
 from loguru import logger
 
 from utilities.common.errors import ConvertTablesEmptyLinesError
 
+# the whitespaces except the line breaks, so the joined lines of the table are processed at once
+SPACES: str = r"(?P<spaces>[^\S\n]+)(?P<dot>\.)?"
+CHARS: str = r"(?P<char>[*\-_])"
+TAG: str = r"<(?!/?br>|/?sub>|/?sup>)(?P<tag>[^<>]*)(?<!<br)>"
+
 
 class LineFormatter:
+    """Class to represent the formatting of the table lines.
+
+    The enabled rules are fused into the single regular expression,
+    so the text is scanned once regardless of the number of the rules.
+    The additional patterns are applied after the rules in the specified order.
+    """
+
     def __init__(self, remove_spaces: bool, escape_chars: bool, patterns: Mapping[str, str] = None):
         if patterns is None:
             patterns: dict[str, str] = {}
 
         self._remove_spaces: bool = remove_spaces
         self._escape_chars: bool = escape_chars
-        self._patterns: dict[str, dict[str, str]] = {
-            "remove_spaces": {
-                r"\s+": " ",
-                r"\s\.": "."},
-            "escape_chars": {
-                r"([*-_])": r"\\\1",
-                r"<(?!/?br>|/?sub>|/?sup>)([^<>]*)(?<!<br)>": r"\\<\1\\>"}}
-        self._patterns.update(**patterns)
+
+        alternatives: list[str] = []
+
+        if self._remove_spaces:
+            alternatives.append(SPACES)
+
+        if self._escape_chars:
+            alternatives.extend((CHARS, TAG))
+
+        self._pattern: Pattern | None = compile("|".join(alternatives)) if alternatives else None
+        self._patterns: list[tuple[Pattern, str]] = [(compile(k), v) for k, v in patterns.items()]
 
     def __str__(self):
         _convert_bool: dict[bool, str] = {
@@ -37,23 +52,36 @@ class LineFormatter:
         return (
             f"<{self.__class__.__name__}(remove_spaces = {self._remove_spaces}, escape_chars = {self._escape_chars})>")
 
-    def format_lines(self, lines: MutableSequence[str] = None):
-        if lines is None:
-            logger.error("Нет строк для модификации")
-            raise ConvertTablesEmptyLinesError
+    def _replace(self, match: Match) -> str:
+        if match.lastgroup == "char":
+            return f"\\{match.group('char')}"
 
-        patterns: dict[str, str] = {}
+        elif match.lastgroup == "tag":
+            # the spaces and characters inside the tag are processed as well
+            return f"\\<{self._pattern.sub(self._replace, match.group('tag'))}\\>"
 
-        if self._remove_spaces:
-            patterns.update(self._patterns.get("remove_spaces"))
+        elif match.lastgroup == "dot":
+            return "."
 
-        if self._escape_chars:
-            patterns.update(self._patterns.get("escape_chars"))
+        else:
+            return " "
+
+    def format_text(self, text: str) -> str:
+        """Formats the text in the single pass, the line breaks are kept."""
+        if self._pattern is not None:
+            text: str = self._pattern.sub(self._replace, text)
+
+        for pattern, repl in self._patterns:
+            text: str = pattern.sub(repl, text)
+
+        return text
+
+    def format_lines(self, lines: MutableSequence[str] = None) -> list[str]:
+        if lines is None:
+            logger.error("Нет строк для модификации")
+            raise ConvertTablesEmptyLinesError
 
-        if patterns:
-            for index, line in enumerate(lines):
-                for k, v in patterns.items():
-                    line: str = sub(k, v, line)
-                    lines[index] = line
+        if not lines:
+            return []
 
-        return list(lines)
+        return self.format_text("\n".join(lines)).split("\n")
@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
 from pathlib import Path
-from shutil import rmtree
-from typing import Iterator
+from posixpath import join, normpath
+from shutil import copyfileobj
+from typing import IO, Iterator
 # noinspection PyProtectedMember
-from xml.etree.ElementTree import Element, parse, ParseError, register_namespace
-from zipfile import ZIP_DEFLATED, ZipFile
+from xml.etree.ElementTree import Element, iterparse, parse, ParseError, register_namespace
+from zipfile import BadZipFile, ZIP_DEFLATED, ZipFile
 
 from loguru import logger
 
@@ -17,14 +18,18 @@ from utilities.convert_tables.xml_formatter import get_all_text
 
 
 class CoreDocument:
-    def __init__(self, file: StrPath, temp_dir: StrPath):
+    def __init__(self, file: StrPath):
         self.file: Path = Path(file).resolve()
 
         for k, v in _ns.items():
             register_namespace(k, v)
 
-        self._zip_file: ZipFile = ZipFile(self.file, "r", ZIP_DEFLATED)
-        self.temp_dir: Path = Path(temp_dir).resolve()
+        try:
+            self._zip_file: ZipFile = ZipFile(self.file, "r", ZIP_DEFLATED)
+
+        except BadZipFile as e:
+            logger.error(f"Ошибка {e.__class__.__name__}: файл {self.file} не является архивом docx")
+            raise ConvertTablesInvalidFileError
 
     def __repr__(self):
         return f"<{self.__class__.__name__}({self.file})>"
@@ -32,19 +37,35 @@ class CoreDocument:
     def __str__(self):
         return f"{self.__class__.__name__}: {self.file}"
 
-    def unarchive(self):
-        self.temp_dir.mkdir(exist_ok=True)
-        self._zip_file.extractall(self.temp_dir)
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def open(self, name: str) -> IO[bytes]:
+        """Opens the file in the archive as a stream without extracting it."""
+        try:
+            return self._zip_file.open(name, "r")
+
+        except KeyError:
+            logger.error(f"В архиве {self.file.name} не найден файл {name}")
+            raise ConvertTablesInvalidFileError
+
+    def copy(self, name: str, path: StrPath):
+        """Copies the file in the archive to the path without extracting the other files."""
+        with self.open(name) as src, open(path, "wb") as dst:
+            copyfileobj(src, dst)
 
-    def delete_temp_archive(self):
-        rmtree(self.temp_dir, True)
+    def close(self):
+        self._zip_file.close()
 
     @property
     def name(self):
         return self.file.stem
 
 
-class UnzippedFile:
+class ZippedFile:
     def __init__(self, name: str, core_document: CoreDocument):
         self._name: str = name
         self._core_document: CoreDocument = core_document
@@ -56,65 +77,112 @@ class UnzippedFile:
     def __str__(self):
         return f"{self.__class__.__name__}: {self._name}, {str(self._core_document)}, {self._core_document.file}"
 
-    @property
-    def full_path(self) -> Path:
-        """The full path to the file in the unpacked archive."""
-        return self._core_document.temp_dir.joinpath(self._name)
+    def open(self) -> IO[bytes]:
+        """Opens the file in the archive as a stream."""
+        return self._core_document.open(self._name)
 
 
-class XmlFile(UnzippedFile):
+class XmlFile(ZippedFile):
     def __init__(self, name: str, core_document: CoreDocument):
         super().__init__(name, core_document)
-        self.content: Element = parse(self.full_path).getroot()
+        self.content: Element | None = None
 
     def read(self):
         try:
-            self.content = parse(self.full_path).getroot()
+            with self.open() as f:
+                self.content = parse(f).getroot()
 
         except ParseError as e:
-            logger.error(
-                f"Ошибка {e.__class__.__name__}: не удалось обработать"
-                f"\n{e.text}\n"
-                f"Место {e.filename}:{e.lineno}:{e.offset} .. {e.end_lineno}:{e.end_offset}")
-            raise ConvertTablesInvalidFileError
+            self._parse_error(e)
+
+    def _parse_error(self, e: ParseError):
+        logger.error(
+            f"Ошибка {e.__class__.__name__}: не удалось обработать"
+            f"\n{self._name}, позиция {e.position}")
+        raise ConvertTablesInvalidFileError
 
     def get_children_elements(self, tag: str) -> list[Element]:
         return list(self.content.iter(fqdn(tag)))
 
 
+# the elements that may wrap the rows and cells without changing the table structure
+WRAPPERS: frozenset[str] = frozenset(map(fqdn, ("w:sdt", "w:sdtContent", "w:customXml", "w:smartTag")))
+
+
+def iter_own_children(element: Element, tag: str) -> Iterator[Element]:
+    """Iterates over the element children with the tag.
+
+    The content controls are unwrapped, but the nested tables are not entered,
+    so the rows and cells of the nested tables are not mixed with the own ones.
+    """
+    for child in element:
+        if child.tag == tag:
+            yield child
+
+        elif child.tag in WRAPPERS:
+            yield from iter_own_children(child, tag)
+
+
+IMAGE_RELATIONSHIP: str = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/image"
+RELATIONSHIP: str = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+# the elements referencing the images and the attributes with the relationship identifiers
+IMAGE_REFERENCES: dict[str, str] = {
+    fqdn("a:blip"): fqdn("r:embed"),
+    fqdn("v:imagedata"): fqdn("r:id")}
+
+
+def get_image_id(element: Element) -> str | None:
+    """Gets the relationship identifier if the element references the image."""
+    attribute: str | None = IMAGE_REFERENCES.get(element.tag)
+    return element.get(attribute) if attribute is not None else None
+
+
+class XmlRelationships(XmlFile):
+    def __init__(self, core_document: CoreDocument):
+        super().__init__("word/_rels/document.xml.rels", core_document)
+
+    def images(self) -> dict[str, str]:
+        """Gets the paths to the images in the archive by the relationship identifiers.
+
+        The external images are skipped as they are not stored in the archive.
+        """
+        if self.content is None:
+            self.read()
+
+        return {
+            relationship.get("Id"): normpath(join("word", relationship.get("Target"))).lstrip("/")
+            for relationship in self.content.iter(RELATIONSHIP)
+            if relationship.get("Type") == IMAGE_RELATIONSHIP and relationship.get("TargetMode") != "External"}
+
+
 class XmlFilePart:
-    def __init__(self, tag: str, parent: Element, idx: int | None = None):
+    def __init__(self, tag: str, content: Element, idx: int | None = None):
         if idx is None:
             idx: int = -1
-        self._parent: Element = parent
+
         self._tag: str = tag
         self._index: int = idx
-        self.content: Element | None = None
-        self.read()
-
-    def read(self):
-        if self._index == -1:
-            self.content = list(self._parent.iter(fqdn(self._tag)))[0]
-
-        else:
-            self.content = list(self._parent.iter(fqdn(self._tag)))[self._index]
+        self.content: Element = content
 
-    def get_children_elements(self, tag: str | None = None) -> list[Element]:
-        return list(self.content.iter(fqdn(tag)))
+    def get_children_elements(self, tag: str) -> list[Element]:
+        return list(iter_own_children(self.content, fqdn(tag)))
 
 
 class XmlDocument(XmlFile):
-    def __init__(self, core_document: CoreDocument, tables_dir: StrPath):
+    def __init__(self, core_document: CoreDocument, tables_dir: StrPath, images_dir: StrPath = None):
         self._name: str = "word/document.xml"
         super().__init__(self._name, core_document)
 
         self.tables_dir: Path = Path(tables_dir).resolve()
+        self.images_dir: Path | None = Path(images_dir).resolve() if images_dir is not None else None
+        self._image_ids: set[str] = set()
 
         if not self.tables_dir.exists():
             self.tables_dir.mkdir(parents=True, exist_ok=True)
 
         for file in self.tables_dir.iterdir():
-            file.unlink()
+            if file.is_file():
+                file.unlink()
 
     def __repr__(self):
         return f"<{self.__class__.__name__}({repr(self._core_document)})>"
@@ -122,56 +190,128 @@ class XmlDocument(XmlFile):
     def __str__(self):
         return f"{self.__class__.__name__}: {self._name}"
 
-    def __len__(self):
-        return len(list(self.content.iter(fqdn("w:tbl"))))
-
     def __iter__(self) -> Iterator['XmlTable']:
-        return iter(XmlTable(self, table_index) for table_index in range(len(self)))
+        """Iterates over the tables in the document order traversing the document once.
+
+        The nested tables follow the tables containing them.
+        """
+        for table_index, element in enumerate(self.content.iter(fqdn("w:tbl"))):
+            yield XmlTable(self, table_index, element)
+
+    def iterparse(self) -> Iterator['XmlTable']:
+        """Iterates over the tables while reading the document without building the whole tree.
+
+        Each table is yielded at its end event. The numbers are assigned at the start events,
+        so the tables are numbered in the same order as in the full mode.
+        The processed top-level tables are cleared, and the processed children of the body are removed,
+        so the peak memory depends on the largest table rather than the document size.
+        The nested tables are kept until the tables containing them are processed.
+        """
+        w_body: str = fqdn("w:body")
+        w_tbl: str = fqdn("w:tbl")
+        count: int = 0
+        # the numbers of the tables that are open at the moment
+        indexes: list[int] = []
+        body: Element | None = None
+
+        try:
+            with self.open() as f:
+                for event, element in iterparse(f, ("start", "end")):
+                    if event == "start":
+                        image_id: str | None = get_image_id(element)
+
+                        if image_id is not None:
+                            self._image_ids.add(image_id)
+
+                        elif element.tag == w_tbl:
+                            indexes.append(count)
+                            count += 1
+
+                        elif element.tag == w_body:
+                            body = element
+
+                        continue
 
-    def parse_document(self, line_formatter: LineFormatter):
-        for xml_table in iter(self):
-            xml_table.read()
+                    if element.tag == w_tbl:
+                        yield XmlTable(self, indexes.pop(), element)
+
+                        if not indexes:
+                            element.clear()
+
+                    if body is not None and len(body) and body[-1] is element:
+                        del body[-1]
+
+        except ParseError as e:
+            self._parse_error(e)
+
+    def parse_document(self, line_formatter: LineFormatter, *, stream: bool = False) -> int:
+        count: int = 0
+        xml_tables: Iterator[XmlTable] = self.iterparse() if stream else iter(self)
+
+        for xml_table in xml_tables:
             xml_table.set_lines(line_formatter)
             xml_table.write_to_file()
+            count += 1
+
+        logger.info(f"В директорию {self.tables_dir} записано {count} обработанных таблиц")
+
+        if self.images_dir is not None:
+            if not stream:
+                self._image_ids.update(filter(None, map(get_image_id, self.content.iter())))
 
-        logger.info(f"В директорию {self.tables_dir} записано {len(self)} обработанных таблиц")
+            self.copy_images()
+
+        return count
+
+    def copy_images(self) -> int:
+        """Copies the images referenced in the document from the archive.
+
+        The images are resolved with the document relationships, the unreferenced media files are not read.
+        """
+        if self._image_ids:
+            images: dict[str, str] = XmlRelationships(self._core_document).images()
+            names: set[str] = {images[image_id] for image_id in self._image_ids if image_id in images}
+
+        else:
+            names: set[str] = set()
+
+        self.images_dir.mkdir(parents=True, exist_ok=True)
+
+        for name in sorted(names):
+            self._core_document.copy(name, self.images_dir.joinpath(Path(name).name))
+            logger.debug(f"Скопирован файл {name}")
+
+        logger.info(f"В директорию {self.images_dir} скопировано {len(names)} изображений")
+        return len(names)
 
 
 class XmlTable(XmlFilePart):
-    def __init__(self, xml_document: XmlDocument, table_index: int):
-        tag: str = "w:tbl"
-        super().__init__(tag, xml_document.content, table_index)
+    def __init__(self, xml_document: XmlDocument, table_index: int, content: Element):
+        super().__init__("w:tbl", content, table_index)
         self._table_index: int = self._index
         self._xml_document: XmlDocument = xml_document
+        self._xml_rows: list[XmlTableRow] = [
+            XmlTableRow(self, row_index, element)
+            for row_index, element in enumerate(self.get_children_elements("w:tr"))]
         self._lines: list[str] = []
 
     def __str__(self):
         return "\n".join(self._lines)
 
-    @property
-    def _num_rows(self) -> int:
-        return len(self.get_children_elements("w:tr"))
-
     def __iter__(self):
-        return iter(XmlTableRow(self, row_index) for row_index in range(self._num_rows))
+        return iter(self._xml_rows)
 
     @property
     def xml_rows(self) -> list['XmlTableRow']:
-        return list(iter(self))
+        return self._xml_rows
 
     def __len__(self):
-        return len(self.xml_rows[0])
+        return len(self._xml_rows[0]) if self._xml_rows else 0
 
     def set_lines(self, line_formatter: LineFormatter):
-        content: list[str] = []
-
-        for xml_table_row in self.xml_rows:
-            xml_table_row.read()
-            _: str = " | ".join(xml_table_row.cells_text())
-            content.append(f"| {_} |")
-
+        content: str = "\n".join(f"| {' | '.join(xml_table_row.cells_text())} |" for xml_table_row in iter(self))
         header: str = "|".join(["-----"] * len(self))
-        self._lines = line_formatter.format_lines(content)
+        self._lines = line_formatter.format_text(content).split("\n") if content else []
         self._lines.insert(1, f"|{header}|")
 
     @property
@@ -180,26 +320,14 @@ class XmlTable(XmlFilePart):
 
     def write_to_file(self):
         file_writer(self.md_table_path, str(self))
-        file_path: Path = self._xml_document.tables_dir.joinpath(f"table_{self._table_index + 1}.md")
-
-        if not file_path.exists():
-            file_path.touch(exist_ok=True)
-
-        with open(file_path, "w+", encoding="utf-8") as f:
-            f.write(str(self))
-
-        logger.debug(f"Записан файл {file_path}")
+        logger.debug(f"Записан файл {self.md_table_path}")
 
 
 class XmlTableRow(XmlFilePart):
-    def __init__(self, xml_table: XmlTable, row_index: int):
-        self._tag = "w:tr"
-        super().__init__(self._tag, xml_table.content, row_index)
-        self._index: int = row_index
-
-    @property
-    def _cells(self) -> list[Element]:
-        return self.get_children_elements("w:tc")
+    def __init__(self, xml_table: XmlTable, row_index: int, content: Element):
+        super().__init__("w:tr", content, row_index)
+        self._xml_table: XmlTable = xml_table
+        self._cells: list[Element] = self.get_children_elements("w:tc")
 
     def __len__(self):
         return len(self._cells)
@@ -4,7 +4,16 @@ from typing import Iterable
 
 from xml.etree.ElementTree import Element
 
-from utilities.convert_tables.qualified_name import _ns, fqdn
+from utilities.convert_tables.qualified_name import fqdn
+
+W_B: str = fqdn("w:b")
+W_I: str = fqdn("w:i")
+W_P: str = fqdn("w:p")
+W_R: str = fqdn("w:r")
+W_R_PR: str = fqdn("w:rPr")
+W_T: str = fqdn("w:t")
+W_VAL: str = fqdn("w:val")
+W_VERT_ALIGN: str = fqdn("w:vertAlign")
 
 
 class Formatting(Enum):
@@ -22,10 +31,10 @@ class Formatting(Enum):
     @classmethod
     def from_tag(cls, tag: str):
         _conversion_dict: dict[str, str] = {
-            fqdn("w:b"): "bold",
-            fqdn("w:i"): "italic",
-            fqdn("superscript"): "superscript",
-            fqdn("subscript"): "subscript"}
+            W_B: "bold",
+            W_I: "italic",
+            "superscript": "superscript",
+            "subscript": "subscript"}
         return cls(_conversion_dict.get(tag))
 
 
@@ -53,9 +62,9 @@ def find_children(element: Element, tags: Iterable[str] = None) -> set[str] | No
 
 
 def get_run_text(r: Element) -> dict[str, list[Formatting]]:
-    tags: tuple[str, ...] = (fqdn("w:b"), fqdn("w:i"), fqdn("w:vertAlign"))
-    r_pr: Element | None = r.find(fqdn("w:rPr"), _ns)
-    t: Element | None = r.find(fqdn("w:t"), _ns)
+    tags: tuple[str, ...] = (W_B, W_I, W_VERT_ALIGN)
+    r_pr: Element | None = r.find(W_R_PR)
+    t: Element | None = r.find(W_T)
     text: str = t.text if t is not None else ""
 
     if r_pr is None:
@@ -63,14 +72,14 @@ def get_run_text(r: Element) -> dict[str, list[Formatting]]:
 
     _formats: list[str] = [*find_children(r_pr, tags)]
 
-    if fqdn("w:vertAlign") in _formats:
-        vert_align: Element = r_pr.find(fqdn("w:vertAlign"), _ns)
-        w_val: str = vert_align.get(fqdn("w:val"))
+    if W_VERT_ALIGN in _formats:
+        vert_align: Element = r_pr.find(W_VERT_ALIGN)
+        w_val: str = vert_align.get(W_VAL)
 
         if w_val != "baseline":
             _formats.append(w_val)
 
-        _formats.remove(fqdn("w:vertAlign"))
+        _formats.remove(W_VERT_ALIGN)
 
     if not _formats:
         return {text: [Formatting.NONE]}
@@ -82,7 +91,7 @@ def get_run_text(r: Element) -> dict[str, list[Formatting]]:
 def get_paragraph_text(p: Element) -> str:
     lines: list[str] = [
         frame_line(k, v)
-        for r in p.findall(fqdn("w:r"), _ns)
+        for r in p.findall(W_R)
         for k, v in get_run_text(r).items()]
 
     return "".join(lines)
@@ -91,4 +100,4 @@ def get_paragraph_text(p: Element) -> str:
 def get_all_text(element: Element) -> str:
     return "<br>".join(
         get_paragraph_text(p)
-        for p in element.findall(fqdn("w:p"), _ns))
+        for p in element.findall(W_P))
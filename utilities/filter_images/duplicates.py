@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable
+
+from loguru import logger
+
+from utilities.common.functions import file_hash
+from utilities.filter_images.file import File
+
+
+def find_duplicates(images: Iterable[Path], *, jobs: int = None) -> list[list[Path]]:
+    """Finds the groups of the byte-identical images.
+
+    The images are grouped by the size first, and only the images with the same size are hashed.
+    The hashing is performed in the thread pool, since reading the files releases the GIL.
+
+    :param images: The paths to the images.
+    :type images: Iterable[Path]
+    :param jobs: The number of the threads. By default, chosen by ThreadPoolExecutor.
+    :type jobs: int
+    :return: The sorted groups of the paths with the identical content, each group is sorted as well.
+    :rtype: list[list[Path]]
+    """
+    sizes: dict[int, list[Path]] = {}
+
+    for image in images:
+        sizes.setdefault(image.stat().st_size, []).append(image)
+
+    candidates: list[Path] = [image for group in sizes.values() if len(group) > 1 for image in group]
+    logger.debug(f"Изображений с совпадающим размером: {len(candidates)}")
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        hashes: list[str] = [*executor.map(file_hash, candidates)]
+
+    groups: dict[str, list[Path]] = {}
+
+    for image, _hash in zip(candidates, hashes):
+        groups.setdefault(_hash, []).append(image)
+
+    return sorted(sorted(group) for group in groups.values() if len(group) > 1)
+
+
+def find_references(files: Iterable[File]) -> dict[Path, list[Path]]:
+    """Gets the text files referencing every image."""
+    references: dict[Path, list[Path]] = {}
+
+    for file in files:
+        for image in {file.resolve_link(link) for link in file.links()}:
+            references.setdefault(image, []).append(file.path)
+
+    return references
+
+
+def rewrite_duplicates(files: Iterable[File], duplicates: Iterable[list[Path]]) -> int:
+    """Replaces the links to the duplicate images with the links to the first image in each group.
+
+    :param files: The text files to modify.
+    :type files: Iterable[File]
+    :param duplicates: The groups of the identical images.
+    :type duplicates: Iterable[list[Path]]
+    :return: The number of the replaced links.
+    :rtype: int
+    """
+    replacements: dict[Path, Path] = {
+        image: group[0]
+        for group in duplicates
+        for image in group[1:]}
+
+    return sum(file.rewrite_links(replacements) for file in files) if replacements else 0
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+from functools import cached_property
+from os.path import relpath
+from pathlib import Path
+from re import compile, Match, Pattern
+from typing import Iterator, Mapping
+
+from utilities.common.functions import file_writer
+from utilities.common.shared import INDEX_STEMS, StrPath
+
+
+class File:
+    pattern: Pattern = None
+
+    def __init__(self, path: StrPath):
+        self._path: Path = Path(path).resolve()
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the lines reading the file lazily, so the whole content is never stored."""
+        with open(self._path, "r", encoding="utf-8", errors="ignore") as f:
+            yield from f
+
+    def __bool__(self):
+        return self._path.stem in INDEX_STEMS
+
+    def links(self) -> Iterator[str]:
+        for line in iter(self):
+            for m in self.__class__.pattern.finditer(line):
+                yield m.group(1)
+
+    @property
+    def full_links(self) -> list[Path]:
+        return []
+
+    def fix_link(self, link: str):
+        return Path(link).resolve() if bool(self) else Path(link.removeprefix("../"))
+
+    @property
+    def base(self) -> Path:
+        """The directory the image links are relative to."""
+        return self._path.parent
+
+    def resolve_link(self, link: str) -> Path:
+        """Gets the absolute path to the image."""
+        return self.base.joinpath(link).resolve()
+
+    def make_link(self, image: Path) -> str:
+        """Gets the link to the image, inverse to resolve_link."""
+        return Path(relpath(image, self.base)).as_posix()
+
+    def rewrite_links(self, replacements: Mapping[Path, Path]) -> int:
+        """Replaces the links to the images with the links to the other images.
+
+        :param replacements: The new images by the images to replace.
+        :type replacements: Mapping[Path, Path]
+        :return: The number of the replaced links.
+        :rtype: int
+        """
+        count: int = 0
+
+        def replace(m: Match) -> str:
+            nonlocal count
+            image: Path | None = replacements.get(self.resolve_link(m.group(1)))
+
+            if image is None:
+                return m.group(0)
+
+            count += 1
+            start, end = m.start(1) - m.start(0), m.end(1) - m.start(0)
+            return f"{m.group(0)[:start]}{self.make_link(image)}{m.group(0)[end:]}"
+
+        lines: list[str] = [self.__class__.pattern.sub(replace, line) for line in iter(self)]
+
+        if count:
+            file_writer(self._path, lines)
+
+        return count
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+
+class MdFile(File):
+    pattern: Pattern = compile(r"!\[.*?\]\((.+?)\)")
+
+    @property
+    def full_links(self):
+        return [self.fix_link(link) for link in self.links()]
+
+    def resolve_link(self, link: str) -> Path:
+        # the pages except the index ones are rendered one level deeper
+        return super().resolve_link(link if bool(self) else link.removeprefix("../"))
+
+    def make_link(self, image: Path) -> str:
+        link: str = super().make_link(image)
+        return link if bool(self) else f"../{link}"
+
+
+class AsciiDocFile(File):
+    pattern: Pattern = compile(r"image:+(.+?)\[.*?\]")
+
+    def parse_imagesdir(self, line: str) -> Path | None:
+        if line.startswith("ifndef::imagesdir") and ":imagesdir:" in (
+                line_shorten := line.removeprefix("ifndef::imagesdir")):
+            imagesdir: str = line_shorten.removeprefix("[:imagesdir:").strip().removesuffix("]")
+            return self._path.parent.joinpath(imagesdir).resolve()
+
+        else:
+            return None
+
+    @property
+    def full_links(self):
+        """Gets the image paths reading the file once.
+
+        The imagesdir attribute may be specified after the links, so the links are resolved at the end.
+        """
+        imagesdir: Path | None = None
+        links: list[str] = []
+
+        for line in iter(self):
+            if imagesdir is None:
+                imagesdir: Path | None = self.parse_imagesdir(line)
+
+            links.extend(m.group(1) for m in self.__class__.pattern.finditer(line))
+
+        if imagesdir is None:
+            imagesdir: Path = self._path.parent.resolve()
+
+        return [imagesdir.joinpath(link).resolve() for link in links]
+
+    @cached_property
+    def base(self) -> Path:
+        for line in iter(self):
+            imagesdir: Path | None = self.parse_imagesdir(line)
+
+            if imagesdir is not None:
+                return imagesdir
+
+        else:
+            return self._path.parent.resolve()
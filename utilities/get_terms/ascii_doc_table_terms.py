@@ -1,51 +1,68 @@
 # -*- coding: utf-8 -*-
-from bisect import bisect_left
-from re import fullmatch
+from bisect import bisect_left, bisect_right
 from typing import Iterable
 
 from loguru import logger
 from more_itertools import pairwise
 
-from utilities.common.errors import GetTermsAsciiDocFileTableRowIndexError, GetTermsEmptyFileError, \
-    GetTermsInvalidTermIndexError
+from utilities.common.errors import GetTermsEmptyFileError, GetTermsInvalidTermIndexError
 from utilities.common.functions import file_reader
 from utilities.common.shared import StrPath
-from utilities.get_terms.table import Coordinate, TableItem, Term
+from utilities.get_terms.prefix_trie import PrefixTrie
+from utilities.get_terms.table import Term
 
 
 class AsciiDocTableTerms:
+    """Class to represent the table of the terms.
+
+    The terms are looked up by the abbreviations case-insensitively.
+    The integer indexes follow the lexicographical order of the abbreviations, not the order in the file.
+    """
+
     def __init__(self, lines: Iterable[str] = None):
         if lines is None:
             lines: list[str] = []
 
         self._content: list[str] = [*lines]
-        self._items: dict[Coordinate, TableItem] = {}
+        self._rows: list[Term] = []
         self._dict_terms: dict[str, tuple[Term, ...]] = {}
+        self._sorted_keys: list[str] = []
+        self._prefix_trie: PrefixTrie = PrefixTrie()
 
     @classmethod
     def from_file(cls, file_path: StrPath):
         _content: list[str] = file_reader(file_path, "lines", encoding="utf-8")
+        return cls.from_lines(_content, file_path)
 
+    @classmethod
+    def from_lines(cls, _content: list[str], name: StrPath = None):
         if not _content or len(_content) < 6:
-            logger.error(f"Файл {file_path} пуст")
+            logger.error(f"Файл {name} пуст")
             raise GetTermsEmptyFileError
 
         else:
             lines: list[str] = _content[6:-1]
             return cls(lines)
 
+    @classmethod
+    def from_terms(cls, terms: Iterable[Term]):
+        """Generates the table from the already parsed terms without the AsciiDoc processing."""
+        ascii_doc_table_terms: AsciiDocTableTerms = cls()
+        ascii_doc_table_terms._rows.extend(terms)
+        return ascii_doc_table_terms
+
     def __str__(self):
         return f"{self._content}"
 
     def __repr__(self):
-        return f"<{self.__class__.__name__}>({self._items.items()})"
+        return f"<{self.__class__.__name__}>({self._rows})"
 
     def set_terms(self):
-        _: list[Term] = [Term(*self._get_row_item(row_index)) for row_index in range(self.max_row)]
         _dict_proxy: dict[str, list[Term]] = {}
 
-        for term in _:
-            term_short: str = term.short
+        for term in self._rows:
+            # the keys are stripped the same way as the abbreviations searched by TermsScanner
+            term_short: str = term.short.strip()
 
             if term_short not in _dict_proxy:
                 _dict_proxy[term_short] = []
@@ -54,12 +71,22 @@ class AsciiDocTableTerms:
 
         _dict_terms: dict[str, tuple[Term, ...]] = {k.upper(): (*v,) for k, v in _dict_proxy.items()}
         self._dict_terms.update(**_dict_terms)
+        self.set_index()
 
         logger.debug("Файл обработан успешно")
 
+    def set_index(self):
+        """Specifies the indexes for the lookups.
+
+        The dictionary is used for the exact matches, the sorted list is used for the range queries,
+        and the prefix tree is used for the prefix queries.
+        """
+        self._sorted_keys = sorted(self._dict_terms)
+        self._prefix_trie = PrefixTrie(self._sorted_keys)
+
     def __getitem__(self, item):
         if isinstance(item, str):
-            return self._binary_search(item.upper())
+            return self._dict_terms.get(item.upper(), (Term(),))
 
         elif isinstance(item, int):
             _term_short: str | None = self._index_to_key(item)
@@ -80,7 +107,7 @@ class AsciiDocTableTerms:
 
     def __contains__(self, item):
         if isinstance(item, str):
-            return item in self._dict_terms
+            return item.upper() in self._dict_terms
 
         else:
             return False
@@ -92,83 +119,48 @@ class AsciiDocTableTerms:
         return iter(self._dict_terms.keys())
 
     @property
-    def _keys(self):
-        return list(iter(self))
+    def _keys(self) -> list[str]:
+        return self._sorted_keys
 
     def _index_to_key(self, index: int | None):
-        return self._keys[index] if index is not None else None
-
-    def terms_short(self) -> tuple[str, ...]:
-        return tuple(map(lambda x: x.upper(), iter(self)))
-
-    def _binary_search(
-            self,
-            search_value: str,
-            min_index: int = 0,
-            max_index: int = None) -> tuple[Term, ...]:
-        """
-        Specifies the binary search to accelerate the common one.
-
-        :param str search_value: the value to search
-        :param int min_index: the lower bound, default = 0
-        :param max_index: the higher bound, default = len(values)
-        :return: the searched value position in the list if the value is in the list.
-        :rtype: tuple[Term, ...]
-        """
-        if max_index is None:
-            max_index: int = len(self)
-
-        _index: int = bisect_left(self._keys, search_value, min_index, max_index)
-        _term_short: str = self._index_to_key(_index)
-
-        if _index != max_index and _term_short == search_value:
-            return self._dict_terms.get(_term_short)
-
-        else:
-            return Term()
-
-    def _get_row_item(self, row_index: int) -> list[str | None]:
-        return [v.text for v in self._get_row(row_index)]
-
-    def _get_row(self, row_index: int) -> list[TableItem]:
-        if row_index > self.max_row:
-            logger.error(f"Индекс строки {row_index} превышает максимально возможное значение")
-            raise GetTermsAsciiDocFileTableRowIndexError
+        if index is None or not 0 <= index < len(self._sorted_keys):
+            return None
 
         else:
-            return [v for k, v in self._items.items() if k.row_index == row_index]
+            return self._sorted_keys[index]
 
-    @property
-    def max_row(self) -> int:
-        return max(_.row_index for _ in self._items.keys())
-
-    def _find_header(self) -> int:
-        HEADER_PATTERN: str = r"\|(.*)\|(.*)\|(.*)\|(.*)\n"
+    def terms_short(self) -> tuple[str, ...]:
+        return tuple(self._sorted_keys)
 
-        for index, line in enumerate(iter(self._content)):
-            if fullmatch(HEADER_PATTERN, line):
-                return index
+    def terms_range(self, start: str, stop: str) -> list[str]:
+        """Gets the abbreviations in the range [start, stop] in the lexicographical order."""
+        _from: int = bisect_left(self._sorted_keys, start.upper())
+        _to: int = bisect_right(self._sorted_keys, stop.upper())
+        return self._sorted_keys[_from:_to]
 
-        else:
-            return 2
+    def terms_prefix(self, prefix: str) -> list[str]:
+        """Gets the abbreviations beginning with the prefix in the lexicographical order."""
+        return list(self._prefix_trie.starts_with(prefix.upper()))
 
     def complete(self):
-        header_line: str = self._content[self._find_header()]
-        _: list[str] = header_line.split("|")
+        """Splits the table into rows and converts each one to the term at once."""
+        self._rows.clear()
 
         _empty: list[int] = [index for index, line in enumerate(self._content) if line == "\n"]
 
-        for row_index, (_from, _to) in enumerate(pairwise(_empty[1:-1])):
-            lines: list[str] = [content.strip("\n") for content in self._content[_from + 1:_to]]
-            _: list[str] = "".join(lines).split("|")
+        for _from, _to in pairwise(_empty[1:-1]):
+            if _to - _from < 2:
+                continue
 
-            for column_index, text in enumerate(_[1:]):
-                _key: Coordinate = Coordinate(row_index, column_index)
-                _value: TableItem = TableItem(row_index, column_index, text.strip("|"))
-                self._items[_key] = _value
+            _: list[str] = "".join(content.strip("\n") for content in self._content[_from + 1:_to]).split("|")
+            self._rows.append(Term(*(text.strip("|") for text in _[1:])))
 
         logger.debug(f"Словарь {self.__class__.__name__} инициализирован")
 
     @property
     def dict_terms(self):
         return self._dict_terms
+
+    @property
+    def rows(self):
+        return self._rows
@@ -1,34 +1,48 @@
 # -*- coding: utf-8 -*-
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from shutil import copyfile, move
 
 from click.utils import get_app_dir
+from httpx import Client, codes, HTTPError, Response
 from loguru import logger
 
 from utilities.common.config_file import config_file
-from utilities.common.functions import file_reader, file_writer, GitFile
-from utilities.common.shared import StrPath
-
-
-def parse_version(file: StrPath) -> str | None:
-    return file_reader(file, "string") if Path(file).exists() else None
+from utilities.common.errors import GetTermsDownloadError
+from utilities.common.functions import GitFile
+from utilities.get_terms.ascii_doc_table_terms import AsciiDocTableTerms
+from utilities.get_terms.glossary_cache import GlossaryCache
 
 
 class GitManager:
     TEMPORARY: Path = Path(get_app_dir("utilities"))
     TEMPORARY_TERMS: Path = TEMPORARY.joinpath("terms")
-
-    TEMP_VERSION: Path = TEMPORARY.joinpath("__version__.txt")
-    TEMP_TERMS_VERSION: Path = TEMPORARY_TERMS.joinpath("__version__.txt")
-    TEMP_TERMS: Path = TEMPORARY.joinpath("terms.adoc")
-    TEMP_TERMS_BASIC: Path = TEMPORARY_TERMS.joinpath("terms.adoc")
-
-    def __init__(self):
-        self._lines: list[str] = []
-        self._content_git_terms: GitFile | None = None
-        self._content_git_version: GitFile | None = None
-
-        self.TEMPORARY_TERMS.mkdir(parents=True, exist_ok=True)
+    TERMS_CACHE: Path = TEMPORARY_TERMS.joinpath("terms.cache")
+
+    def __init__(
+            self, *,
+            scheme: str = "https",
+            host: str = None,
+            port: int = 443,
+            project_id: int = None,
+            cache_path: Path = None):
+        if host is None:
+            host: str = config_file.get_commands("get-terms", "host")
+
+        if project_id is None:
+            project_id: int = config_file.get_commands("get-terms", "project_id")
+
+        if cache_path is None:
+            cache_path: Path = self.TERMS_CACHE
+
+        kwargs: dict[str, str | int] = {"scheme": scheme, "host": host, "port": port}
+
+        self._git_terms: GitFile = GitFile(config_file.get_commands("get-terms", "terms_file"), project_id, **kwargs)
+        self._git_version: GitFile = GitFile(
+            config_file.get_commands("get-terms", "version_file"), project_id, **kwargs)
+        self._glossary_cache: GlossaryCache = GlossaryCache(cache_path)
+        self._version_timeout: float = config_file.get_commands("get-terms", "version_timeout")
+        self._download_timeout: float = config_file.get_commands("get-terms", "download_timeout")
+        self._cache_ttl: float = config_file.get_commands("get-terms", "cache_ttl")
 
     def __str__(self):
         return f"<{self.__class__.__name__}>"
@@ -49,48 +63,117 @@ class GitManager:
         else:
             return NotImplemented
 
-    def set_content_git_files(self):
-        content_git_terms: GitFile = GitFile(
-            config_file.get_commands("get-terms", "terms_file"),
-            config_file.get_commands("get-terms", "project_id"))
-        content_git_terms.download()
-        self._content_git_terms = content_git_terms
-
-        content_git_version: GitFile = GitFile(
-            config_file.get_commands("get-terms", "version_file"),
-            config_file.get_commands("get-terms", "project_id"))
-        content_git_version.download()
-        self._content_git_version = content_git_version
-
-    def compare_versions(self):
-        v1: str = parse_version(self.TEMP_TERMS_VERSION)
-        v2: str = parse_version(self.TEMP_VERSION)
-
-        if v1 is None:
-            message: str = "Файл версии не найден"
-            copyfile(self.TEMP_VERSION, self.TEMP_TERMS_VERSION)
-
-        elif v1 != v2:
-            message: str = f"Текущая версия: {v1}\nПоследняя версия: {v2}"
-            move(self.TEMP_VERSION, self.TEMP_TERMS_VERSION)
-
-        elif not Path(self.TEMP_TERMS_BASIC).exists():
-            message: str = "Файл с терминами не найден"
-
-        else:
-            logger.debug("Версия актуальна")
-            return
-
-        logger.warning(message)
-        logger.info(f"Файл с версией {self.TEMP_TERMS_VERSION} обновлен")
-
-    def set_terms(self):
-        file_writer(self.TEMP_TERMS_BASIC, self._content_git_terms.content)
-        lines: list[str] = file_reader(self.TEMP_TERMS_BASIC, "lines", encoding="utf-8")
-        self._lines = lines[6:-1]
-
-    def __iter__(self):
-        return iter(self._lines)
-
-
-git_manager: GitManager = GitManager()
+    def check_version(self, client: Client) -> tuple[bool, str | None, str | None]:
+        """Requests the version file if it has been modified since the cached one.
+
+        :param client: The shared HTTP client.
+        :type client: Client
+        :return: The flag if the version is changed, the version, and the ETag of the response.
+        :rtype: tuple[bool, str or None, str or None]
+        """
+        headers: dict[str, str] = {}
+
+        if self._glossary_cache.etag is not None:
+            headers["If-None-Match"] = self._glossary_cache.etag
+
+        response: Response = self._git_version.fetch(client, timeout=self._version_timeout, headers=headers)
+
+        if response.status_code == codes.NOT_MODIFIED:
+            logger.debug("Файл версии не изменен")
+            return False, self._glossary_cache.version, self._glossary_cache.etag
+
+        response.raise_for_status()
+        version: str = response.text.strip()
+        return version != self._glossary_cache.version, version, response.headers.get("ETag")
+
+    def download(
+            self,
+            client: Client,
+            version: str | None = None,
+            etag: str | None = None) -> tuple[str, str, str | None]:
+        """Downloads the terms and version files concurrently.
+
+        If the version has been already got, see check_version, only the terms file is downloaded.
+
+        :param client: The shared HTTP client.
+        :type client: Client
+        :param version: The version got from the repository.
+        :type version: str or None
+        :param etag: The ETag of the version file response.
+        :type etag: str or None
+        :return: The terms file content, the version, and the ETag of the version file response.
+        :rtype: tuple[str, str, str or None]
+        """
+        if version is not None:
+            response_terms: Response = self._git_terms.fetch(
+                client, timeout=self._download_timeout).raise_for_status()
+            logger.debug(f"Файл {self._git_terms.path} загружен")
+            return response_terms.text, version, etag
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future_terms: Future = executor.submit(self._git_terms.fetch, client, timeout=self._download_timeout)
+            future_version: Future = executor.submit(
+                self._git_version.fetch, client, timeout=self._download_timeout)
+            response_terms: Response = future_terms.result().raise_for_status()
+            response_version: Response = future_version.result().raise_for_status()
+
+        logger.debug(f"Файлы {self._git_terms.path} и {self._git_version.path} загружены")
+        return response_terms.text, response_version.text.strip(), response_version.headers.get("ETag")
+
+    def get_table(self, *, refresh: bool = False) -> AsciiDocTableTerms:
+        """Gets the terms table from the cache if it is actual, otherwise, from the repository.
+
+        The version is not checked if the cache has been checked less than cache_ttl seconds ago.
+        If the repository is not available, the cached glossary is used.
+
+        :param refresh: The flag to ignore the cache and to download the terms file.
+        :type refresh: bool
+        :return: The terms table with the specified terms.
+        :rtype: AsciiDocTableTerms
+        """
+        is_cached: bool = not refresh and self._glossary_cache.load()
+
+        if is_cached and self._glossary_cache.is_fresh(self._cache_ttl):
+            logger.debug(f"Используется кэш словаря, версия {self._glossary_cache.version}")
+            return self._from_cache()
+
+        version: str | None = None
+        etag: str | None = None
+
+        try:
+            with Client(follow_redirects=True) as client:
+                if is_cached:
+                    is_modified, version, etag = self.check_version(client)
+
+                    if not is_modified:
+                        logger.debug("Версия актуальна")
+                        self._glossary_cache.touch()
+                        return self._from_cache()
+
+                    logger.info(f"Текущая версия: {self._glossary_cache.version}\nПоследняя версия: {version}")
+
+                content, version, etag = self.download(client, version, etag)
+
+        except HTTPError as e:
+            if is_cached:
+                logger.warning(
+                    f"Не удалось проверить версию словаря, {e.__class__.__name__}: {e}\n"
+                    f"Используется кэш, версия {self._glossary_cache.version}")
+                return self._from_cache()
+
+            else:
+                logger.error(f"Не удалось загрузить файл с терминами, {e.__class__.__name__}: {e}")
+                raise GetTermsDownloadError
+
+        ascii_doc_table: AsciiDocTableTerms = AsciiDocTableTerms.from_lines(
+            content.splitlines(keepends=True), self._git_terms.path)
+        ascii_doc_table.complete()
+        ascii_doc_table.set_terms()
+
+        self._glossary_cache.update(version, etag, ascii_doc_table.rows)
+        return ascii_doc_table
+
+    def _from_cache(self) -> AsciiDocTableTerms:
+        ascii_doc_table: AsciiDocTableTerms = AsciiDocTableTerms.from_terms(self._glossary_cache.terms)
+        ascii_doc_table.set_terms()
+        return ascii_doc_table
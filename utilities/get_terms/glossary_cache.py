@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+from os import replace
+from pathlib import Path
+from pickle import dump, HIGHEST_PROTOCOL, load, UnpicklingError
+from time import time
+from typing import Iterable, TypeAlias
+
+from loguru import logger
+
+from utilities.common.shared import StrPath
+from utilities.get_terms.table import Term
+
+# increased if the format of the cached rows is changed
+CACHE_FORMAT: int = 1
+
+RowType: TypeAlias = tuple[str | None, str | None, str | None, str | None]
+
+
+class GlossaryCache:
+    """Class to represent the parsed glossary stored on the disk.
+
+    The cache keeps the rows of the terms table, the version of the table in the repository,
+    the ETag of the version file response, and the time of the last version check.
+    """
+
+    def __init__(self, path: StrPath):
+        self._path: Path = Path(path).expanduser()
+        self._version: str | None = None
+        self._etag: str | None = None
+        self._checked: float = 0.0
+        self._rows: tuple[RowType, ...] = ()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}({self._path}, {self._version})>"
+
+    def __bool__(self):
+        return bool(self._rows)
+
+    def load(self) -> bool:
+        """Reads the cache file.
+
+        :return: The flag if the cache is read successfully.
+        :rtype: bool
+        """
+        if not self._path.exists():
+            logger.debug(f"Кэш словаря {self._path} не найден")
+            return False
+
+        try:
+            with open(self._path, "rb") as f:
+                content: dict = load(f)
+
+        except (OSError, EOFError, UnpicklingError, AttributeError, ValueError) as e:
+            logger.debug(f"Не удалось прочитать кэш словаря {self._path}, {e.__class__.__name__}: {e}")
+            return False
+
+        if not isinstance(content, dict) or content.get("format") != CACHE_FORMAT:
+            logger.debug(f"Формат кэша словаря {self._path} устарел")
+            return False
+
+        self._version = content.get("version")
+        self._etag = content.get("etag")
+        self._checked = content.get("checked", 0.0)
+        self._rows = content.get("rows", ())
+        return bool(self)
+
+    def save(self):
+        """Writes the cache file atomically."""
+        content: dict = {
+            "format": CACHE_FORMAT,
+            "version": self._version,
+            "etag": self._etag,
+            "checked": self._checked,
+            "rows": self._rows}
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path: Path = self._path.with_name(f"{self._path.name}.tmp")
+
+        try:
+            with open(temp_path, "wb") as f:
+                dump(content, f, protocol=HIGHEST_PROTOCOL)
+
+            replace(temp_path, self._path)
+
+        except OSError as e:
+            logger.warning(f"Не удалось сохранить кэш словаря {self._path}, {e.__class__.__name__}: {e}")
+            temp_path.unlink(missing_ok=True)
+
+        else:
+            logger.debug(f"Кэш словаря {self._path} сохранен")
+
+    def update(self, version: str | None, etag: str | None, terms: Iterable[Term]):
+        """Replaces the cached glossary."""
+        self._version = version
+        self._etag = etag
+        self._rows = tuple(tuple(term) for term in terms)
+        self.touch()
+
+    def touch(self):
+        """Marks the cached glossary as checked just now."""
+        self._checked = time()
+        self.save()
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Checks if the version has been checked less than ttl seconds ago."""
+        return bool(self) and 0 <= time() - self._checked < ttl
+
+    @property
+    def terms(self) -> list[Term]:
+        return [Term(*row) for row in self._rows]
+
+    @property
+    def version(self):
+        return self._version
+
+    @property
+    def etag(self):
+        return self._etag
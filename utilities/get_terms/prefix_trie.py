@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+from re import escape
+from typing import Iterable, Iterator
+
+
+class PrefixTrie:
+    """Class to represent the prefix tree of the term abbreviations.
+
+    Each node is a dictionary of the next characters.
+    The key END marks that the path from the root to the node is a complete abbreviation.
+    """
+    END: str = ""
+
+    def __init__(self, keys: Iterable[str] = None):
+        self._root: dict[str, dict] = {}
+        self._size: int = 0
+
+        if keys is not None:
+            for key in keys:
+                self.add(key)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}({self._size})>"
+
+    def __len__(self):
+        return self._size
+
+    def add(self, key: str):
+        """Adds the abbreviation to the tree."""
+        node: dict[str, dict] = self._root
+
+        for char in key:
+            node = node.setdefault(char, {})
+
+        if self.END not in node:
+            node[self.END] = {}
+            self._size += 1
+
+    def _find_node(self, prefix: str) -> dict[str, dict] | None:
+        node: dict[str, dict] = self._root
+
+        for char in prefix:
+            node = node.get(char)
+
+            if node is None:
+                return None
+
+        return node
+
+    def __contains__(self, item):
+        if not isinstance(item, str):
+            return False
+
+        node: dict[str, dict] | None = self._find_node(item)
+        return node is not None and self.END in node
+
+    def starts_with(self, prefix: str) -> Iterator[str]:
+        """Iterates over the abbreviations beginning with the prefix in the lexicographical order."""
+        node: dict[str, dict] | None = self._find_node(prefix)
+
+        if node is None:
+            return
+
+        stack: list[tuple[str, dict[str, dict]]] = [(prefix, node)]
+
+        while stack:
+            key, node = stack.pop()
+
+            if self.END in node:
+                yield key
+
+            # reversed to pop the lexicographically smallest character first
+            for char in sorted(node, reverse=True):
+                if char != self.END:
+                    stack.append((f"{key}{char}", node[char]))
+
+    def pattern(self) -> str:
+        """Converts the tree to the regular expression matching any of the abbreviations.
+
+        The common prefixes are merged, so the expression does not try every abbreviation
+        at every position of the text.
+        """
+        return self._node_pattern(self._root)
+
+    def _node_pattern(self, node: dict[str, dict]) -> str:
+        alternatives: list[str] = [
+            f"{escape(char)}{self._node_pattern(node[char])}"
+            for char in sorted(node)
+            if char != self.END]
+
+        if not alternatives:
+            return ""
+
+        elif len(alternatives) == 1 and self.END not in node:
+            return alternatives[0]
+
+        group: str = f"(?:{'|'.join(alternatives)})"
+        return f"{group}?" if self.END in node else group
@@ -67,144 +67,3 @@ class Term(NamedTuple):
     @check_bool
     def formatted(self) -> str:
         return f"{self.short}\n{self._formatting_description()}"
-
-
-class Coordinate(NamedTuple):
-    row_index: int
-    column_index: int
-
-    def __str__(self):
-        return f"({self.row_index}, {self.column_index})"
-
-    def __repr__(self):
-        return f"<{self.__class__.__name__}({self.row_index}, {self.column_index})>"
-
-    def __eq__(self, other):
-        if isinstance(other, self.__class__):
-            return (self.row_index, self.column_index) == (other.row_index, other.column_index)
-
-        else:
-            return False
-
-    def __ne__(self, other):
-        if isinstance(other, self.__class__):
-            return (self.row_index, self.column_index) != (other.row_index, other.column_index)
-
-        else:
-            return False
-
-    def __lt__(self, other):
-        if not isinstance(other, self.__class__):
-            return NotImplemented
-
-        elif self.row_index == other.row_index:
-            return self.column_index < other.column_index
-
-        elif self.column_index == other.column_index:
-            return self.row_index < other.row_index
-
-        else:
-            return False
-
-    def __gt__(self, other):
-        if not isinstance(other, self.__class__):
-            return NotImplemented
-
-        elif self.row_index == other.row_index:
-            return self.column_index > other.column_index
-
-        elif self.column_index == other.column_index:
-            return self.row_index > other.row_index
-
-        else:
-            return False
-
-    def __le__(self, other):
-        if not isinstance(other, self.__class__):
-            return NotImplemented
-
-        elif self.row_index == other.row_index:
-            return self.column_index <= other.column_index
-
-        elif self.column_index == other.column_index:
-            return self.row_index <= other.row_index
-
-        else:
-            return False
-
-    def __ge__(self, other):
-        if not isinstance(other, self.__class__):
-            return NotImplemented
-
-        elif self.row_index == other.row_index:
-            return self.column_index >= other.column_index
-
-        elif self.column_index == other.column_index:
-            return self.row_index >= other.row_index
-
-        else:
-            return False
-
-    def __bool__(self):
-        return (self.row_index, self.column_index) == (-1, -1)
-
-
-class TableItem(NamedTuple):
-    row_index: int = -1
-    column_index: int = -1
-    text: str | None = None
-
-    @property
-    def coord(self) -> Coordinate:
-        return Coordinate(self.row_index, self.column_index)
-
-    def __str__(self):
-        return f"{self.text}"
-
-    def __repr__(self):
-        return f"<{self.__class__.__name__}({self.row_index}, {self.column_index}, {self.text})>"
-
-    def __bool__(self):
-        return bool(self.text)
-
-    def __eq__(self, other):
-        if isinstance(other, self.__class__):
-            return self.coord == other.coord
-
-        else:
-            return False
-
-    def __ne__(self, other):
-        if isinstance(other, self.__class__):
-            return self.coord != other.coord
-
-        else:
-            return False
-
-    def __lt__(self, other):
-        if isinstance(other, self.__class__):
-            return self.coord < other.coord
-
-        else:
-            return NotImplemented
-
-    def __gt__(self, other):
-        if isinstance(other, self.__class__):
-            return self.coord > other.coord
-
-        else:
-            return NotImplemented
-
-    def __le__(self, other):
-        if isinstance(other, self.__class__):
-            return self.coord <= other.coord
-
-        else:
-            return NotImplemented
-
-    def __ge__(self, other):
-        if isinstance(other, self.__class__):
-            return self.coord >= other.coord
-
-        else:
-            return NotImplemented
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+from re import compile, Pattern
+
+from loguru import logger
+
+from utilities.common.functions import file_reader
+from utilities.common.shared import StrPath
+from utilities.get_terms.ascii_doc_table_terms import AsciiDocTableTerms
+from utilities.get_terms.prefix_trie import PrefixTrie
+from utilities.get_terms.table import Term
+
+
+class TermsScanner:
+    """Class to represent the search of all known abbreviations in the texts.
+
+    All abbreviations are combined into the single regular expression built from the prefix tree,
+    so each text is scanned once regardless of the glossary size.
+    The abbreviations are case-sensitive and must not be the parts of other words.
+    """
+
+    def __init__(self, ascii_doc_table: AsciiDocTableTerms):
+        shorts: set[str] = {term.short.strip() for term in ascii_doc_table.rows if term.short and term.short.strip()}
+        prefix_trie: PrefixTrie = PrefixTrie(shorts)
+
+        self._ascii_doc_table: AsciiDocTableTerms = ascii_doc_table
+        self._pattern: Pattern = compile(rf"(?<!\w){prefix_trie.pattern()}(?!\w)")
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}({len(self._ascii_doc_table)})>"
+
+    def scan(self, text: str) -> list[str]:
+        """Gets the abbreviations found in the text in the lexicographical order."""
+        return sorted({match.group(0) for match in self._pattern.finditer(text)})
+
+    def scan_file(self, path: StrPath) -> list[Term]:
+        """Gets the terms for all abbreviations found in the file."""
+        text: str = file_reader(path, "string", encoding="utf-8")
+        terms: list[Term] = [term for short in self.scan(text) for term in self._ascii_doc_table.get(short)]
+
+        logger.debug(f"Файл {path}: найдено сокращений {len(terms)}")
+        return terms
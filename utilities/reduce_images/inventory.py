@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import Future, ThreadPoolExecutor
+from csv import DictWriter
+from json import dump
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+from loguru import logger
+from PIL import Image
+
+from utilities.common.shared import StrPath
+from utilities.reduce_images.reducer import target_size
+
+# the approximate number of the bits per pixel in the well-compressed image, the bytes above are considered wasted
+BITS_PER_PIXEL: dict[str, float] = {
+    "JPEG": 2.0,
+    "PNG": 4.0}
+DEFAULT_BITS_PER_PIXEL: float = 4.0
+
+
+class ImageInfo(NamedTuple):
+    """Class to represent the image properties read from the file header.
+
+    The wasted bytes are estimated as the excess of the file size over the size of the well-compressed image
+    of the target dimensions, so the images worth re-encoding come first when sorted.
+    """
+    path: Path
+    format: str
+    width: int
+    height: int
+    size: int
+    dpi: str
+    wasted: int
+
+    def to_dict(self) -> dict[str, str | int]:
+        return {**self._asdict(), "path": str(self.path)}
+
+
+def read_info(path: Path, max_width: int = None, max_height: int = None) -> ImageInfo:
+    """Reads the image properties without decoding the pixels.
+
+    :param path: The path to the image.
+    :type path: Path
+    :param max_width: The maximum width the image is to be downscaled to.
+    :type max_width: int or None
+    :param max_height: The maximum height the image is to be downscaled to.
+    :type max_height: int or None
+    :return: The format, dimensions, file size, resolution, and estimated wasted bytes.
+    :rtype: ImageInfo
+    """
+    size: int = path.stat().st_size
+
+    # Image.open parses only the header, the pixels are not loaded
+    with Image.open(path, "r") as image:
+        image_format: str = image.format
+        width, height = image.size
+        dpi: tuple[float, float] | None = image.info.get("dpi")
+
+    target_width, target_height = target_size((width, height), max_width, max_height)
+    expected: float = target_width * target_height * BITS_PER_PIXEL.get(image_format, DEFAULT_BITS_PER_PIXEL) / 8
+    wasted: int = max(0, round(size - expected))
+
+    return ImageInfo(
+        path,
+        image_format,
+        width,
+        height,
+        size,
+        f"{float(dpi[0]):g}x{float(dpi[1]):g}" if dpi else "",
+        wasted)
+
+
+def inventory(
+        paths: Iterable[Path],
+        max_width: int = None,
+        max_height: int = None, *,
+        jobs: int = None) -> list[ImageInfo]:
+    """Reads the image headers in the thread pool.
+
+    :param paths: The paths to the images.
+    :type paths: Iterable[Path]
+    :param max_width: The maximum width the images are to be downscaled to.
+    :type max_width: int or None
+    :param max_height: The maximum height the images are to be downscaled to.
+    :type max_height: int or None
+    :param jobs: The number of the threads. By default, chosen by ThreadPoolExecutor.
+    :type jobs: int
+    :return: The image properties sorted by the wasted bytes in the descending order,
+    the images failed to read are skipped.
+    :rtype: list[ImageInfo]
+    """
+    infos: list[ImageInfo] = []
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures: list[tuple[Path, Future]] = [
+            (path, executor.submit(read_info, path, max_width, max_height))
+            for path in paths]
+
+        for path, future in futures:
+            try:
+                infos.append(future.result())
+
+            except (OSError, ValueError, Image.DecompressionBombError) as e:
+                logger.error(f"Не удалось прочитать файл {path.name}, {e.__class__.__name__}: {e}")
+
+    return sorted(infos, key=lambda info: (-info.wasted, str(info.path)))
+
+
+def write_report(infos: Iterable[ImageInfo], path: StrPath):
+    """Writes the image properties to the JSON file if the suffix is .json, and to the CSV file otherwise."""
+    path: Path = Path(path)
+    rows: list[dict[str, str | int]] = [info.to_dict() for info in infos]
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        if path.suffix.lower() == ".json":
+            dump(rows, f, ensure_ascii=False, indent=2)
+
+        else:
+            writer: DictWriter = DictWriter(f, fieldnames=ImageInfo._fields)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    logger.info(f"Отчет записан в файл {path}")
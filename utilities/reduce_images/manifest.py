@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+from json import dump, JSONDecodeError, load
+from os import replace, stat_result
+from pathlib import Path
+
+from click.utils import get_app_dir
+from loguru import logger
+
+from utilities.common.functions import file_hash
+from utilities.common.shared import StrPath
+
+# increased if the format of the manifest is changed
+MANIFEST_FORMAT: int = 1
+
+
+class Manifest:
+    """Class to represent the images already optimized with the specified settings.
+
+    The images are identified by the content hash, so the moved and copied images are recognized as well.
+    The hashes are cached by the path, size, and modification time, so the unchanged images
+    are checked with the single stat call and are neither read nor decoded.
+    """
+    MANIFEST: Path = Path(get_app_dir("utilities")).joinpath("reduce-images", "manifest.json")
+
+    def __init__(self, settings: str, path: StrPath = None):
+        if path is None:
+            path: Path = self.MANIFEST
+
+        self._path: Path = Path(path).expanduser()
+        self._settings: str = settings
+        # the settings by the content hashes
+        self._hashes: dict[str, str] = {}
+        # the size, the modification time, and the content hash by the paths
+        self._stats: dict[str, tuple[int, int, str]] = {}
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}({self._path}, {self._settings})>"
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def load(self):
+        """Reads the manifest file if it exists."""
+        if not self._path.exists():
+            logger.debug(f"Манифест {self._path} не найден")
+            return
+
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                content: dict = load(f)
+
+        except (OSError, JSONDecodeError) as e:
+            logger.debug(f"Не удалось прочитать манифест {self._path}, {e.__class__.__name__}: {e}")
+            return
+
+        if not isinstance(content, dict) or content.get("format") != MANIFEST_FORMAT:
+            logger.debug(f"Формат манифеста {self._path} устарел")
+            return
+
+        self._hashes = content.get("hashes", {})
+        self._stats = {k: tuple(v) for k, v in content.get("stats", {}).items()}
+
+    def save(self):
+        """Writes the manifest file atomically."""
+        content: dict = {
+            "format": MANIFEST_FORMAT,
+            "hashes": self._hashes,
+            "stats": self._stats}
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path: Path = self._path.with_name(f"{self._path.name}.tmp")
+
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                dump(content, f, ensure_ascii=False, separators=(",", ":"))
+
+            replace(temp_path, self._path)
+
+        except OSError as e:
+            logger.warning(f"Не удалось сохранить манифест {self._path}, {e.__class__.__name__}: {e}")
+            temp_path.unlink(missing_ok=True)
+
+        else:
+            logger.debug(f"Манифест {self._path} сохранен")
+
+    def _hash(self, path: Path, stat: stat_result) -> str:
+        cached: tuple[int, int, str] | None = self._stats.get(str(path))
+
+        if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            return cached[2]
+
+        digest: str = file_hash(path)
+        self._stats[str(path)] = (stat.st_size, stat.st_mtime_ns, digest)
+        return digest
+
+    def is_optimized(self, path: Path) -> bool:
+        """Checks if the image has been optimized with the current settings.
+
+        The image is not hashed if the manifest is empty, so it is read only once by the worker process.
+        """
+        if not self._hashes:
+            return False
+
+        return self._hashes.get(self._hash(path, path.stat())) == self._settings
+
+    def add(self, path: Path, digest: str):
+        """Records the optimized image.
+
+        :param path: The path to the image.
+        :type path: Path
+        :param digest: The hash of the current image content.
+        :type digest: str
+        """
+        stat: stat_result = path.stat()
+        self._stats[str(path)] = (stat.st_size, stat.st_mtime_ns, digest)
+        self._hashes[digest] = self._settings
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import Future, ProcessPoolExecutor
+from hashlib import blake2b
+from io import BytesIO
+from os import replace
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+from loguru import logger
+from PIL import Image
+
+from utilities.common.custom_logger import worker_logging
+
+# the image is reduced by the integer factor to at least twice the target size before the resampling,
+# so the fast box reduction does not affect the quality of the final Lanczos filter
+REDUCING_GAP: int = 2
+# the modes not supported by Image.reduce and resampled only with the nearest neighbour,
+# the images are converted to the true color before the downscaling
+PALETTE_MODES: tuple[str, ...] = ("1", "P", "PA")
+# the true color modes supported by Image.quantize
+QUANTIZE_MODES: tuple[str, ...] = ("RGB", "RGBA")
+
+
+class EncodeOptions(NamedTuple):
+    """Class to represent the settings of the image encoding.
+
+    The maximum sizes limit the image preserving the aspect ratio, the images are never upscaled.
+    The quality and the progressive mode are applied to the JPEG images only.
+    The PNG images are converted to the palette with the specified number of the colors
+    only if they have no more than the maximum number of the unique colors.
+    """
+    max_width: int | None = None
+    max_height: int | None = None
+    quality: int | None = None
+    progressive: bool = False
+    colors: int | None = None
+    max_colors: int = 4096
+    dither: bool = False
+
+
+class ReduceResult(NamedTuple):
+    """Class to represent the result of the image optimization.
+
+    The size after is the size of the file after the command, so it equals the size before
+    if the re-encoded image is not smaller enough.
+    The digest is the hash of the file content after the command, so the image can be recorded to the manifest.
+    The quantized flag is set if the image is converted to the palette.
+    """
+    path: Path
+    before: int
+    encoded: int
+    replaced: bool
+    digest: str
+    quantized: bool = False
+
+    @property
+    def after(self) -> int:
+        return self.encoded if self.replaced else self.before
+
+    @property
+    def saving(self) -> float:
+        """Gets the relative decrease of the size after the encoding."""
+        return 1 - self.encoded / self.before if self.before else 0.0
+
+
+def target_size(size: tuple[int, int], max_width: int = None, max_height: int = None) -> tuple[int, int]:
+    """Gets the size fitting into the maximum sizes with the same aspect ratio.
+
+    :param size: The original width and height.
+    :type size: tuple[int, int]
+    :param max_width: The maximum width. By default, not limited.
+    :type max_width: int or None
+    :param max_height: The maximum height. By default, not limited.
+    :type max_height: int or None
+    :return: The new width and height, the original size if it fits already.
+    :rtype: tuple[int, int]
+    """
+    width, height = size
+    ratio: float = min(
+        max_width / width if max_width else 1.0,
+        max_height / height if max_height else 1.0)
+
+    if ratio >= 1:
+        return size
+
+    return max(1, round(width * ratio)), max(1, round(height * ratio))
+
+
+def downscale(image: Image.Image, size: tuple[int, int]) -> Image.Image:
+    """Downscales the image with the high-quality resampling.
+
+    The JPEG image is decoded at the reduced scale with draft, then the image is reduced
+    by the integer factor, and only the remainder is resampled with the Lanczos filter.
+    """
+    width, height = size
+    # only the JPEG images support the decoding at the reduced scale, the call is ignored for the others
+    image.draft(None, (width * REDUCING_GAP, height * REDUCING_GAP))
+
+    if image.mode in PALETTE_MODES:
+        image: Image.Image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+
+    factor: int = min(image.width // (width * REDUCING_GAP), image.height // (height * REDUCING_GAP))
+
+    if factor > 1:
+        image: Image.Image = image.reduce(factor)
+
+    return image.resize(size, Image.Resampling.LANCZOS)
+
+
+def quantize(image: Image.Image, colors: int, max_colors: int, dither: bool = False) -> Image.Image | None:
+    """Converts the image to the palette.
+
+    The unique colors are counted with getcolors first, which stops as soon as the limit is exceeded,
+    so the photos and the gradients are skipped without the quantization attempt.
+
+    :param image: The true color image.
+    :type image: Image.Image
+    :param colors: The number of the colors in the palette.
+    :type colors: int
+    :param max_colors: The maximum number of the unique colors in the image to quantize.
+    :type max_colors: int
+    :param dither: The flag to apply the Floyd-Steinberg dithering.
+    :type dither: bool
+    :return: The palette image, or None if the image has too many colors or is not in the true color.
+    :rtype: Image.Image or None
+    """
+    if image.mode not in QUANTIZE_MODES or image.getcolors(max_colors) is None:
+        return None
+
+    return image.quantize(
+        colors,
+        # only the fast octree method supports the transparency
+        method=Image.Quantize.FASTOCTREE if image.mode == "RGBA" else Image.Quantize.MEDIANCUT,
+        dither=Image.Dither.FLOYDSTEINBERG if dither else Image.Dither.NONE)
+
+
+def encode(content: bytes, options: EncodeOptions = EncodeOptions()) -> tuple[bytes, bool]:
+    """Re-encodes the image with the optimization in memory.
+
+    :param content: The original image file content.
+    :type content: bytes
+    :param options: The settings of the encoding.
+    :type options: EncodeOptions
+    :return: The encoded image file content, and the flag if the image is converted to the palette.
+    :rtype: tuple[bytes, bool]
+    """
+    with Image.open(BytesIO(content), "r") as image:
+        image_format: str = image.format
+        size: tuple[int, int] = target_size(image.size, options.max_width, options.max_height)
+        params: dict[str, int | bool] = {"optimize": True}
+
+        if image_format == "JPEG":
+            if options.quality is not None:
+                params["quality"] = options.quality
+
+            if options.progressive:
+                params["progressive"] = True
+
+        if size != image.size:
+            image: Image.Image = downscale(image, size)
+
+        palette: Image.Image | None = None
+
+        if image_format == "PNG" and options.colors is not None:
+            palette: Image.Image | None = quantize(image, options.colors, options.max_colors, options.dither)
+
+        if palette is not None:
+            image: Image.Image = palette
+
+        buffer: BytesIO = BytesIO()
+        image.save(buffer, format=image_format, **params)
+        return buffer.getvalue(), palette is not None
+
+
+def write_atomic(path: Path, content: bytes):
+    """Replaces the file content, the file is never left partially written."""
+    temp_path: Path = path.with_name(f".{path.name}.tmp")
+
+    try:
+        temp_path.write_bytes(content)
+        replace(temp_path, path)
+
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def reduce_image(
+        path: Path,
+        threshold: float = 0.0,
+        dry_run: bool = False,
+        options: EncodeOptions = EncodeOptions()) -> ReduceResult:
+    """Re-encodes the image and replaces the original if the result is smaller by the threshold.
+
+    :param path: The path to the image.
+    :type path: Path
+    :param threshold: The minimum relative decrease of the size to replace the file.
+    :type threshold: float
+    :param dry_run: The flag to only measure the new size without modifying the file.
+    :type dry_run: bool
+    :param options: The settings of the encoding.
+    :type options: EncodeOptions
+    :return: The sizes before and after the encoding, the flag if the file is, or would be, replaced,
+    and the hash of the resulting content.
+    :rtype: ReduceResult
+    """
+    original: bytes = path.read_bytes()
+    encoded, quantized = encode(original, options)
+    replaced: bool = len(encoded) < len(original) * (1 - threshold)
+    content: bytes = original
+
+    if replaced and not dry_run:
+        write_atomic(path, encoded)
+        content: bytes = encoded
+
+    return ReduceResult(path, len(original), len(encoded), replaced, blake2b(content).hexdigest(), quantized)
+
+
+def reduce_images(
+        paths: Iterable[Path],
+        threshold: float = 0.0,
+        dry_run: bool = False,
+        options: EncodeOptions = EncodeOptions(), *,
+        jobs: int = None,
+        is_debug: bool = False) -> Iterator[ReduceResult]:
+    """Optimizes the images in the worker processes.
+
+    The results are yielded in the order of the paths, the images failed to process are skipped.
+
+    :param paths: The paths to the images.
+    :type paths: Iterable[Path]
+    :param threshold: The minimum relative decrease of the size to replace the file.
+    :type threshold: float
+    :param dry_run: The flag to only measure the new sizes without modifying the files.
+    :type dry_run: bool
+    :param options: The settings of the encoding.
+    :type options: EncodeOptions
+    :param jobs: The number of the worker processes. By default, the number of the processors.
+    :type jobs: int
+    :param is_debug: The flag to log the debug messages of the worker processes to the console.
+    :type is_debug: bool
+    :return: The results of the optimization.
+    :rtype: Iterator[ReduceResult]
+    """
+    with ProcessPoolExecutor(max_workers=jobs, initializer=worker_logging, initargs=(is_debug,)) as executor:
+        futures: list[tuple[Path, Future]] = [
+            (path, executor.submit(reduce_image, path, threshold, dry_run, options))
+            for path in paths]
+
+        for path, future in futures:
+            try:
+                yield future.result()
+
+            except (OSError, ValueError, Image.DecompressionBombError) as e:
+                logger.error(f"Не удалось обработать файл {path.name}, {e.__class__.__name__}: {e}")
@@ -1,17 +1,20 @@
 # -*- coding: utf-8 -*-
+from bisect import bisect_right
 from os import system
-from typing import Iterable
+from pathlib import Path
+from re import compile, DOTALL, Match, MULTILINE, Pattern
+from typing import Iterable, Iterator
 
 from click.core import Context
 from click.decorators import help_option, option, pass_context
 from click.termui import style
-from click.types import BOOL, Path as ClickPath
+from click.types import BOOL, Path as ClickPath, STRING
 from click.utils import echo
 from loguru import logger
 
 from utilities.common.config_file import config_file
 from utilities.common.functions import file_reader, is_windows, pretty_print
-from utilities.common.shared import HELP, separator, StrPath
+from utilities.common.shared import ADOC_EXTENSION, HELP, MD_EXTENSION, separator, StrPath
 from utilities.scripts.api_group import APIGroup, ConditionalOption
 from utilities.scripts.cli import cli
 from utilities.common.completion import dir_completion, file_completion
@@ -19,32 +22,84 @@ from utilities.scripts.list_files import get_files
 
 RUSSIAN_CHARS: str = "абвгдеёжзийклмнопрстуфхцчшщъыьэюяАБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ"
 
+# the delimited code and comment blocks and the line comments in AsciiDoc
+ADOC_CODE_PATTERN: str = (
+    r"^(?P<delimiter>-{4,}|\.{4,}|/{4,})[ \t]*\n.*?^(?P=delimiter)[ \t]*$"
+    r"|^//[^\n]*")
+# the fenced code blocks and the comments in Markdown, the setext underlines and the thematic breaks are the text
+MD_CODE_PATTERN: str = (
+    r"^(?P<delimiter>`{3,}|~{3,})[^\n]*\n.*?^(?P=delimiter)[ \t]*$"
+    r"|<!--.*?-->")
+RUSSIAN: str = f"(?P<russian>[{RUSSIAN_CHARS}]+)"
+RUSSIAN_PATTERN: Pattern = compile(RUSSIAN)
+RUSSIAN_CODE_PATTERNS: dict[str, Pattern] = {
+    ADOC_EXTENSION: compile(f"(?P<code>{ADOC_CODE_PATTERN})|{RUSSIAN}", MULTILINE | DOTALL),
+    MD_EXTENSION: compile(f"(?P<code>{MD_CODE_PATTERN})|{RUSSIAN}", MULTILINE | DOTALL)}
+
 
 def style_iterable(values: Iterable[str], fg: str):
     lines: list[str] = [style(value, fg=fg) for value in values]
     return pretty_print(lines)
 
 
-def find_first_russian_char(line: str):
-    for index, char in enumerate(line):
-        if char in RUSSIAN_CHARS:
-            return index, char
+def line_starts(text: str) -> list[int]:
+    """Gets the offsets of the line beginnings in the text."""
+    starts: list[int] = [0]
+    index: int = text.find("\n")
+
+    while index != -1:
+        starts.append(index + 1)
+        index = text.find("\n", index + 1)
+
+    return starts
+
+
+def find_russian(
+        text: str,
+        skip_code: bool = False,
+        suffix: str = ADOC_EXTENSION) -> Iterator[tuple[int, int, str]]:
+    """Iterates over the sequences of the Cyrillic letters in the text.
+
+    The whole text is scanned with the single regular expression,
+    the line and the column are computed by the offset only for the found sequences.
+    Unlike the line-by-line search, all sequences in the line are found.
 
-    return None
+    :param text: The text to scan.
+    :type text: str
+    :param skip_code: The flag to ignore the code blocks and the comments.
+    :type skip_code: bool
+    :param suffix: The file extension defining the syntax of the code blocks and the comments.
+    Nothing is ignored in the files of other types.
+    :type suffix: str
+    :return: The line number, the column number, both starting from 1, and the found letters.
+    :rtype: Iterator[tuple[int, int, str]]
+    """
+    # the text without non-ASCII characters cannot contain the Cyrillic letters
+    if text.isascii():
+        return
 
+    pattern: Pattern = RUSSIAN_CODE_PATTERNS.get(suffix, RUSSIAN_PATTERN) if skip_code else RUSSIAN_PATTERN
+    starts: list[int] | None = None
 
-def file_inspection(path: str, is_color: bool = True):
-    lines: list[str] = file_reader(path, "lines", encoding="utf-8")
+    for match in pattern.finditer(text):
+        match: Match
 
-    results: list[str] = []
+        if match.group("russian") is None:
+            continue
 
-    for line_no, line in enumerate(lines):
-        _: tuple[int, str] | None = find_first_russian_char(line)
+        if starts is None:
+            starts = line_starts(text)
 
-        if _ is not None:
-            index, char = _
-            record: str = style(f"Строка {line_no + 1}, символ {index + 1}: {char}", fg="red")
-            results.append(record)
+        line_no: int = bisect_right(starts, match.start()) - 1
+        yield line_no + 1, match.start() - starts[line_no] + 1, match.group("russian")
+
+
+def file_inspection(path: str, is_color: bool = True, skip_code: bool = False):
+    text: str = file_reader(path, "string", encoding="utf-8")
+
+    results: list[str] = [
+        style(f"Строка {line_no}, символ {column}: {letters}", fg="red")
+        for line_no, column, letters in find_russian(text, skip_code, Path(path).suffix)]
 
     if not results and is_color:
         return style(f"В файле {path} не найдены кириллические буквы", fg="green")
@@ -107,6 +162,15 @@ def file_inspection(path: str, is_color: bool = True):
     show_default=True,
     required=False,
     default=config_file.get_commands("check-russian", "verbose"))
+@option(
+    "-s/-S", "--skip-code/--no-skip-code", "skip_code",
+    type=BOOL,
+    is_flag=True,
+    help="\b\nФлаг пропуска блоков кода и комментариев."
+         "\nПо умолчанию: False, проверяется весь текст",
+    show_default=True,
+    required=False,
+    default=config_file.get_commands("check-russian", "skip_code"))
 @option(
     "-r/-R", "--recursive/--no-recursive",
     type=BOOL,
@@ -116,6 +180,25 @@ def file_inspection(path: str, is_color: bool = True):
     show_default=True,
     required=False,
     default=config_file.get_commands("check-russian", "recursive"))
+@option(
+    "--changed-since", "changed_since",
+    type=STRING,
+    help="\b\nGit-ссылка для обработки только измененных файлов в директории."
+         "\nФайлы сравниваются с общим предком ссылки и текущей ветки."
+         "\nПо умолчанию: не задано, обрабатываются все файлы",
+    multiple=False,
+    required=False,
+    metavar="REF",
+    default=config_file.get_commands("check-russian", "changed_since"))
+@option(
+    "--staged/--no-staged", "staged",
+    type=BOOL,
+    is_flag=True,
+    help="\b\nФлаг обработки только файлов в директории, добавленных в индекс git."
+         "\nПо умолчанию: False, обрабатываются все файлы",
+    show_default=True,
+    required=False,
+    default=config_file.get_commands("check-russian", "staged"))
 @option(
     "-k/-K", "--keep-logs/--remove-logs",
     type=BOOL,
@@ -137,6 +220,9 @@ def check_russian_command(
         directory: StrPath = None,
         recursive: bool = True,
         verbose: bool = False,
+        skip_code: bool = False,
+        changed_since: str = None,
+        staged: bool = False,
         keep_logs: bool = False):
     if is_windows():
         system("color")
@@ -147,14 +233,16 @@ def check_russian_command(
         directory=directory,
         recursive=recursive,
         language="en",
-        extensions="md adoc")
+        extensions="md adoc",
+        changed_since=changed_since,
+        staged=staged)
 
     if files is not None and files:
         result: list[str] = []
 
         for file in files:
             logger.debug(f"Файл {file}")
-            file_result: str | None = file_inspection(file, verbose)
+            file_result: str | None = file_inspection(file, verbose, skip_code)
 
             if file_result is not None:
                 result.append(file_result)
@@ -1,17 +1,20 @@
 # -*- coding: utf-8 -*-
+from typing import Iterable
+
 from click.core import Context
 from click.decorators import argument, help_option, option, pass_context
 from click.termui import style
-from click.types import BOOL, Path as ClickPath
+from click.types import BOOL, IntRange, Path as ClickPath
+from click.utils import echo
 from loguru import logger
 
 from utilities.common.config_file import config_file
 from utilities.common.shared import HELP, StrPath
 from utilities.convert_tables.line_formatter import LineFormatter
-from utilities.convert_tables.xml_file import CoreDocument, XmlDocument
+from utilities.convert_tables.batch import convert_document, convert_documents, list_documents, summary
 from utilities.scripts.api_group import MutuallyExclusiveOption, SwitchArgsAPIGroup
 from utilities.scripts.cli import cli
-from utilities.common.completion import doc_completion
+from utilities.common.completion import dir_completion, doc_completion
 
 
 @cli.command(
@@ -26,9 +29,25 @@ from utilities.common.completion import doc_completion
         resolve_path=True,
         allow_dash=False,
         dir_okay=False),
-    required=True,
+    nargs=-1,
+    required=False,
     shell_complete=doc_completion,
-    metavar="DOCX")
+    metavar="DOCX ... DOCX")
+@option(
+    "-d", "--dir", "directory",
+    type=ClickPath(
+        exists=True,
+        file_okay=False,
+        resolve_path=True,
+        allow_dash=False,
+        dir_okay=True),
+    help="\b\nДиректория с файлами docx для пакетной обработки."
+         "\nТаблицы каждого файла записываются в отдельную поддиректорию",
+    multiple=False,
+    required=False,
+    metavar="DIR",
+    shell_complete=dir_completion,
+    default=None)
 @option(
     "-p", "--parse", "tables_dir",
     type=ClickPath(
@@ -44,20 +63,19 @@ from utilities.common.completion import doc_completion
     metavar="DIR_TABLES",
     default=config_file.get_commands("convert-tables", "tables_dir"))
 @option(
-    "-t", "--temp", "temp_dir",
+    "-i", "--images", "images_dir",
     type=ClickPath(
-        exists=False,
         file_okay=False,
         resolve_path=True,
         allow_dash=False,
         dir_okay=True),
-    help="\b\nВременная директория для работы с файлом."
-         "\nПо умолчанию: ./_temp/."
+    help="\b\nДиректория для сохранения изображений, используемых в документе."
+         "\nПо умолчанию: не задано, изображения не извлекаются."
          "\nЕсли не существует, то будет создана",
     multiple=False,
     required=False,
-    metavar="TEMP_DIR",
-    default=config_file.get_commands("convert-tables", "temp_dir"))
+    metavar="DIR_IMAGES",
+    default=config_file.get_commands("convert-tables", "images_dir"))
 @option(
     "-e/-E", "--escape/--no-escape", "escape",
     type=BOOL,
@@ -99,6 +117,25 @@ from utilities.common.completion import doc_completion
     show_default=True,
     required=False,
     default=config_file.get_commands("convert-tables", "keep"))
+@option(
+    "--stream/--no-stream", "stream",
+    type=BOOL,
+    is_flag=True,
+    help="\b\nФлаг потоковой обработки файла. Таблицы обрабатываются"
+         "\nпо мере чтения документа, в памяти хранится только текущая таблица."
+         "\nПо умолчанию: False, документ считывается целиком",
+    show_default=True,
+    required=False,
+    default=config_file.get_commands("convert-tables", "stream"))
+@option(
+    "-j", "--jobs",
+    type=IntRange(min=1),
+    help="\b\nКоличество параллельных процессов при пакетной обработке."
+         "\nПо умолчанию: количество процессоров",
+    multiple=False,
+    required=False,
+    metavar="JOBS",
+    default=config_file.get_commands("convert-tables", "jobs"))
 @option(
     "-k/-K", "--keep-logs/--remove-logs",
     type=BOOL,
@@ -116,13 +153,16 @@ from utilities.common.completion import doc_completion
 @pass_context
 def convert_tables_command(
         ctx: Context,
-        docx: StrPath,
+        docx: Iterable[StrPath] = (),
+        directory: StrPath = None,
         tables_dir: StrPath = "./tables/",
-        temp_dir: StrPath = "./_temp/",
+        images_dir: StrPath = None,
         remove: bool = False,
         escape: bool = True,
         fix: bool = None,
         keep: bool = None,
+        stream: bool = False,
+        jobs: int = None,
         keep_logs: bool = False):
     if fix:
         remove_spaces: bool = True
@@ -138,15 +178,20 @@ def convert_tables_command(
 
     line_formatter: LineFormatter = LineFormatter(remove_spaces, escape_chars)
 
-    core_document: CoreDocument = CoreDocument(docx, temp_dir)
-    core_document.unarchive()
+    documents: list[StrPath] = [*docx]
 
-    logger.info(f"Файл {core_document.file.name} успешно разархивирован")
+    if directory is not None:
+        documents.extend(list_documents(directory))
 
-    xml_document: XmlDocument = XmlDocument(core_document, tables_dir)
-    xml_document.read()
-    xml_document.parse_document(line_formatter)
+    if not documents:
+        logger.error("Не задан ни один файл docx для обработки")
 
-    core_document.delete_temp_archive()
+    elif len(documents) == 1 and directory is None:
+        convert_document(documents[0], tables_dir, line_formatter, stream, images_dir)
+
+    else:
+        echo(summary(convert_documents(
+            documents, tables_dir, line_formatter, stream=stream, images_dir=images_dir, jobs=jobs,
+            is_debug=ctx.obj.get("debug", False))))
 
     ctx.obj["keep_logs"] = keep_logs
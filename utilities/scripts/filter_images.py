@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 from pathlib import Path
-from re import finditer
 
 from click.core import Context
 from click.decorators import argument, help_option, option, pass_context
@@ -8,66 +7,47 @@ from click.types import BOOL, Path as ClickPath
 from loguru import logger
 
 from utilities.common.config_file import config_file
-from utilities.common.functions import file_reader, file_writer, pretty_print
-from utilities.common.shared import HELP, INDEX_STEMS, StrPath
+from utilities.common.functions import file_writer, pretty_print
+from utilities.common.shared import ADOC_EXTENSION, HELP, MD_EXTENSION, StrPath
+from utilities.filter_images.duplicates import find_duplicates, find_references, rewrite_duplicates
+from utilities.filter_images.file import AsciiDocFile, File, MdFile
 from utilities.scripts.api_group import SwitchArgsAPIGroup
 from utilities.scripts.cli import cli
 from utilities.common.completion import dir_completion
 from utilities.scripts.list_files import get_files
 
 
-class File:
-    pattern: str = None
-
-    def __init__(self, path: StrPath):
-        self._path: Path = Path(path).resolve()
-        self._content: list[str] = file_reader(self._path, "lines", encoding="utf-8")
-
-    def __iter__(self):
-        return iter(self._content)
-
-    def __bool__(self):
-        return self._path.stem in INDEX_STEMS
-
-    @property
-    def full_links(self) -> list[Path]:
-        return []
-
-    def fix_link(self, link: str):
-        return Path(link).resolve() if bool(self) else Path(link.removeprefix("../"))
+def duplicate_images(
+        root: Path,
+        images: list[Path],
+        files: list[File],
+        dry_run: bool = False,
+        rewrite: bool = False) -> list[str]:
+    groups: list[list[Path]] = find_duplicates(images)
 
+    if not groups:
+        return ["\nОдинаковые изображения не найдены"]
 
-class MdFile(File):
-    pattern: str = r"!\[.*?\]\((.+?)\)"
+    references: dict[Path, list[Path]] = find_references(files)
+    lines: list[str] = ["Одинаковые изображения:"]
 
-    @property
-    def full_links(self):
-        return [
-            self.fix_link(m.group(1))
-            for line in iter(self)
-            for m in finditer(self.__class__.pattern, line)]
+    for group in groups:
+        lines.append("")
 
+        for image in group:
+            referencing: list[Path] = references.get(image, [])
+            lines.append(f"{image.relative_to(root)}, ссылок: {len(referencing)}")
+            lines.extend(f"  {file.relative_to(root)}" for file in sorted(referencing))
 
-class AsciiDocFile(File):
-    pattern: str = r"image:+(.+?)\[.*?\]"
+    messages: list[str] = ["\n".join(lines)]
 
-    @property
-    def imagesdir(self):
-        for line in iter(self):
-            if line.startswith("ifndef::imagesdir") and ":imagesdir:" in (
-                    line_shorten := line.removeprefix("ifndef::imagesdir")):
-                imagesdir: str = line_shorten.removeprefix("[:imagesdir:").strip().removesuffix("]")
-                return self._path.parent.joinpath(imagesdir).resolve()
+    if rewrite and not dry_run:
+        messages.append(f"\nСсылки на одинаковые изображения заменены, количество: {rewrite_duplicates(files, groups)}")
 
-        else:
-            return Path(self._path.parent).resolve()
+    elif rewrite:
+        messages.append("\nСсылки не изменены, поскольку использована опция --dry-run")
 
-    @property
-    def full_links(self):
-        return [
-            self.imagesdir.joinpath(m.group(1)).resolve()
-            for line in iter(self)
-            for m in finditer(self.__class__.pattern, line)]
+    return messages
 
 
 @cli.command(
@@ -108,6 +88,26 @@ class AsciiDocFile(File):
     required=False,
     metavar="FILE",
     default=config_file.get_commands("filter-images", "output"))
+@option(
+    "--duplicates/--no-duplicates", "duplicates",
+    type=BOOL,
+    is_flag=True,
+    help="\b\nФлаг поиска одинаковых изображений вместо неиспользуемых."
+         "\nВыводятся группы совпадающих файлов и файлы со ссылками на них."
+         "\nПо умолчанию: False, ищутся неиспользуемые изображения",
+    show_default=True,
+    required=False,
+    default=config_file.get_commands("filter-images", "duplicates"))
+@option(
+    "--rewrite/--no-rewrite", "rewrite",
+    type=BOOL,
+    is_flag=True,
+    help="\b\nФлаг замены ссылок на одинаковые изображения ссылкой на первое"
+         "\nиз них. Используется только с опцией --duplicates."
+         "\nПо умолчанию: False, ссылки не изменяются",
+    show_default=True,
+    required=False,
+    default=config_file.get_commands("filter-images", "rewrite"))
 @option(
     "-r/-R", "--recursive/--no-recursive",
     type=BOOL,
@@ -138,53 +138,69 @@ def filter_images_command(
         dry_run: bool = False,
         output: StrPath = None,
         recursive: bool = True,
+        duplicates: bool = False,
+        rewrite: bool = False,
         keep_logs: bool = False):
     messages: list[str] = []
 
     root: Path = Path(root)
-    extensions: str = "png jpg jpeg bmp svg PNG JPG JPEG BMP SVG"
+    image_extensions: str = "png jpg jpeg bmp svg PNG JPG JPEG BMP SVG"
 
-    images: list[StrPath] | None = get_files(
+    # the images and the text files are listed in the single walk and partitioned by the extensions
+    paths: list[StrPath] | None = get_files(
         ctx,
         directory=root,
-        recursive=recursive,
+        recursive=True,
         language=None,
-        extensions=extensions)
+        extensions=f"{image_extensions} md adoc")
 
-    images_paths_names: dict[Path, str] = {
-        root.joinpath(image): image.name for image in images}
+    images: list[Path] = []
+    md_files: list[MdFile] = []
+    adoc_files: list[AsciiDocFile] = []
 
-    md_paths: list[StrPath] | None = get_files(
-        ctx,
-        directory=root,
-        recursive=True,
-        language=None,
-        extensions="md")
-    md_files: list[MdFile] = [MdFile(md_path) for md_path in md_paths]
+    for path in map(Path, paths):
+        if path.suffix == MD_EXTENSION:
+            md_files.append(MdFile(path))
 
-    adoc_paths: list[StrPath] | None = get_files(
-        ctx,
-        directory=root,
-        recursive=True,
-        language=None,
-        extensions="adoc")
+        elif path.suffix == ADOC_EXTENSION:
+            adoc_files.append(AsciiDocFile(path))
+
+        elif recursive or path.parent == root:
+            images.append(path)
 
-    adoc_files: list[AsciiDocFile] = [AsciiDocFile(adoc_path) for adoc_path in adoc_paths]
+    if duplicates:
+        messages.extend(
+            duplicate_images(root, [path.resolve() for path in images], [*md_files, *adoc_files], dry_run, rewrite))
+
+        if output is not None:
+            file_writer(Path(output), pretty_print(messages))
+            messages.append(f"\nФайл {output} записан")
+
+        logger.info(pretty_print(messages))
+        ctx.obj["keep_logs"] = keep_logs
+        return
+
+    images_paths_names: dict[Path, str] = {
+        root.joinpath(image): image.name for image in images}
+    # the images with the same name in the order of images_paths_names, the dict is used as the ordered set
+    images_names_paths: dict[str, dict[Path, None]] = {}
+
+    for image, name in images_paths_names.items():
+        images_names_paths.setdefault(name, {})[image] = None
 
     links_paths_names: dict[Path, str] = {
         Path(full_link).resolve(): full_link.name for file in [*md_files, *adoc_files] for full_link in file.full_links}
 
-    def get_key_by_value(value, d: dict):
-        for _, _v in d.items():
-            if _v == value:
-                return _
+    def remove_image(image: Path | None):
+        name: str | None = images_paths_names.pop(image, None)
 
-        else:
-            return None
+        if name is not None:
+            images_names_paths[name].pop(image)
 
     for k, v in links_paths_names.items():
-        images_paths_names.pop(k, None)
-        images_paths_names.pop(get_key_by_value(v, images_paths_names), None)
+        remove_image(k)
+        # the link may point to the image with the same name located in another directory
+        remove_image(next(iter(images_names_paths.get(v, ())), None))
 
     if images_paths_names:
         _: list[Path] = [unused_image.relative_to(root) for unused_image in images_paths_names]
@@ -1,15 +1,15 @@
 # -*- coding: utf-8 -*-
-from re import finditer, Match
-from typing import Iterable
+from re import compile, Match, Pattern
+from typing import Iterable, Iterator
 
 from click.core import Context
 from click.decorators import help_option, option, pass_context
-from click.types import BOOL, INT, Path as ClickPath
+from click.types import BOOL, INT, Path as ClickPath, STRING
 from loguru import logger
 
 from utilities.common.config_file import config_file
 from utilities.common.errors import FormatCodeNonIntegerLineLengthError, FormatCodeNonPositiveLineLengthError
-from utilities.common.functions import file_reader, file_writer, pretty_print
+from utilities.common.functions import file_reader, file_writer
 from utilities.common.shared import ADOC_EXTENSION, HELP, MD_EXTENSION, StrPath
 from utilities.scripts.api_group import APIGroup, ConditionalOption
 from utilities.scripts.cli import cli
@@ -17,6 +17,10 @@ from utilities.common.completion import dir_completion, file_completion
 from utilities.scripts.list_files import get_files
 
 MAX_LENGTH: int = config_file.get_commands("format-code", "length")
+# the lines opening the code blocks, the block is closed by the line consisting of the same delimiter
+DELIMITERS: dict[str, Pattern] = {
+    MD_EXTENSION: compile(r"[ \t]*(`{3,})[^`]*"),
+    ADOC_EXTENSION: compile(r"(-{4,}|\.{4,})[ \t]*")}
 
 
 @cli.command(
@@ -73,6 +77,25 @@ MAX_LENGTH: int = config_file.get_commands("format-code", "length")
     show_default=True,
     required=False,
     default=config_file.get_commands("format-code", "recursive"))
+@option(
+    "--changed-since", "changed_since",
+    type=STRING,
+    help="\b\nGit-ссылка для обработки только измененных файлов в директории."
+         "\nФайлы сравниваются с общим предком ссылки и текущей ветки."
+         "\nПо умолчанию: не задано, обрабатываются все файлы",
+    multiple=False,
+    required=False,
+    metavar="REF",
+    default=config_file.get_commands("format-code", "changed_since"))
+@option(
+    "--staged/--no-staged", "staged",
+    type=BOOL,
+    is_flag=True,
+    help="\b\nФлаг обработки только файлов в директории, добавленных в индекс git."
+         "\nПо умолчанию: False, обрабатываются все файлы",
+    show_default=True,
+    required=False,
+    default=config_file.get_commands("format-code", "staged"))
 @option(
     "-k/-K", "--keep-logs/--remove-logs",
     type=BOOL,
@@ -94,8 +117,10 @@ def format_code_command(
         files: Iterable[StrPath] = None,
         recursive: bool = True,
         length: int = MAX_LENGTH,
+        changed_since: str = None,
+        staged: bool = False,
         keep_logs: bool = False):
-    if length < 0:
+    if length <= 0:
         logger.error(f"Максимальная длина не может быть неположительным числом, однако получено {length}")
         raise FormatCodeNonPositiveLineLengthError
 
@@ -108,31 +133,28 @@ def format_code_command(
         files=files,
         directory=directory,
         recursive=recursive,
-        language=None)
-
-    patterns: dict[str, str] = {
-        MD_EXTENSION: r"```\S*\n(.*?)\n```",
-        ADOC_EXTENSION: r"(?:-{4}|={4}|\.{4})([\s\S]+)(?:-{4}|={4}|\.{4})"}
+        language=None,
+        changed_since=changed_since,
+        staged=staged)
 
     if files is not None and files:
         for file in files:
             logger.debug(f"Файл {file}")
 
+            if file.suffix not in DELIMITERS:
+                logger.debug(f"Файл {file.name} пропущен")
+                continue
+
             try:
                 _content: str = file_reader(file, "string")
+                _result: str = format_content(_content, file.suffix, length)
 
-                _result: list[str] = []
-
-                for code in finditer(patterns.get(file.suffix), _content):
-                    lines: list[str] = code.group(1).splitlines()
+                if _result == _content:
+                    logger.info(f"Файл {file.name} не требует изменений")
 
-                    for line in lines:
-                        _: list[str] = split(line, length=length)
-                        _result.append(pretty_print(_))
-
-                file_writer(file, pretty_print(_result))
-
-                logger.info(f"Файл {file.name} успешно обработан")
+                else:
+                    file_writer(file, _result)
+                    logger.info(f"Файл {file.name} успешно обработан")
 
             except PermissionError:
                 logger.error(f"Недостаточно прав для чтения/записи в файл {file.name}")
@@ -149,56 +171,89 @@ def format_code_command(
     ctx.obj["keep_logs"] = keep_logs
 
 
-def split(
-        line: str,
-        start: int = 0,
-        length: int = MAX_LENGTH,
-        split_lines: Iterable[str] = None) -> list[str] | None:
-    if split_lines is None:
-        split_lines: list[str] = []
+def code_lines(lines: Iterable[str], delimiter_pattern: Pattern) -> Iterator[tuple[str, bool]]:
+    """Scans the lines once marking the ones inside the code blocks.
 
-    else:
-        split_lines: list[str] = [*split_lines]
+    :param lines: The lines of the file.
+    :type lines: Iterable[str]
+    :param delimiter_pattern: The pattern of the line opening the code block.
+    :type delimiter_pattern: Pattern
+    :return: The lines and the flags if the line is inside the code block, the delimiters are outside.
+    :rtype: Iterator[tuple[str, bool]]
+    """
+    delimiter: str | None = None
 
-    if len(line) <= length:
-        split_lines.append(line)
-        return split_lines
+    for line in lines:
+        if delimiter is None:
+            _match: Match | None = delimiter_pattern.fullmatch(line)
 
-    while start < len(line) - 1:
-        end: int = min(start + length, len(line))
+            if _match is not None:
+                delimiter: str = _match.group(1)
 
-        _slice: str = line[start:end]
+            yield line, False
 
-        if end < len(line):
-            _matches: list[Match] = list(finditer(";", _slice))
+        elif line.strip() == delimiter:
+            delimiter: str | None = None
+            yield line, False
 
-            if not _matches:
-                stop_square_bracket: int = _slice.rfind("[")
-                stop_curly_bracket: int = _slice.rfind("(")
-                stop_comma: int = _slice.rfind(",")
+        else:
+            yield line, True
 
-                stop: int = max(stop_square_bracket, stop_curly_bracket, stop_comma)
 
-                if stop == -1:
-                    stop: int = len(_slice) - 1
+def format_content(content: str, suffix: str, length: int = MAX_LENGTH) -> str:
+    """Splits the long lines inside the code blocks keeping the rest of the content intact.
 
-            else:
-                _last: Match = _matches[-1]
-                stop: int = _last.end()
+    :param content: The file content.
+    :type content: str
+    :param suffix: The file extension defining the code block delimiters.
+    :type suffix: str
+    :param length: The maximum line length.
+    :type length: int
+    :return: The file content with the split code lines.
+    :rtype: str
+    """
+    result: list[str] = []
 
-            if stop <= 0:
-                logger.error("Ошибка разбиения файла на части")
-                raise OSError
+    for line, is_code in code_lines(content.split("\n"), DELIMITERS.get(suffix)):
+        if is_code and len(line) > length:
+            result.extend(split(line, length))
 
         else:
-            stop: int = len(line) - start
+            result.append(line)
+
+    return "\n".join(result)
+
+
+def split(line: str, length: int = MAX_LENGTH) -> list[str]:
+    """Splits the line into the parts no longer than the length.
+
+    The line is broken after the last semicolon within the length, or else before the last opening bracket
+    or after the last comma, or else at the length.
+    The parts are kept as they are, including the leading whitespace, only the trailing whitespace is removed.
+
+    :param line: The line to split.
+    :type line: str
+    :param length: The maximum part length.
+    :type length: int
+    :return: The parts of the line.
+    :rtype: list[str]
+    """
+    split_lines: list[str] = []
+    start: int = 0
+
+    while len(line) - start > length:
+        _slice: str = line[start:start + length]
+        stop: int = _slice.rfind(";") + 1
+
+        if stop <= 0:
+            stop: int = max(_slice.rfind("["), _slice.rfind("("), _slice.rfind(",") + 1)
 
-        split_line: str = line[start:start + stop]
-        split_lines.append(split_line)
+        if stop <= 0:
+            stop: int = length
 
+        split_lines.append(line[start:start + stop])
         start += stop
 
-        split(line, start, length, split_lines)
+    split_lines.append(line[start:])
 
-    else:
-        return split_lines
+    return [split_lines[0].rstrip(), *filter(None, map(str.rstrip, split_lines[1:]))]
@@ -1,16 +1,19 @@
 # -*- coding: utf-8 -*-
 from bisect import bisect_right
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from os import scandir
 from pathlib import Path
+from re import compile, Pattern
 from typing import Any, ClassVar, Iterable, Mapping, NamedTuple, Self
 
 from click.core import Context
 from click.decorators import argument, help_option, option, pass_context
-from click.types import BOOL, Choice, Path as ClickPath, STRING
+from click.types import BOOL, Choice, IntRange, Path as ClickPath, STRING
 from click.utils import echo
-# noinspection PyProtectedMember
-from frontmatter import load, Post
+from frontmatter.default_handlers import YAMLHandler
 from loguru import logger
+from yaml import YAMLError
 
 from utilities.common.completion import dir_completion, language_completion
 from utilities.common.config_file import config_file
@@ -36,6 +39,83 @@ EPILOG_GENERATE_YAML: str = (
     "\n"
     "\b\nДопускается добавлять любые атрибуты, в том числе и пользовательские.")
 
+FRONT_MATTER_DELIMITER: Pattern = compile(r"-{3,}\s*")
+# the size of the chunks read after the front matter to find any text
+CHUNK_SIZE: int = 4096
+
+
+def read_front_matter(path: StrPath) -> tuple[dict[str, Any], bool]:
+    """Reads the YAML front matter without reading the whole file.
+
+    The file is read up to the closing delimiter, and the rest of the file only until the first
+    non-whitespace character, so the file body is neither read nor kept in memory.
+
+    :param path: The path to the file.
+    :type path: str or Path
+    :return: The front matter attributes, and the flag if the file has any text after the front matter.
+    :rtype: tuple[dict[str, Any], bool]
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        line: str = f.readline()
+
+        while line and line.isspace():
+            line: str = f.readline()
+
+        if not FRONT_MATTER_DELIMITER.fullmatch(line):
+            return {}, bool(line)
+
+        lines: list[str] = []
+
+        for line in f:
+            if FRONT_MATTER_DELIMITER.fullmatch(line):
+                break
+
+            lines.append(line)
+
+        else:
+            # the front matter is not closed, so the file has no front matter
+            return {}, True
+
+        metadata: Any = YAMLHandler().load("".join(lines))
+        has_content: bool = False
+
+        while chunk := f.read(CHUNK_SIZE):
+            if not chunk.isspace():
+                has_content: bool = True
+                break
+
+    return metadata if isinstance(metadata, dict) else {}, has_content
+
+
+def walk_tree(root: StrPath) -> dict[Path, tuple[list[str], list[str]]]:
+    """Collects the directory structure in the single scandir walk.
+
+    :param root: The top directory.
+    :type root: str or Path
+    :return: The names of the text files and the subdirectories in the listing order by the resolved directory paths.
+    :rtype: dict[Path, tuple[list[str], list[str]]]
+    """
+    tree: dict[Path, tuple[list[str], list[str]]] = {}
+    stack: list[Path] = [Path(root).resolve()]
+
+    while stack:
+        path: Path = stack.pop()
+        files: list[str] = []
+        dirs: list[str] = []
+
+        with scandir(path) as entries:
+            for entry in entries:
+                if entry.is_file() and Path(entry.name).suffix in EXTENSIONS:
+                    files.append(entry.name)
+
+                elif entry.is_dir():
+                    dirs.append(entry.name)
+
+        tree[path] = (files, dirs)
+        stack.extend(path.joinpath(name) for name in dirs)
+
+    return tree
+
 
 # noinspection PyTypeChecker
 class FrontMatter(NamedTuple):
@@ -112,7 +192,7 @@ class File:
     def __init__(self, path: StrPath):
         self._path: Path = Path(path)
         self._frontmatter: FrontMatter | None = None
-        self._content: str | None = None
+        self._has_content: bool = False
 
     def __hash__(self):
         return hash(self._path)
@@ -123,16 +203,30 @@ class File:
     def is_text(self):
         return self._path.suffix in EXTENSIONS
 
-    def set_params(self):
+    def set_params(self, front_matters: Mapping[Path, Future] = None):
+        """Sets the front matter of the file.
+
+        :param front_matters: The front matters read in advance by the resolved file paths, see read_front_matters.
+        The file is read directly if it is not specified or the file is missing.
+        :type front_matters: Mapping[Path, Future] or None
+        """
+        if front_matters is None:
+            front_matters: dict[Path, Future] = {}
+
         try:
-            post: Post = load(str(self._path))
-            fm: FrontMatter = FrontMatter.from_dict(post.metadata)
-            content: str = post.content
+            future: Future | None = front_matters.get(self._path.resolve())
+
+            if future is not None:
+                metadata, has_content = future.result()
+
+            else:
+                metadata, has_content = read_front_matter(self._path)
+            fm: FrontMatter = FrontMatter.from_dict(metadata)
 
             self._frontmatter = fm
-            self._content = content
+            self._has_content = has_content
 
-        except (AttributeError, ValueError):
+        except (AttributeError, ValueError, YAMLError):
             logger.error("Файл некорректен, поэтому проигнорирован")
 
     def __bool__(self):
@@ -181,7 +275,7 @@ class File:
             return NotImplemented
 
     def is_empty(self):
-        return not self._content
+        return not self._has_content
 
     def relpath(self, root: Path):
         return self._path.resolve().relative_to(root.resolve())
@@ -282,27 +376,42 @@ class Branch:
     def __str__(self):
         return f"Ветка {self._path!s}"
 
-    def set_inside(self):
-        for item in self._path.iterdir():
-            if item.is_file() and item.suffix in EXTENSIONS:
-                self.__files_inside.append(item)
+    def set_inside(self, tree: Mapping[Path, tuple[list[str], list[str]]] = None):
+        """Sets the files and directories inside the branch.
 
-            elif item.is_dir():
-                self.__dirs_inside.append(item)
+        :param tree: The directory structure walked in advance, see walk_tree.
+        The directory is listed directly if it is not specified or the directory is missing.
+        :type tree: Mapping[Path, tuple[list[str], list[str]]] or None
+        """
+        if tree is None:
+            tree: dict[Path, tuple[list[str], list[str]]] = {}
 
-            else:
-                pass
+        if self._path.resolve() in tree:
+            files, dirs = tree[self._path.resolve()]
+            self.__files_inside.extend(self._path.joinpath(name) for name in files)
+            self.__dirs_inside.extend(self._path.joinpath(name) for name in dirs)
+
+        else:
+            for item in self._path.iterdir():
+                if item.is_file() and item.suffix in EXTENSIONS:
+                    self.__files_inside.append(item)
+
+                elif item.is_dir():
+                    self.__dirs_inside.append(item)
+
+                else:
+                    pass
 
         logger.info(f"Files:\n{self.__files_inside!s}\nBranches:\n{self.__dirs_inside!s}")
 
-    def set_files(self):
+    def set_files(self, front_matters: Mapping[Path, Future] = None):
         for file_path in self.__files_inside:
             file: File = File(file_path)
 
             if file.language != self.__class__.language:
                 continue
 
-            file.set_params()
+            file.set_params(front_matters)
 
             if not bool(file):
                 continue
@@ -358,13 +467,16 @@ class Branch:
     def no_index_file(self):
         return self._index_file is None
 
-    def set_subs(self):
+    def set_subs(
+            self,
+            tree: Mapping[Path, tuple[list[str], list[str]]] = None,
+            front_matters: Mapping[Path, Future] = None):
         for item in self.__dirs_inside:
             branch: Branch = Branch(item.resolve())
-            branch.set_inside()
+            branch.set_inside(tree)
             branch.set_parent()
-            branch.set_files()
-            branch.set_subs()
+            branch.set_files(front_matters)
+            branch.set_subs(tree, front_matters)
 
             if branch.no_index_file and not branch._files and not branch._subs:
                 logger.debug(f"Ветка {branch._path} проигнорирована")
@@ -527,20 +639,55 @@ class Branch:
 
             logger.debug(f"Создана ветка {sub_path} с {len(files)} файлами")
 
-    def prepare(self):
-        self.set_inside()
+    def prepare(
+            self,
+            tree: Mapping[Path, tuple[list[str], list[str]]] = None,
+            front_matters: Mapping[Path, Future] = None):
+        """Collects the files and sub-branches recursively.
+
+        :param tree: The directory structure walked in advance, see walk_tree.
+        :type tree: Mapping[Path, tuple[list[str], list[str]]] or None
+        :param front_matters: The front matters read in advance by the resolved file paths, see read_front_matters.
+        :type front_matters: Mapping[Path, Future] or None
+        """
+        self.set_inside(tree)
         self.set_parent()
-        self.set_files()
-        self.set_subs()
+        self.set_files(front_matters)
+        self.set_subs(tree, front_matters)
         self.split_into_branches()
 
         for branch in self._subs:
-            branch.prepare()
+            branch.prepare(tree, front_matters)
+
 
+def read_front_matters(tree: Mapping[Path, tuple[list[str], list[str]]], *, jobs: int = None) -> dict[Path, Future]:
+    """Reads the front matters of the files in the language in the thread pool.
+
+    :param tree: The directory structure.
+    :type tree: Mapping[Path, tuple[list[str], list[str]]]
+    :param jobs: The number of the threads. By default, chosen by ThreadPoolExecutor.
+    :type jobs: int
+    :return: The completed reading tasks by the file paths, the errors are raised when the results are got.
+    :rtype: dict[Path, Future]
+    """
+    paths: list[Path] = [
+        directory.joinpath(name)
+        for directory, (files, _) in tree.items()
+        for name in files]
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        return {
+            path: executor.submit(read_front_matter, path)
+            for path in paths
+            if File(path).language == Branch.language}
+
+
+def generate_branches(path: StrPath | None = None, *, jobs: int = None):
+    tree: dict[Path, tuple[list[str], list[str]]] = walk_tree(path)
+    front_matters: dict[Path, Future] = read_front_matters(tree, jobs=jobs)
 
-def generate_branches(path: StrPath | None = None):
     branch: Branch = Branch(path)
-    branch.prepare()
+    branch.prepare(tree, front_matters)
 
     branches: list[Branch] = sorted(filter(lambda x: not x.no_index_file, Branch.branch_dict.values()))
     return {branch.relpath.as_posix(): branch.to_parameters().to_dict() for branch in branches}
@@ -743,6 +890,15 @@ def prepare_attributes(attrs: dict[str, Any] | None = None) -> dict[str, Any]:
     required=False,
     metavar="<KEY>=<VALUE>",
     default=config_file.get_commands("generate-yaml", "args"))
+@option(
+    "-j", "--jobs",
+    type=IntRange(min=1),
+    help="\b\nКоличество потоков для чтения файлов."
+         "\nПо умолчанию: определяется автоматически",
+    multiple=False,
+    required=False,
+    metavar="<JOBS>",
+    default=config_file.get_commands("generate-yaml", "jobs"))
 @option(
     "-k/-K", "--keep-logs/--remove-logs",
     type=BOOL,
@@ -766,6 +922,7 @@ def generate_yaml_command(
         dry_run: bool = False,
         language: str = "ru",
         args: tuple[str, ...] = None,
+        jobs: int = None,
         keep_logs: bool = False):
     kwargs: dict[str, str] = {
         "title-page": title_page,
@@ -786,7 +943,7 @@ def generate_yaml_command(
     root: Path = Path(root).joinpath("content/common")
     Branch.language = language
 
-    branches_yaml: dict[str, Any] = generate_branches(root)
+    branches_yaml: dict[str, Any] = generate_branches(root, jobs=jobs)
 
     yaml_config: YAMLConfig = YAMLConfig(language, root)
     yaml_config.set_settings(**kwargs)
@@ -5,18 +5,21 @@ from typing import Any, Iterable
 from click.core import Context, Parameter
 from click.decorators import argument, help_option, option, pass_context
 from click.termui import pause
-from click.types import BOOL
+from click.types import BOOL, Path as ClickPath
 from click.utils import echo
 from loguru import logger
 
 from utilities.common.config_file import config_file
 from utilities.common.functions import file_reader, pretty_print
-from utilities.common.shared import BASE_PATH, HELP, PRESS_ENTER_KEY
+from utilities.common.shared import BASE_PATH, HELP, PRESS_ENTER_KEY, separator, StrPath
 from utilities.scripts.api_group import MutuallyExclusiveOption, APIGroup
 from utilities.scripts.cli import cli
+from utilities.common.completion import dir_completion, file_completion
+from utilities.scripts.list_files import get_files
 from utilities.get_terms.ascii_doc_table_terms import AsciiDocTableTerms
-from utilities.get_terms.git_manager import git_manager
+from utilities.get_terms.git_manager import GitManager
 from utilities.get_terms.table import Term
+from utilities.get_terms.terms_scanner import TermsScanner
 
 SOURCES: Path = BASE_PATH.joinpath(config_file.get_commands("get-terms", "sources"))
 INFO_FILE: Path = SOURCES.joinpath(config_file.get_commands("get-terms", "info_file"))
@@ -134,6 +137,50 @@ def print_file(ctx: Context, param: Parameter, value: Any):
     show_default=True,
     required=False,
     default=config_file.get_commands("get-terms", "common_flag"))
+@option(
+    "-p", "--prefix", "prefix_flag",
+    is_flag=True,
+    help="\b\nФлаг вывода всех сокращений, начинающихся с заданных"
+         "\nсимволов",
+    show_default=True,
+    required=False,
+    default=config_file.get_commands("get-terms", "prefix_flag"))
+@option(
+    "--file", "files",
+    type=ClickPath(
+        exists=True,
+        file_okay=True,
+        readable=True,
+        resolve_path=True,
+        allow_dash=False,
+        dir_okay=False),
+    help="\b\nФайл для поиска всех известных сокращений."
+         "\nМожет использоваться несколько раз",
+    multiple=True,
+    required=False,
+    metavar="FILE ... FILE",
+    shell_complete=file_completion,
+    default=config_file.get_commands("get-terms", "files"))
+@option(
+    "-d", "--dir", "directory",
+    type=ClickPath(
+        file_okay=False,
+        resolve_path=True,
+        allow_dash=False,
+        dir_okay=True),
+    help="\b\nДиректория для поиска всех известных сокращений в файлах",
+    multiple=False,
+    required=False,
+    metavar="DIR",
+    shell_complete=dir_completion,
+    default=config_file.get_commands("get-terms", "directory"))
+@option(
+    "--refresh", "refresh_flag",
+    is_flag=True,
+    help="\b\nФлаг загрузки словаря из репозитория без использования кэша",
+    show_default=True,
+    required=False,
+    default=config_file.get_commands("get-terms", "refresh_flag"))
 @option(
     "-k/-K", "--keep-logs/--remove-logs",
     type=BOOL,
@@ -159,17 +206,14 @@ def get_terms_command(
         samples_flag: bool = False,
         abbr_flag: bool = False,
         ascii_flag: bool = False,
+        prefix_flag: bool = False,
+        refresh_flag: bool = False,
+        files: Iterable[StrPath] = None,
+        directory: StrPath = None,
         keep_logs: bool = False,
         common_flag: bool = False):
-    git_manager.set_content_git_files()
-    git_manager.compare_versions()
-    git_manager.set_terms()
-
-    lines: list[str] = list(iter(git_manager))
-
-    ascii_doc_table: AsciiDocTableTerms = AsciiDocTableTerms(lines)
-    ascii_doc_table.complete()
-    ascii_doc_table.set_terms()
+    git_manager: GitManager = GitManager()
+    ascii_doc_table: AsciiDocTableTerms = git_manager.get_table(refresh=refresh_flag)
 
     if all_flag:
         result: str = file_reader(INFO_FILE, "string")
@@ -187,6 +231,30 @@ def get_terms_command(
     elif samples_flag:
         result: str = file_reader(SAMPLES_FILE, "string")
 
+    elif files or directory is not None:
+        files: list[StrPath] = get_files(ctx, files=files, directory=directory)
+        terms_scanner: TermsScanner = TermsScanner(ascii_doc_table)
+        results: list[str] = []
+
+        for file in files:
+            terms_file: list[Term] = terms_scanner.scan_file(file)
+
+            if not terms_file:
+                continue
+
+            elif abbr_flag:
+                _: str = pretty_print(map(lambda x: x.abbr(), terms_file))
+
+            elif ascii_flag:
+                _: str = pretty_print(map(lambda x: x.ascii_doc(), terms_file))
+
+            else:
+                _: str = pretty_print(map(lambda x: x.formatted(), terms_file))
+
+            results.append(f"{separator}\nФайл {file}:\n{_}")
+
+        result: str = "\n".join(results) if results else "Сокращения в файлах не найдены"
+
     elif terms is None or not terms:
         echo("Не задана ни одна аббревиатура")
         result: str = ""
@@ -200,7 +268,16 @@ def get_terms_command(
         for term in terms:
             term: str = term.upper()
 
-            if term not in ascii_doc_table.terms_short():
+            if prefix_flag:
+                terms_short: list[str] = ascii_doc_table.terms_prefix(term)
+
+                if not terms_short:
+                    terms_print.append(Term())
+
+                for term_short in terms_short:
+                    terms_print.extend(ascii_doc_table.get(term_short))
+
+            elif term not in ascii_doc_table:
                 terms_print.append(Term())
 
             else:
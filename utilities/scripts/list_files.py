@@ -10,7 +10,7 @@ from click.utils import echo
 from loguru import logger
 
 from utilities.common.config_file import config_file
-from utilities.common.functions import is_windows, pretty_print, walk_full
+from utilities.common.functions import check_path, git_changed_files, is_windows, pretty_print, walk_full
 from utilities.common.shared import ADOC_EXTENSION, HELP, MD_EXTENSION, PRESS_ENTER_KEY, StrPath
 from utilities.scripts.api_group import MutuallyExclusiveOption, SwitchArgsAPIGroup
 from utilities.scripts.cli import cli
@@ -336,7 +336,8 @@ def list_files_command(
             ignored_files=ignored_files,
             extensions=extensions,
             language=language,
-            hidden=hidden)
+            hidden=hidden,
+            recursive=recursive)
 
     if values is None or not values:
         if auxiliary:
@@ -357,13 +358,61 @@ def list_files_command(
             ctx.obj["keep_logs"] = keep_logs
 
 
+def list_changed_files(
+        directory: Path, *,
+        changed_since: str | None = None,
+        staged: bool = False,
+        recursive: bool = True,
+        language: str | None = None,
+        extensions: str = "md adoc") -> list[Path]:
+    """Gets the files changed in git filtered the same way as the files in the directory.
+
+    :param directory: The directory to get the changed files in.
+    :type directory: Path
+    :param changed_since: The git reference to compare with.
+    :type changed_since: str or None
+    :param staged: The flag to get only the staged changes.
+    :type staged: bool
+    :param recursive: The flag to take the files in the subdirectories.
+    :type recursive: bool
+    :param language: The language of the files, see get_files.
+    :type language: str or None
+    :param extensions: The extensions of the files separated by spaces.
+    :type extensions: str
+    :return: The paths relative to the directory.
+    :rtype: list[Path]
+    """
+    if language is None:
+        language: str | None = ""
+
+    elif not language:
+        language: str | None = None
+
+    elif language.lower() == "ru":
+        language: str | None = ""
+
+    else:
+        language: str | None = language.lower()
+
+    ignored_files: set[str] = {*config_file.get_commands("list-files", "ignored_files")}
+    suffixes: set[str] = {f".{extension.lstrip('.')}" for extension in extensions.split()}
+    paths: list[Path] = [
+        path
+        for path in git_changed_files(directory, changed_since=changed_since, staged=staged)
+        if (recursive or len(path.parts) == 1)
+        and check_path(directory.joinpath(path), None, ignored_files, suffixes, language)]
+    return sorted(paths, key=lambda p: (len(p.parent.parts), str(p.parent), p.name))
+
+
 def get_files(
         ctx: Context, *,
         files: Iterable[StrPath] = None,
         directory: StrPath = None,
         recursive: bool = True,
         language: str | None = None,
-        extensions: str = "md adoc"):
+        extensions: str = "md adoc",
+        changed_since: str | None = None,
+        staged: bool = False):
     if files is None and directory is None:
         logger.error("Хотя бы один из параметров --file, --dir должен быть задан")
         pause(PRESS_ENTER_KEY)
@@ -374,7 +423,24 @@ def get_files(
     else:
         files: list[StrPath] = [*files]
 
-    if directory is not None:
+    if directory is not None and (changed_since is not None or staged):
+        directory: Path = Path(directory).expanduser()
+        listed_files: list[Path] = list_changed_files(
+            directory,
+            changed_since=changed_since,
+            staged=staged,
+            recursive=recursive,
+            language=language,
+            extensions=extensions)
+
+        if listed_files:
+            files.extend(map(directory.joinpath, listed_files))
+            logger.debug(f"Обрабатываемые измененные файлы:\n{pretty_print(files)}")
+
+        else:
+            logger.debug("Нет измененных файлов для обработки")
+
+    elif directory is not None:
         directory: Path = Path(directory).expanduser()
 
         if language is None:
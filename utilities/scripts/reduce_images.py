@@ -5,15 +5,17 @@ from typing import Iterable
 from click.core import Context
 from click.decorators import help_option, option, pass_context
 from click.termui import echo
-from click.types import BOOL, Path as ClickPath
+from click.types import BOOL, FloatRange, IntRange, Path as ClickPath, STRING
 from loguru import logger
-from PIL import Image
 
 from utilities.common.config_file import config_file
 from utilities.common.shared import HELP, separator, StrPath
 from utilities.scripts.api_group import APIGroup, ConditionalOption
 from utilities.scripts.cli import cli
 from utilities.common.completion import dir_completion, file_completion
+from utilities.reduce_images.inventory import ImageInfo, inventory, write_report
+from utilities.reduce_images.manifest import Manifest
+from utilities.reduce_images.reducer import EncodeOptions, reduce_images
 from utilities.scripts.list_files import get_files
 
 
@@ -82,6 +84,133 @@ def file_size(value: int) -> str:
     show_default=True,
     required=False,
     default=config_file.get_commands("reduce-images", "dry_run"))
+@option(
+    "-t", "--threshold",
+    type=FloatRange(0.0, 1.0),
+    help="\b\nМинимальное относительное уменьшение размера, при котором"
+         "\nфайл перезаписывается."
+         "\nПо умолчанию: 0.05, размер должен уменьшиться хотя бы на 5%",
+    multiple=False,
+    required=False,
+    metavar="RATIO",
+    default=config_file.get_commands("reduce-images", "threshold"))
+@option(
+    "--max-width", "max_width",
+    type=IntRange(min=1),
+    help="\b\nМаксимальная ширина изображения в пикселях. Изображения"
+         "\nбольшего размера уменьшаются с сохранением пропорций."
+         "\nПо умолчанию: не задано, ширина не ограничена",
+    multiple=False,
+    required=False,
+    metavar="PIXELS",
+    default=config_file.get_commands("reduce-images", "max_width"))
+@option(
+    "--max-height", "max_height",
+    type=IntRange(min=1),
+    help="\b\nМаксимальная высота изображения в пикселях. Изображения"
+         "\nбольшего размера уменьшаются с сохранением пропорций."
+         "\nПо умолчанию: не задано, высота не ограничена",
+    multiple=False,
+    required=False,
+    metavar="PIXELS",
+    default=config_file.get_commands("reduce-images", "max_height"))
+@option(
+    "-q", "--quality",
+    type=IntRange(1, 95),
+    help="\b\nКачество сжатия изображений JPG от 1 до 95."
+         "\nПо умолчанию: не задано, используется качество 75",
+    multiple=False,
+    required=False,
+    metavar="QUALITY",
+    default=config_file.get_commands("reduce-images", "quality"))
+@option(
+    "--progressive/--no-progressive",
+    type=BOOL,
+    is_flag=True,
+    help="\b\nФлаг сохранения изображений JPG в прогрессивном формате."
+         "\nПо умолчанию: False, используется базовый формат",
+    show_default=True,
+    required=False,
+    default=config_file.get_commands("reduce-images", "progressive"))
+@option(
+    "--colors", "colors",
+    type=IntRange(2, 256),
+    help="\b\nКоличество цветов в палитре для изображений PNG от 2 до 256."
+         "\nПо умолчанию: не задано, палитра не используется",
+    multiple=False,
+    required=False,
+    metavar="COLORS",
+    default=config_file.get_commands("reduce-images", "colors"))
+@option(
+    "--max-colors", "max_colors",
+    type=IntRange(min=2),
+    help="\b\nМаксимальное количество уникальных цветов в изображении PNG,"
+         "\nпри котором оно переводится в палитру. Изображения с большим"
+         "\nколичеством цветов пропускаются без попытки перевода."
+         "\nПо умолчанию: 4096",
+    multiple=False,
+    required=False,
+    metavar="COLORS",
+    default=config_file.get_commands("reduce-images", "max_colors"))
+@option(
+    "--dither/--no-dither",
+    type=BOOL,
+    is_flag=True,
+    help="\b\nФлаг сглаживания цветов при переводе в палитру."
+         "\nПо умолчанию: False, цвета заменяются ближайшими",
+    show_default=True,
+    required=False,
+    default=config_file.get_commands("reduce-images", "dither"))
+@option(
+    "-j", "--jobs",
+    type=IntRange(min=1),
+    help="\b\nКоличество параллельных процессов."
+         "\nПо умолчанию: количество процессоров",
+    multiple=False,
+    required=False,
+    metavar="JOBS",
+    default=config_file.get_commands("reduce-images", "jobs"))
+@option(
+    "-m", "--manifest", "manifest",
+    type=ClickPath(
+        file_okay=True,
+        resolve_path=True,
+        allow_dash=False,
+        dir_okay=False),
+    help="\b\nФайл манифеста с уже оптимизированными изображениями."
+         "\nИзображения из манифеста, обработанные с теми же параметрами,"
+         "\nпропускаются без чтения."
+         "\nПо умолчанию: manifest.json в директории приложения",
+    multiple=False,
+    required=False,
+    metavar="FILE",
+    shell_complete=file_completion,
+    default=config_file.get_commands("reduce-images", "manifest"))
+@option(
+    "--report", "report",
+    type=ClickPath(
+        file_okay=True,
+        resolve_path=True,
+        allow_dash=False,
+        dir_okay=False),
+    help="\b\nФайл отчета об изображениях без их изменения: формат, размеры"
+         "\nв пикселях, вес, DPI и оценка лишнего веса. Читаются только"
+         "\nзаголовки файлов. Формат отчета JSON для файла .json, иначе CSV."
+         "\nПо умолчанию: не задано, изображения обрабатываются",
+    multiple=False,
+    required=False,
+    metavar="FILE",
+    shell_complete=file_completion,
+    default=config_file.get_commands("reduce-images", "report"))
+@option(
+    "--force/--no-force",
+    type=BOOL,
+    is_flag=True,
+    help="\b\nФлаг обработки всех изображений без учета манифеста."
+         "\nПо умолчанию: False, изображения из манифеста пропускаются",
+    show_default=True,
+    required=False,
+    default=config_file.get_commands("reduce-images", "force"))
 @option(
     "-r/-R", "--recursive/--no-recursive",
     type=BOOL,
@@ -91,6 +220,25 @@ def file_size(value: int) -> str:
     show_default=True,
     required=False,
     default=config_file.get_commands("reduce-images", "recursive"))
+@option(
+    "--changed-since", "changed_since",
+    type=STRING,
+    help="\b\nGit-ссылка для обработки только измененных файлов в директории."
+         "\nФайлы сравниваются с общим предком ссылки и текущей ветки."
+         "\nПо умолчанию: не задано, обрабатываются все файлы",
+    multiple=False,
+    required=False,
+    metavar="REF",
+    default=config_file.get_commands("reduce-images", "changed_since"))
+@option(
+    "--staged/--no-staged", "staged",
+    type=BOOL,
+    is_flag=True,
+    help="\b\nФлаг обработки только файлов в директории, добавленных в индекс git."
+         "\nПо умолчанию: False, обрабатываются все файлы",
+    show_default=True,
+    required=False,
+    default=config_file.get_commands("reduce-images", "staged"))
 @option(
     "-k/-K", "--keep-logs/--remove-logs",
     type=BOOL,
@@ -112,6 +260,20 @@ def reduce_images_command(
         directory: StrPath = None,
         recursive: bool = True,
         dry_run: bool = False,
+        threshold: float = 0.05,
+        max_width: int = None,
+        max_height: int = None,
+        quality: int = None,
+        progressive: bool = False,
+        colors: int = None,
+        max_colors: int = 4096,
+        dither: bool = False,
+        jobs: int = None,
+        manifest: StrPath = None,
+        force: bool = False,
+        report: StrPath = None,
+        changed_since: str = None,
+        staged: bool = False,
         keep_logs: bool = False):
     extensions: str = "png jpg jpeg bmp"
 
@@ -120,41 +282,64 @@ def reduce_images_command(
         files=files,
         directory=directory,
         recursive=recursive,
-        extensions=extensions)
+        extensions=extensions,
+        changed_since=changed_since,
+        staged=staged)
 
     if files is not None and files:
-        before: int = 0
-        after: int = 0
+        paths: list[Path] = [*dict.fromkeys(Path(file).expanduser().resolve() for file in files)]
+
+        if report is not None:
+            infos: list[ImageInfo] = inventory(paths, max_width, max_height, jobs=jobs)
+            write_report(infos, report)
+            wasted: int = sum(info.wasted for info in infos)
 
-        for file in files:
-            file: Path = Path(file).expanduser().resolve()
+            echo(separator)
+            echo(f"Изображений: {len(infos)}, оценка лишнего веса: {file_size(wasted) if wasted else '0 б'}")
+
+        else:
+            options: EncodeOptions = EncodeOptions(
+                max_width, max_height, quality, progressive, colors, max_colors, dither)
+            _manifest: Manifest = Manifest(f"threshold={threshold}, {options}", manifest)
+            before: int = 0
+            after: int = 0
 
-            logger.debug(f"Файл {file}")
+            if not force:
+                _manifest.load()
+                optimized: set[Path] = {path for path in paths if _manifest.is_optimized(path)}
+                paths: list[Path] = [path for path in paths if path not in optimized]
+                logger.info(f"Пропущено уже оптимизированных изображений: {len(optimized)}")
 
-            current_size: int = file.stat(follow_symlinks=True).st_size
-            before += current_size
+            for result in reduce_images(
+                    paths, threshold, dry_run, options, jobs=jobs, is_debug=ctx.obj.get("debug", False)):
+                logger.debug(f"Файл {result.path}")
 
-            if dry_run:
-                result: StrPath = file.with_stem("temp_file_")
+                if not dry_run:
+                    _manifest.add(result.path, result.digest)
 
-            else:
-                result: StrPath = file
+                before += result.before
+                after += result.after
 
-            with Image.open(file, "r") as image:
-                image.save(result, optimize=True)
+                palette: str = ", палитра" if result.quantized else ""
 
-            new_size: int = result.stat(follow_symlinks=True).st_size
+                if result.replaced:
+                    logger.info(
+                        f"Файл {result.path.name}: {file_size(result.before)} -> {file_size(result.encoded)}, "
+                        f"экономия {result.saving:.1%}{palette}")
 
-            after += new_size
-            logger.info(f"Файл {file.name}: {file_size(current_size)} -> {file_size(new_size)}")
+                else:
+                    logger.info(
+                        f"Файл {result.path.name}: {file_size(result.before)}, оставлен без изменений, "
+                        f"после сжатия {file_size(result.encoded)}{palette}")
 
-            if result.stem.startswith("temp_file_"):
-                result.unlink(missing_ok=True)
+            if not dry_run:
+                _manifest.save()
 
-        echo(separator)
-        echo(f"Итоговое изменение: {file_size(before)} -> {file_size(after)}")
+            if before:
+                echo(separator)
+                echo(f"Итоговое изменение: {file_size(before)} -> {file_size(after)}")
 
-    if dry_run:
+    if dry_run and report is None:
         echo("Файлы не были изменены, поскольку использована опция --dry-run")
 
     ctx.obj["keep_logs"] = keep_logs
@@ -5,7 +5,7 @@ from typing import Iterable
 
 from click.core import Context
 from click.decorators import help_option, option, pass_context
-from click.types import BOOL, Path as ClickPath
+from click.types import BOOL, Path as ClickPath, STRING
 from click.utils import echo
 from loguru import logger
 
@@ -61,6 +61,25 @@ from utilities.scripts.list_files import get_files
     show_default=True,
     required=False,
     default=config_file.get_commands("repair-svg", "recursive"))
+@option(
+    "--changed-since", "changed_since",
+    type=STRING,
+    help="\b\nGit-ссылка для обработки только измененных файлов в директории."
+         "\nФайлы сравниваются с общим предком ссылки и текущей ветки."
+         "\nПо умолчанию: не задано, обрабатываются все файлы",
+    multiple=False,
+    required=False,
+    metavar="REF",
+    default=config_file.get_commands("repair-svg", "changed_since"))
+@option(
+    "--staged/--no-staged", "staged",
+    type=BOOL,
+    is_flag=True,
+    help="\b\nФлаг обработки только файлов в директории, добавленных в индекс git."
+         "\nПо умолчанию: False, обрабатываются все файлы",
+    show_default=True,
+    required=False,
+    default=config_file.get_commands("repair-svg", "staged"))
 @option(
     "-k/-K", "--keep-logs/--remove-logs",
     type=BOOL,
@@ -81,13 +100,17 @@ def repair_svg_command(
         files: Iterable[StrPath] = None,
         directory: StrPath = None,
         recursive: bool = True,
+        changed_since: str = None,
+        staged: bool = False,
         keep_logs: bool = False):
     files: list[StrPath] | None = get_files(
         ctx,
         files=files,
         directory=directory,
         recursive=recursive,
-        extensions="svg")
+        extensions="svg",
+        changed_since=changed_since,
+        staged=staged)
 
     if files is not None and files:
         FOREIGN_OBJECT: str = "<foreignObject.*?</foreignObject>"
@@ -3,7 +3,7 @@ from typing import Iterable
 
 from click.core import Context
 from click.decorators import help_option, option, pass_context
-from click.types import BOOL, INT, Path as ClickPath
+from click.types import BOOL, INT, Path as ClickPath, STRING
 from loguru import logger
 
 from utilities.common.config_file import config_file
@@ -86,6 +86,16 @@ MIN_COLUMN: int = config_file.get_commands("set-table-cols", "min_column")
     show_default=True,
     required=False,
     default=config_file.get_commands("set-table-cols", "add_options"))
+@option(
+    "--stream/--no-stream", "stream",
+    type=BOOL,
+    is_flag=True,
+    help="\b\nФлаг потоковой обработки файлов. Таблицы обрабатываются"
+         "\nпо мере чтения файла, в памяти хранится только текущая таблица."
+         "\nПо умолчанию: False, файл считывается целиком",
+    show_default=True,
+    required=False,
+    default=config_file.get_commands("set-table-cols", "stream"))
 @option(
     "-r/-R", "--recursive/--no-recursive",
     type=BOOL,
@@ -95,6 +105,25 @@ MIN_COLUMN: int = config_file.get_commands("set-table-cols", "min_column")
     show_default=True,
     required=False,
     default=config_file.get_commands("set-table-cols", "recursive"))
+@option(
+    "--changed-since", "changed_since",
+    type=STRING,
+    help="\b\nGit-ссылка для обработки только измененных файлов в директории."
+         "\nФайлы сравниваются с общим предком ссылки и текущей ветки."
+         "\nПо умолчанию: не задано, обрабатываются все файлы",
+    multiple=False,
+    required=False,
+    metavar="REF",
+    default=config_file.get_commands("set-table-cols", "changed_since"))
+@option(
+    "--staged/--no-staged", "staged",
+    type=BOOL,
+    is_flag=True,
+    help="\b\nФлаг обработки только файлов в директории, добавленных в индекс git."
+         "\nПо умолчанию: False, обрабатываются все файлы",
+    show_default=True,
+    required=False,
+    default=config_file.get_commands("set-table-cols", "staged"))
 @option(
     "-k/-K", "--keep-logs/--remove-logs",
     type=BOOL,
@@ -118,6 +147,9 @@ def set_table_cols_command(
         max_symbols: int = MAX_SYMBOLS,
         min_column: int = MIN_COLUMN,
         add_options: bool = True,
+        stream: bool = False,
+        changed_since: str = None,
+        staged: bool = False,
         keep_logs: bool = False):
     if add_options:
         options: dict[str, str] | None = {
@@ -132,19 +164,27 @@ def set_table_cols_command(
         files=files,
         directory=directory,
         recursive=recursive,
-        extensions="adoc")
+        extensions="adoc",
+        changed_since=changed_since,
+        staged=staged)
 
     if files is not None and files:
         table_analyser: TableAnalyser = TableAnalyser(max_symbols=max_symbols, min_column=min_column)
 
         for file in files:
             logger.debug(f"Файл {file}")
-            content: list[str] = file_reader(file, "lines", encoding="utf-8")
-            ascii_doc_file: AsciiDocFile = AsciiDocFile(file, content=content)
-            ascii_doc_file.set_tables()
-            ascii_doc_file.fix_tables(table_analyser, options)
-            ascii_doc_file.replace_tables()
-            ascii_doc_file.save()
+
+            if stream:
+                ascii_doc_file: AsciiDocFile = AsciiDocFile(file)
+                ascii_doc_file.stream_tables(table_analyser, options)
+
+            else:
+                content: list[str] = file_reader(file, "lines", encoding="utf-8")
+                ascii_doc_file: AsciiDocFile = AsciiDocFile(file, content=content)
+                ascii_doc_file.set_tables()
+                ascii_doc_file.fix_tables(table_analyser, options)
+                ascii_doc_file.replace_tables()
+                ascii_doc_file.save()
 
             logger.info(f"Файл {file} обработан и сохранен")
 
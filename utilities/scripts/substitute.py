@@ -4,7 +4,7 @@ from typing import Iterable, Mapping
 
 from click.core import Context
 from click.decorators import argument, help_option, option, pass_context
-from click.types import BOOL, Path as ClickPath
+from click.types import BOOL, Path as ClickPath, STRING
 from loguru import logger
 
 from utilities.common.completion import file_completion
@@ -101,6 +101,25 @@ def substitute(replace_table: Mapping[str, str], file: StrPath, dry_run: bool =
     show_default=True,
     required=False,
     default=config_file.get_commands("substitute", "recursive"))
+@option(
+    "--changed-since", "changed_since",
+    type=STRING,
+    help="\b\nGit-ссылка для обработки только измененных файлов в директории."
+         "\nФайлы сравниваются с общим предком ссылки и текущей ветки."
+         "\nПо умолчанию: не задано, обрабатываются все файлы",
+    multiple=False,
+    required=False,
+    metavar="REF",
+    default=config_file.get_commands("substitute", "changed_since"))
+@option(
+    "--staged/--no-staged", "staged",
+    type=BOOL,
+    is_flag=True,
+    help="\b\nФлаг обработки только файлов в директории, добавленных в индекс git."
+         "\nПо умолчанию: False, обрабатываются все файлы",
+    show_default=True,
+    required=False,
+    default=config_file.get_commands("substitute", "staged"))
 @option(
     "-k/-K", "--keep-logs/--remove-logs",
     type=BOOL,
@@ -123,13 +142,17 @@ def substitute_command(
         directory: StrPath = None,
         recursive: bool = True,
         dry_run: bool = False,
+        changed_since: str = None,
+        staged: bool = False,
         keep_logs: bool = False):
     files: list[StrPath] | None = get_files(
         ctx,
         files=files,
         directory=directory,
         recursive=recursive,
-        extensions="adoc")
+        extensions="adoc",
+        changed_since=changed_since,
+        staged=staged)
 
     if file_table.suffix in (".json", ".json5"):
         file_type: FileType = "json"
@@ -1,23 +1,11 @@
 # -*- coding: utf-8 -*-
-from collections import Counter
 from re import DOTALL, sub
 from string import ascii_letters, digits
 
 from slugify import slugify
 
 from utilities.set_table_cols.coordinate import TableCoordinate
-
-
-def fix_length(text: str):
-    NARROW: str = ":;.\",!'`/"
-    MEDIUM: str = "{}[]$#()"
-
-    counter: Counter = Counter(text)
-
-    narrow: int = sum((counter.get(_, 0) for _ in NARROW), 0)
-    medium: int = sum((counter.get(_, 0) for _ in MEDIUM), 0)
-
-    return len(text) - 2 * narrow - medium
+from utilities.set_table_cols.width import text_width
 
 
 class TableCell:
@@ -33,6 +21,7 @@ class TableCell:
         self._text: str = text
         self._row_modifier: int = row_modifier
         self._column_modifier: int = column_modifier
+        self._processed_text: str | None = None
 
     def __hash__(self):
         return hash(self._table_coordinate.coord)
@@ -68,7 +57,16 @@ class TableCell:
         return _
 
     def processed_text(self):
-        """Gets the raw text modified for the standards and recommendations."""
+        """Gets the raw text modified for the standards and recommendations.
+
+        The text is processed only once since the cell text is not changed.
+        """
+        if self._processed_text is None:
+            self._processed_text = self._process_text()
+
+        return self._processed_text
+
+    def _process_text(self) -> str:
         # implemented to process names of standards and specifications as a single word
         replacements: tuple[tuple[str, str], ...] = (
             ("3GPP ", "3GPP_"),
@@ -153,21 +151,26 @@ class TableCell:
     def minimum_length(self) -> int:
         """Gets the minimum width of the column to place the text without hyphenation.
 
-        Based on the maximum length of separate words.
+        Based on the maximum width of separate words.
         """
-        if not bool(self) or not self.processed_text():
+        if not bool(self):
+            return 0
+
+        processed_text: str = self.processed_text()
+
+        if not processed_text:
             return 0
 
         elif self.is_spaced():
-            return max(map(fix_length, self.processed_text().split()))
+            return max(map(text_width, processed_text.split()))
 
         else:
-            return fix_length(self.processed_text())
+            return text_width(processed_text)
 
     @property
     def preferred_length(self) -> int:
-        """Gets the complete length of the text counting all symbols."""
-        return len(self.processed_text())
+        """Gets the complete width of the text counting all symbols."""
+        return text_width(self.processed_text())
 
     def __len__(self):
         return self.preferred_length
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
+from collections import deque
+from os import replace
 from pathlib import Path
-from re import finditer
+from re import compile, Pattern
 from string import digits
 from typing import Iterable, Iterator, Mapping
 
@@ -11,6 +13,29 @@ from utilities.common.functions import file_writer
 from utilities.set_table_cols.analyser import TableAnalyser
 from utilities.set_table_cols.table import Table
 
+# sign '=' is used for options like 'key="value"'
+# sign '%' is used for options like '%key'
+PATTERN_OPTIONS: Pattern = compile(r"(\w+=\"[^\"]+\"|%[^,]+)")
+BUFFER_SIZE: int = 1 << 16
+
+
+def parse_options(options_str: str) -> dict[str, str | None]:
+    """Gets the table options from the line '[key="value",%key]'."""
+    options: dict[str, str | None] = {}
+
+    for m in PATTERN_OPTIONS.finditer(options_str):
+        # separate options due to their format
+        option: str = m.group(1)
+
+        if option.startswith("%"):
+            options[option] = None
+
+        else:
+            k, v = option.split("=", 1)
+            options[k] = v[1:-1]
+
+    return options
+
 
 class AsciiDocFile:
     def __init__(
@@ -91,61 +116,71 @@ class AsciiDocFile:
         for i in range(len(table_marks) // 2):
             yield table_marks[2 * i], table_marks[2 * i + 1]
 
-    def set_tables(self):
-        """Specifies the tables in the file."""
-        PATTERN_OPTIONS: str = r"(\w+=\"[^\"]+\"|%[^,]+)"
-
-        # get the limits by the '|===' lines
-        for index, (start, stop) in enumerate(self.table_borders()):
-            lines: list[str] = self[start + 1:stop]
-
-            options: dict[str, str | None] = {}
-
-            # gets the options if specified
-            # sign '=' is used for options like 'key="value"'
-            # sign '%' is used for options like '%key'
-            if start >= 1:
-                options_str: str = self[start - 1]
-                is_char: bool = any(char in self[start - 1] for char in "=%")
-                is_start: bool = options_str.startswith("[")
-                is_end: bool = options_str.endswith("]")
+    def build_table(
+            self,
+            index: int,
+            lines: Iterable[str],
+            options_line: str | None = None,
+            name_line: str | None = None) -> Table | None:
+        """Generates the table from the lines between the borders.
+
+        :param index: The table order number in the file.
+        :type index: int
+        :param lines: The lines between the '|===' borders.
+        :type lines: Iterable[str]
+        :param options_line: The line preceding the opening border.
+        :type options_line: str or None
+        :param name_line: The line preceding the options line.
+        :type name_line: str or None
+        :return: The table if it has distinguished cells, otherwise, None.
+        :rtype: Table or None
+        """
+        options: dict[str, str | None] = {}
+
+        # gets the options if specified
+        if options_line is not None:
+            is_char: bool = any(char in options_line for char in "=%")
+            is_start: bool = options_line.startswith("[")
+            is_end: bool = options_line.endswith("]")
+
+            if any(_ is True for _ in (is_char, is_start, is_end)):
+                options.update(parse_options(options_line))
+
+        # check if the table_cols has a specified name
+        if name_line is not None and name_line.startswith("."):
+            name: str = name_line
+
+        # otherwise, set the name as <filename>_<table_cols order number in the file>
+        else:
+            name: str = f"{self._path.with_suffix('')}_{index}"
 
-                if any(_ is True for _ in (is_char, is_start, is_end)):
-                    for m in finditer(PATTERN_OPTIONS, options_str):
-                        # separate options due to their format
-                        option: str = m.group(1)
+        table: Table = Table(name, index, lines, options)
+        table.define_cells()
 
-                        if option.startswith("%"):
-                            options[option] = None
+        # check if the text has distinguished cells
+        if len(table.table_cells) > 0:
+            logger.debug(f"Таблица {name}, номер {index}")
+            return table
 
-                        else:
-                            k, v = option.split("=", 1)
-                            options[k] = v[1:-1]
-
-            # check if the table_cols has a specified name
-            if start > 2 and self[start - 2].startswith("."):
-                name: str = self[start - 2]
+        else:
+            _: str = "\n".join(iter(table))
 
-            # otherwise, set the name as <filename>_<table_cols order number in the file>
-            else:
-                name: str = f"{self._path.with_suffix('')}_{index}"
+            logger.debug(
+                f"Таблица {table.name} не может быть обработана\n"
+                f"Строки:\n{_}")
+            return None
 
-            table: Table = Table(name, index, lines, options)
-            table.define_cells()
+    def set_tables(self):
+        """Specifies the tables in the file."""
+        # get the limits by the '|===' lines
+        for index, (start, stop) in enumerate(self.table_borders()):
+            options_line: str | None = self[start - 1] if start >= 1 else None
+            name_line: str | None = self[start - 2] if start > 2 else None
+            table: Table | None = self.build_table(index, self[start + 1:stop], options_line, name_line)
 
-            # check if the text has distinguished cells
-            if len(table.table_cells) > 0:
+            if table is not None:
                 self._tables.append((table, start, stop))
 
-                logger.debug(f"Таблица {name}, номер {index}")
-
-            else:
-                _: str = "\n".join(iter(table))
-
-                logger.debug(
-                    f"Таблица {table.name} не может быть обработана\n"
-                    f"Строки:\n{_}")
-
     def replace_tables(self):
         """Replaces tables with the modified ones."""
         lines: list[str] = self[:]
@@ -159,56 +194,147 @@ class AsciiDocFile:
         """Adds the 'cols' option if not specified."""
         table: Table
         for table, *_ in self._tables:
-            table_analyser.nullify()
+            self.fix_table(table, table_analyser, options)
 
-            logger.debug(repr(table))
-            logger.debug(str(table))
+    def fix_table(self, table: Table, table_analyser: TableAnalyser, options: Mapping[str, str] = None):
+        """Adds the 'cols' option to the table if not specified."""
+        table_analyser.nullify()
 
-            # skip table_cols if it has spanned cells
-            if table.has_horizontal_span():
-                logger.warning(
-                    "В таблице есть объединенные горизонтальные ячейки.\n"
-                    "На данный момент такие таблицы оставляются как есть.\n"
-                    f"Таблица {table.index}, {table.name}")
-                continue
+        logger.debug(repr(table))
+        logger.debug(str(table))
 
-            # skip table_cols if it already has cols option
-            elif "cols" in table.options and any(digit in table.options.get("cols") for digit in digits):
-                logger.debug(f"Для таблицы {table.index}, {table.name} уже заданы ширины столбцов")
-                continue
+        # skip table_cols if it has spanned cells
+        if table.has_horizontal_span():
+            logger.warning(
+                "В таблице есть объединенные горизонтальные ячейки.\n"
+                "На данный момент такие таблицы оставляются как есть.\n"
+                f"Таблица {table.index}, {table.name}")
 
-            # skip tables if some text has been accidentally processed as table_cols
-            elif not bool(table):
-                _: str = "\n".join(iter(table))
+        # skip table_cols if it already has cols option
+        elif "cols" in table.options and any(digit in table.options.get("cols") for digit in digits):
+            logger.debug(f"Для таблицы {table.index}, {table.name} уже заданы ширины столбцов")
 
-                logger.warning(
-                    f"Не удалось корректно обработать текст:\n{_}")
-                continue
+        # skip tables if some text has been accidentally processed as table_cols
+        elif not bool(table):
+            _: str = "\n".join(iter(table))
+
+            logger.warning(
+                f"Не удалось корректно обработать текст:\n{_}")
+
+        else:
+            if options is None:
+                logger.debug("Опции не заданы, поэтому данный шаг пропущен")
 
             else:
-                if options is None:
-                    logger.debug("Опции не заданы, поэтому данный шаг пропущен")
+                for k, v in options.items():
+                    if k not in table.options:
+                        table.options[k] = v
+
+                    else:
+                        logger.debug(
+                            f"Опции {k} уже задано значение {table.options.get(k)} "
+                            f"в таблице {table.name} файла {self._path}")
+
+            table_analyser._column_parameters = [
+                table_column.column_parameters()
+                for table_column in table.iter_column_items()]
+            table_analyser._table_id = f"{self._path.name}, {table.name}"
+            table_analyser.adjust()
+            table_analyser.inspect_valid()
+            table_analyser.set_base_column_widths()
+            table_analyser.distribute_rest()
+            table.options["cols"] = str(table_analyser)
+            logger.debug(f"Столбцы: {str(table_analyser)}")
+
+    def stream_tables(
+            self,
+            table_analyser: TableAnalyser,
+            options: Mapping[str, str] = None, *,
+            buffer_size: int = BUFFER_SIZE):
+        """Processes the tables while reading the file line by line.
+
+        Each table is modified and written as soon as its closing border '|===' is read,
+        so only the lines of the current table are kept in memory.
+        The result is written to the temporary file that replaces the original one afterwards.
+
+        :param table_analyser: The analyser to specify the column widths.
+        :type table_analyser: TableAnalyser
+        :param options: The table options to add.
+        :type options: Mapping[str, str] or None
+        :param buffer_size: The size of the writer buffer in bytes.
+        :type buffer_size: int
+        """
+        temp_path: Path = self._path.with_name(f"{self._path.name}.tmp")
+        # the last lines before the table: options and name
+        previous: deque[str] = deque(maxlen=2)
+        table_lines: list[str] | None = None
+        border: str = ""
+        start: int = 0
+        # the closing border of the last modified table
+        stop: int = -2
+        index: int = 0
+
+        try:
+            with (
+                open(self._path, "r", encoding="utf-8", errors="ignore") as fr,
+                open(temp_path, "w", encoding="utf-8", errors="ignore", buffering=buffer_size) as fw
+            ):
+                for line_index, line in enumerate(fr):
+                    if table_lines is None:
+                        if line.startswith("|==="):
+                            table_lines = []
+                            border = line
+                            start = line_index
+
+                        else:
+                            # the line is written only when it cannot become the options line
+                            if len(previous) == 2:
+                                fw.write(previous[0])
+
+                            previous.append(line)
+
+                    elif line.startswith("|==="):
+                        options_line: str | None = previous[-1] if previous else None
+                        name_line: str | None = previous[0] if start > 2 and len(previous) == 2 else None
+                        table: Table | None = self.build_table(index, table_lines, options_line, name_line)
 
-                else:
-                    for k, v in options.items():
-                        if k not in table.options:
-                            table.options[k] = v
+                        if len(previous) == 2:
+                            fw.write(previous[0])
+
+                        if table is None:
+                            if previous:
+                                fw.write(previous[-1])
+
+                            fw.write(f"{border}{''.join(table_lines)}{line}")
 
                         else:
-                            logger.debug(
-                                f"Опции {k} уже задано значение {table.options.get(k)} "
-                                f"в таблице {table.name} файла {self._path}")
-
-                table_analyser._column_parameters = [
-                    table_column.column_parameters()
-                    for table_column in table.iter_column_items()]
-                table_analyser._table_id = f"{self._path.name}, {table.name}"
-                table_analyser.adjust()
-                table_analyser.inspect_valid()
-                table_analyser.set_base_column_widths()
-                table_analyser.distribute_rest()
-                table.options["cols"] = str(table_analyser)
-                logger.debug(f"Столбцы: {str(table_analyser)}")
+                            self.fix_table(table, table_analyser, options)
+                            # the table right after the modified one replaces its closing border,
+                            # so no empty line is added, see replace_tables
+                            fw.write(str(table) if start == stop + 1 else f"\n{str(table)}")
+                            stop = line_index
+
+                        previous.clear()
+                        table_lines = None
+                        index += 1
+
+                    else:
+                        table_lines.append(line)
+
+                if table_lines is not None:
+                    logger.error(
+                        f"В файле {self._path} пропущен символ завершения таблицы '|==='\n"
+                        f"Незакрытая таблица начинается в строке {start}",
+                        tech_writers=True)
+                    raise TableColsTableBorderNotClosedError
+
+                fw.writelines(previous)
+
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        replace(temp_path, self._path)
 
     def save(self):
         file_writer(self._path, self._content)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+The module to estimate the rendered widths of the texts in the table cells.
+
+The width of each character is specified in units, UNITS units per one average symbol.
+Every character is translated to the string of the length equal to its width,
+so the text width is computed with the single str.translate call.
+
+The widths are derived from the font used for the tables in the PDF theme if it is found.
+Otherwise, the characters are divided into the narrow, medium, and wide classes.
+"""
+from functools import cache
+from math import ceil
+from pathlib import Path
+from string import ascii_lowercase
+
+from loguru import logger
+
+from utilities.common.config_file import config_file
+from utilities.common.shared import BASE_PATH, StrPath
+
+UNITS: int = 4
+
+NARROW: str = ":;.\",!'`/|Iijl "
+MEDIUM: str = "{}[]$#()*-frst"
+WIDE: str = "MWmw@%&ЖШЩЮМФЫжшщюфы—№"
+
+# the characters to measure with the font
+CHARSET: str = "".join(
+    (*map(chr, range(0x20, 0x7f)), *map(chr, range(0x410, 0x450)), "Ёё«»—–№"))
+
+
+class CharWidths(dict):
+    """Class to represent the mapping of character codes to the width strings.
+
+    The characters not specified explicitly get the default width.
+    The default value is stored at the first request, so str.translate calls Python code
+    only once per every new character.
+    """
+
+    def __init__(self, widths: dict[str, int] = None, default: int = UNITS):
+        if widths is None:
+            widths: dict[str, int] = {}
+
+        super().__init__({ord(char): "." * width for char, width in widths.items()})
+        self._default: str = "." * default
+
+    def __missing__(self, key: int) -> str:
+        self[key] = self._default
+        return self._default
+
+
+def static_widths() -> CharWidths:
+    """Gets the widths based on the character classes."""
+    widths: dict[str, int] = {}
+
+    for chars, width in ((NARROW, UNITS // 2), (MEDIUM, 3 * UNITS // 4), (WIDE, 3 * UNITS // 2)):
+        widths.update(dict.fromkeys(chars, width))
+
+    return CharWidths(widths)
+
+
+def font_widths(path: StrPath) -> CharWidths:
+    """Gets the widths measured with the font.
+
+    The average width of the lowercase Latin letters is considered one symbol.
+
+    :param path: The path to the TrueType font file.
+    :type path: str or Path
+    :return: The character widths.
+    :rtype: CharWidths
+    """
+    from PIL.ImageFont import FreeTypeFont, truetype
+
+    font: FreeTypeFont = truetype(str(path), 100)
+    average: float = sum(font.getlength(char) for char in ascii_lowercase) / len(ascii_lowercase)
+    widths: dict[str, int] = {
+        char: max(1, round(font.getlength(char) * UNITS / average))
+        for char in CHARSET}
+
+    return CharWidths(widths)
+
+
+@cache
+def char_widths() -> CharWidths:
+    """Gets the character widths using the font from the configuration file if possible."""
+    font: str | None = config_file.get_commands("set-table-cols", "font")
+
+    if font:
+        path: Path = BASE_PATH.joinpath(font).expanduser()
+
+        try:
+            return font_widths(path)
+
+        except (ImportError, OSError) as e:
+            logger.warning(
+                f"Не удалось загрузить шрифт {path}, {e.__class__.__name__}: {e}\n"
+                f"Ширины символов оцениваются приблизительно")
+
+    return static_widths()
+
+
+def text_width(text: str) -> int:
+    """Gets the text width in symbols rounded up."""
+    return ceil(len(text.translate(char_widths())) / UNITS)